@@ -0,0 +1,85 @@
+"""
+Benchmark for JSON dump options.
+
+It compares size, writing and reading times of JSON dumps from the fixture
+manifests with the default indented output and with the compact, sorted and
+unescaped outputs.
+
+Usage: ::
+
+    python benchmarks/json_dump_options.py --number 2000
+"""
+import argparse
+import io
+import json
+import timeit
+from pathlib import Path
+
+from py_css_styleguide.model import Manifest
+
+
+FIXTURES = Path(__file__).parents[1] / "tests" / "data_fixtures"
+
+MANIFESTS = [
+    FIXTURES / "manifest_sample.css",
+    FIXTURES / "sass" / "css" / "sample_libsass.css",
+    FIXTURES / "sass" / "css" / "sample_names.css",
+    FIXTURES / "sass" / "css" / "sample_excludes.css",
+]
+
+OPTIONS = [
+    ("indent=4", {}),
+    ("compact", {"compact": True}),
+    ("compact + sort_keys", {"compact": True, "sort_keys": True}),
+    ("compact + no ascii", {"compact": True, "ensure_ascii": False}),
+]
+
+
+def best_time(func, number, rounds):
+    """
+    Return best time of a single call in microseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=rounds)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=2000, help="Number of calls for each round."
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Number of timing rounds."
+    )
+    args = parser.parse_args()
+
+    for path in MANIFESTS:
+        manifest = Manifest()
+        manifest.load_file(path)
+
+        print(path.relative_to(FIXTURES))
+        print("{:<22} {:>8} {:>8} {:>12} {:>12}".format(
+            "", "bytes", "ratio", "write (us)", "read (us)"
+        ))
+
+        reference = None
+        for label, options in OPTIONS:
+            content = manifest.to_json(**options)
+            size = len(content.encode("utf-8"))
+            reference = reference or size
+
+            write = best_time(
+                lambda: manifest.dump(io.StringIO(), **options),
+                args.number,
+                args.rounds,
+            )
+            read = best_time(lambda: json.loads(content), args.number, args.rounds)
+
+            print("{:<22} {:>8} {:>7.0%} {:>12.1f} {:>12.1f}".format(
+                label, size, size / reference, write, read
+            ))
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark for name validation from nomenclature.
+
+It compares the legacy implementation (a Python loop over each name character) with
+the current one, both without and with memoization, on a set of property names that
+repeats like design tokens do.
+
+Usage: ::
+
+    python benchmarks/nomenclature_validation.py --names 50 --repeat 2000
+"""
+import argparse
+import timeit
+
+from py_css_styleguide.nomenclature import (
+    PROPERTY_ALLOWED_CHARS,
+    PROPERTY_ALLOWED_START,
+    FORBIDDEN_PREFIXES,
+    is_reserved_property,
+    is_valid_property,
+)
+
+
+def legacy_is_valid_property(name):
+    """
+    Property name validation as it was implemented before precompiled validators.
+    """
+    if not name:
+        raise ValueError("Variable name is empty")
+
+    if is_reserved_property(name):
+        raise ValueError("Variable name is reserved")
+
+    if name.startswith(FORBIDDEN_PREFIXES):
+        raise ValueError("Variable name cannot starts with special characters")
+
+    if name[0] not in PROPERTY_ALLOWED_START:
+        raise ValueError("Variable name must starts with a letter")
+
+    for item in name:
+        if item not in PROPERTY_ALLOWED_CHARS:
+            raise ValueError("Invalid variable name")
+
+    return True
+
+
+def run(validator, names):
+    for name in names:
+        validator(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--names", type=int, default=50, help="Number of distinct property names."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=2000, help="How many times each name repeats."
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Number of timing rounds."
+    )
+    args = parser.parse_args()
+
+    distinct = ["font_color_variant_{}".format(i) for i in range(args.names)]
+    names = distinct * args.repeat
+
+    validators = [
+        ("legacy loop", legacy_is_valid_property),
+        ("charset", is_valid_property.__wrapped__),
+        ("charset + memoization", is_valid_property),
+    ]
+
+    print("Validating {} names ({} distinct)".format(len(names), len(distinct)))
+    for label, validator in validators:
+        best = min(
+            timeit.repeat(
+                lambda: run(validator, names), number=1, repeat=args.rounds
+            )
+        )
+        print("{:<24} {:>10.2f} ms".format(label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,28 @@
 """CSS driven styleguide for your project"""
-from importlib.metadata import version
 from pathlib import Path
 
 
 __pkgname__ = "py-css-styleguide"
-__version__ = version(__pkgname__)
 
 # Path location to the Sass mixin library file to use with a Dartsass compiler
 COMPILER_DARTSASS_HELPER = (
-    Path(__file__) / "scss" / "dartsass" / "_styleguide_helpers.scss"
+    Path(__file__).parent / "scss" / "dartsass" / "_styleguide_helpers.scss"
 )
 
 # Path location to the Sass mixin library file to use with a Libsass compiler
 COMPILER_LIBSASS_HELPER = (
-    Path(__file__) / "scss" / "libsass" / "_styleguide_helpers.scss"
+    Path(__file__).parent / "scss" / "libsass" / "_styleguide_helpers.scss"
 )
+
+
+def __getattr__(name):
+    """
+    Resolve package version only when it is required since ``importlib.metadata``
+    is costly to import and would slow down every script importing the package.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version(__pkgname__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
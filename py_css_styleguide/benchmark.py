@@ -0,0 +1,357 @@
+"""
+Benchmark
+=========
+
+Tools to generate synthetic manifests and measure the time and memory spent in
+every step of the manifest life cycle, so performance changes can be compared between
+releases.
+
+Each phase is measured separately:
+
+``parse``
+    ``TinycssSourceParser.parse()`` on manifest source;
+``serialize``
+    ``ManifestSerializer.serialize()`` on parsed datas;
+``to_json``
+    ``Manifest.to_json()`` on a loaded manifest;
+``from_dict``
+    ``Manifest.from_dict()`` on a manifest dump.
+
+Timings are measured without memory tracing, then peak memory is measured from an
+additional run of each phase with ``tracemalloc``.
+"""
+import copy
+import json
+import time
+import tracemalloc
+
+from collections import OrderedDict
+
+from .model import Manifest
+from .parser import TinycssSourceParser
+from .serializer import ManifestSerializer
+
+
+STRUCTURES = (
+    "flat",
+    "list",
+    "string",
+    "number",
+    "nested",
+    "object-list",
+    "object-complex",
+)
+"""
+Available structure kinds for synthetic references. ``object-list`` is a ``nested``
+structure with the ``object-list`` splitter.
+"""
+
+COMPILERS = ("libsass", "dartsass")
+"""
+Available compilers to mimic in synthetic manifests. They only differ on how a Sass
+list is written to a CSS string.
+"""
+
+PHASES = ("parse", "serialize", "to_json", "from_dict")
+"""
+Measured phases in their execution order.
+"""
+
+PERCENTILES = (50, 90, 99)
+"""
+Latency percentiles to report.
+"""
+
+
+def format_list(items, compiler):
+    """
+    Format a list of strings as a CSS string property value in the same way a Sass
+    compiler would output it from styleguide helpers.
+
+    Arguments:
+        items (list): List of strings.
+        compiler (string): Compiler name to mimic.
+
+    Returns:
+        string: CSS string with quotes.
+    """
+    if compiler == "dartsass":
+        return '"[{}]"'.format(", ".join(["'{}'".format(item) for item in items]))
+
+    return "'{}'".format(json.dumps(items))
+
+
+def build_reference(name, structure, length, compiler):
+    """
+    Build properties for a synthetic reference.
+
+    Arguments:
+        name (string): Reference name.
+        structure (string): Structure kind from ``STRUCTURES``.
+        length (int): Item count for list values or character count for single
+            values.
+        compiler (string): Compiler name to mimic.
+
+    Returns:
+        list: List of tuples ``(property name, CSS value)``.
+    """
+    keys = ["{}_{}".format(name, i) for i in range(length)]
+    values = ["#{:06x}".format(i) for i in range(length)]
+
+    if structure == "flat":
+        return [
+            ("structure", '"flat"'),
+            ("keys", '"{}"'.format(" ".join(keys))),
+            ("values", '"{}"'.format(" ".join(values))),
+        ]
+    elif structure == "list":
+        return [
+            ("structure", '"list"'),
+            ("items", '"{}"'.format(" ".join(keys))),
+        ]
+    elif structure == "string":
+        return [
+            ("structure", '"string"'),
+            ("value", '"{}"'.format("a" * length)),
+        ]
+    elif structure == "number":
+        return [
+            ("structure", '"number"'),
+            ("value", '"{}"'.format("9" * length)),
+        ]
+    elif structure == "nested":
+        return [
+            ("structure", '"nested"'),
+            ("keys", '"{}"'.format(" ".join(keys))),
+            ("color", '"{}"'.format(" ".join(values))),
+            ("selector", '"{}"'.format(" ".join(["." + key for key in keys]))),
+        ]
+    elif structure == "object-list":
+        return [
+            ("structure", '"nested"'),
+            ("splitter", '"object-list"'),
+            ("keys", format_list(keys, compiler)),
+            ("color", format_list(values, compiler)),
+            ("selector", format_list(["." + key for key in keys], compiler)),
+        ]
+    elif structure == "object-complex":
+        return [
+            ("structure", '"object-complex"'),
+            ("object", format_list(values, compiler)),
+        ]
+
+    raise ValueError("Unknown benchmark structure: {}".format(structure))
+
+
+def build_manifest(references=10, structures=None, length=10, compiler="libsass"):
+    """
+    Build the source of a synthetic CSS manifest.
+
+    Keyword Arguments:
+        references (int): Reference count. Default to ``10``.
+        structures (list): Structure kinds to use, references cycle over them.
+            Default to every kind from ``STRUCTURES``.
+        length (int): Item count for list values or character count for single
+            values. Default to ``10``.
+        compiler (string): Compiler name to mimic from ``COMPILERS``. Default to
+            ``libsass``.
+
+    Returns:
+        string: CSS manifest source.
+    """
+    structures = structures or STRUCTURES
+
+    if compiler not in COMPILERS:
+        raise ValueError("Unknown benchmark compiler: {}".format(compiler))
+
+    names = ["ref{}".format(i) for i in range(references)]
+
+    lines = [
+        ".styleguide-metas-compiler {",
+        '  --support: "{}";'.format(compiler),
+        "}",
+        "",
+        ".styleguide-metas-references {",
+        '  --names: "{}";'.format(" ".join(names)),
+        "}",
+        "",
+    ]
+
+    for i, name in enumerate(names):
+        structure = structures[i % len(structures)]
+
+        lines.append(".styleguide-reference-{} {{".format(name))
+        for prop, value in build_reference(name, structure, length, compiler):
+            lines.append("  --{}: {};".format(prop, value))
+        lines.append("}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def percentile(values, percent):
+    """
+    Get a percentile from values with the nearest rank method.
+
+    Arguments:
+        values (list): Sorted list of numbers.
+        percent (int): Percentile to get, from ``0`` to ``100``.
+
+    Returns:
+        float: Value at percentile.
+    """
+    rank = max(1, -(-len(values) * percent // 100))
+
+    return values[min(rank, len(values)) - 1]
+
+
+def get_timings_report(timings, references):
+    """
+    Build a report from phase timings.
+
+    Arguments:
+        timings (list): Duration of each run in seconds.
+        references (int): Reference count processed by each run.
+
+    Returns:
+        collections.OrderedDict: Report with durations in milliseconds and throughput
+        in runs and references per second.
+    """
+    timings = sorted(timings)
+    mean = sum(timings) / len(timings)
+
+    report = OrderedDict((
+        ("min", timings[0] * 1000),
+        ("mean", mean * 1000),
+        ("max", timings[-1] * 1000),
+    ))
+
+    for percent in PERCENTILES:
+        report["p{}".format(percent)] = percentile(timings, percent) * 1000
+
+    report["runs_per_second"] = 1 / mean if mean else None
+    report["references_per_second"] = references / mean if mean else None
+
+    return report
+
+
+def get_peak_memory(func, *args):
+    """
+    Get peak memory allocated while running a function.
+
+    Arguments:
+        func (callable): Function to run.
+        *args: Positional arguments to give to function.
+
+    Returns:
+        int: Peak allocated memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def get_phase_runners(source):
+    """
+    Get a runner for each phase.
+
+    Each phase is prepared from a full manifest load so it only runs its own step.
+    Serializer evaluation limit is raised to the source length so long values are
+    never truncated.
+
+    Arguments:
+        source (string): CSS manifest source.
+
+    Returns:
+        collections.OrderedDict: Tuples ``(function, setup)`` for each phase name.
+        ``setup`` is a function which returns the positional arguments for
+        ``function``, it is called out of measurements.
+    """
+    # No value can be longer than the source, so dartsass values are never
+    # truncated and compilers are compared on the same values
+    serializer_options = {"evaluation_limit": len(source)}
+
+    datas = TinycssSourceParser().parse(source)
+
+    manifest = Manifest()
+    manifest.load(source, serializer_options=serializer_options)
+    dump = json.loads(manifest.to_json())
+
+    return OrderedDict((
+        ("parse", (lambda s: TinycssSourceParser().parse(s), lambda: (source,))),
+        # Serializer alters given datas so it needs a fresh copy for each run
+        (
+            "serialize",
+            (
+                lambda d: ManifestSerializer(**serializer_options).serialize(d),
+                lambda: (copy.deepcopy(datas),),
+            ),
+        ),
+        ("to_json", (lambda m: m.to_json(), lambda: (manifest,))),
+        ("from_dict", (lambda d: Manifest().from_dict(d), lambda: (dump,))),
+    ))
+
+
+def run_benchmark(references=10, structures=None, length=10, compiler="libsass",
+                  iterations=20, warmup=2):
+    """
+    Run benchmark on a synthetic manifest.
+
+    Keyword Arguments:
+        references (int): Reference count. Default to ``10``.
+        structures (list): Structure kinds to use. Default to every kind from
+            ``STRUCTURES``.
+        length (int): Item count for list values or character count for single
+            values. Default to ``10``.
+        compiler (string): Compiler name to mimic. Default to ``libsass``.
+        iterations (int): Measured run count for each phase. Default to ``20``.
+        warmup (int): Unmeasured run count for each phase before measurements.
+            Default to ``2``.
+
+    Returns:
+        collections.OrderedDict: Benchmark report with used options, source size and
+        a report for each phase with timings, throughput and peak memory.
+    """
+    if iterations < 1:
+        raise ValueError("Benchmark iterations must be at least 1")
+
+    structures = list(structures or STRUCTURES)
+    source = build_manifest(
+        references=references,
+        structures=structures,
+        length=length,
+        compiler=compiler,
+    )
+
+    phases = OrderedDict()
+    for name, (func, setup) in get_phase_runners(source).items():
+        for i in range(warmup):
+            func(*setup())
+
+        timings = []
+        for i in range(iterations):
+            args = setup()
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+
+        phases[name] = get_timings_report(timings, references)
+        phases[name]["peak_memory"] = get_peak_memory(func, *setup())
+
+    return OrderedDict((
+        ("options", OrderedDict((
+            ("references", references),
+            ("structures", structures),
+            ("length", length),
+            ("compiler", compiler),
+            ("iterations", iterations),
+            ("warmup", warmup),
+        ))),
+        ("source_size", len(source.encode("utf-8"))),
+        ("phases", phases),
+    ))
@@ -0,0 +1,119 @@
+import json
+import logging
+from pathlib import Path
+
+import click
+
+# NOTE: Benchmark module depends on tinycss2 so it is imported inside function to
+# keep a fast CLI startup, structure choices are copied from
+# ``benchmark.STRUCTURES``
+BENCHMARK_STRUCTURES = (
+    "flat",
+    "list",
+    "string",
+    "number",
+    "nested",
+    "object-list",
+    "object-complex",
+)
+
+
+@click.command()
+@click.option(
+    "--references",
+    metavar="INTEGER",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Reference count in synthetic manifest.",
+)
+@click.option(
+    "--structure",
+    "structures",
+    type=click.Choice(BENCHMARK_STRUCTURES),
+    multiple=True,
+    help=(
+        "Structure kind to use for references, it can be given multiple times. "
+        "References cycle over given structures. Default to every structures."
+    ),
+)
+@click.option(
+    "--length",
+    metavar="INTEGER",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Item count for list values or character count for single values.",
+)
+@click.option(
+    "--compiler",
+    type=click.Choice(["libsass", "dartsass"]),
+    default="libsass",
+    show_default=True,
+    help="Sass compiler to mimic in synthetic manifest.",
+)
+@click.option(
+    "--iterations",
+    metavar="INTEGER",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Measured run count for each phase.",
+)
+@click.option(
+    "--warmup",
+    metavar="INTEGER",
+    type=click.IntRange(min=0),
+    default=2,
+    show_default=True,
+    help="Unmeasured run count for each phase before measurements.",
+)
+@click.option(
+    "--destination",
+    metavar="FILEPATH",
+    type=click.Path(writable=True, resolve_path=True, path_type=Path),
+    help=(
+        "Filepath destination where to write JSON report. If not given, the JSON "
+        "will be sent to the standard output."
+    ),
+)
+@click.pass_context
+def bench_command(context, references, structures, length, compiler, iterations,
+                  warmup, destination):
+    """
+    Benchmark manifest parsing, serialization and dump on a synthetic manifest.
+
+    \f
+
+    **Usage** ::
+
+        styleguide bench --references 100 --structure flat --structure list
+
+    Report is a JSON object with used options, synthetic source size and for each
+    phase (``parse``, ``serialize``, ``to_json`` and ``from_dict``) the timings in
+    milliseconds (min, mean, max and percentiles), throughput in runs and references
+    per second and peak memory in bytes.
+    """
+    from ..benchmark import run_benchmark
+
+    logger = logging.getLogger("py-css-styleguide")
+
+    logger.debug(
+        "Benchmarking %d reference(s) with %d iteration(s)", references, iterations
+    )
+
+    report = run_benchmark(
+        references=references,
+        structures=structures,
+        length=length,
+        compiler=compiler,
+        iterations=iterations,
+        warmup=warmup,
+    )
+
+    output = json.dumps(report, indent=4)
+
+    if destination:
+        destination.write_text(output)
+    else:
+        click.echo(output)
@@ -3,21 +3,30 @@ Main entrance to commandline actions
 """
 import click
 
-from py_css_styleguide.logger import init_logger
-
-from py_css_styleguide.cli.version import version_command
-from py_css_styleguide.cli.parse import parse_command
+from py_css_styleguide.cli.lazy_group import LazyGroup
 
 
 # Help alias on "-h" argument
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+# Commands are only imported when required to keep a fast startup
+LAZY_SUBCOMMANDS = {
+    "version": "py_css_styleguide.cli.version.version_command",
+    "bench": "py_css_styleguide.cli.bench.bench_command",
+    "parse": "py_css_styleguide.cli.parse.parse_command",
+    "serve": "py_css_styleguide.cli.serve.serve_command",
+}
+
 
 # Default logger conf
 APP_LOGGER_CONF = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", None)
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    context_settings=CONTEXT_SETTINGS,
+)
 @click.option(
     "-v", "--verbose",
     type=click.IntRange(min=0, max=5),
@@ -29,11 +38,22 @@ APP_LOGGER_CONF = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", None)
         "level). Default to '4' (Info level)."
     )
 )
+@click.option(
+    "--log-format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help=(
+        "Log output format, either 'text' for colored messages or 'json' for JSON "
+        "lines. Default to 'text'."
+    )
+)
 @click.pass_context
-def cli_frontend(ctx, verbose):
+def cli_frontend(ctx, verbose, log_format):
     """
     Sample tool for py-css-styleguide
     """
+    from py_css_styleguide.logger import init_logger
+
     printout = True
     if verbose == 0:
         verbose = 1
@@ -46,7 +66,8 @@ def cli_frontend(ctx, verbose):
     root_logger = init_logger(
         "py-css-styleguide",
         levels[verbose],
-        printout=printout
+        printout=printout,
+        log_format=log_format,
     )
 
     # Init the default context that will be passed to commands
@@ -54,8 +75,3 @@ def cli_frontend(ctx, verbose):
         "verbosity": verbose,
         "logger": root_logger,
     }
-
-
-# Attach commands methods to the main grouper
-cli_frontend.add_command(version_command, name="version")
-cli_frontend.add_command(parse_command, name="parse")
@@ -0,0 +1,49 @@
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A command group which only imports its commands when they are required.
+
+    Commands are declared with their import path so a command module (and its
+    dependencies) is not imported until the command is invoked or its help is
+    displayed.
+
+    Keyword Arguments:
+        lazy_subcommands (dict): Dictionnary of lazy commands where each key is the
+            command name and the value is the import path to the command object, like
+            ``package.module.command_function``.
+    """
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return super().list_commands(ctx) + sorted(self.lazy_subcommands.keys())
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self.load_lazy_command(cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def load_lazy_command(self, cmd_name):
+        """
+        Import a lazy command.
+
+        Arguments:
+            cmd_name (string): Command name to import.
+
+        Returns:
+            click.Command: The imported command object.
+        """
+        module_path, attribute_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_path), attribute_name)
+
+        if not isinstance(command, click.Command):
+            msg = "Lazy loading of '{}' failed, it is not a click command: {}"
+            raise ValueError(msg.format(cmd_name, self.lazy_subcommands[cmd_name]))
+
+        return command
@@ -1,17 +1,24 @@
 import logging
+import os
 from pathlib import Path
 
 import click
 
-from ..model import Manifest
-from ..exceptions import ParserErrors, SerializerError
+# NOTE: Modules which depend on tinycss2 are imported inside functions to keep a
+# fast CLI startup
+from ..exceptions import (
+    DaemonUnavailableError,
+    ParserErrors,
+    SerializerError,
+    StyleguideValidationError,
+)
 
 
 @click.command()
 @click.argument(
     "source",
     nargs=1,
-    type=click.Path(exists=True, path_type=Path),
+    type=click.Path(exists=True, allow_dash=True, path_type=Path),
 )
 @click.option(
     "--destination",
@@ -23,12 +30,85 @@ from ..exceptions import ParserErrors, SerializerError
         "serialized JSON will be outputed to standard output."
     ),
 )
+@click.option(
+    "--validate",
+    is_flag=True,
+    help=(
+        "Only validate the manifest and report every errors at once instead of "
+        "stopping on the first one. Nothing is dumped and the command exits with a "
+        "non zero code if there is any error."
+    ),
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    metavar="PATH",
+    envvar="PY_CSS_STYLEGUIDE_SOCKET",
+    help=(
+        "Unix socket path of a running daemon (see command 'serve') to use for "
+        "parsing. If daemon is not available, manifest is parsed locally. It can "
+        "also be given from environment variable 'PY_CSS_STYLEGUIDE_SOCKET'."
+    ),
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Output JSON manifest on a single line without any whitespace.",
+)
+@click.option(
+    "--sort-keys",
+    is_flag=True,
+    help="Sort keys of JSON manifest so the same manifest always gives the same JSON.",
+)
+@click.option(
+    "--ascii/--no-ascii",
+    "ensure_ascii",
+    default=True,
+    show_default=True,
+    help=(
+        "Escape non ASCII characters in JSON manifest. With '--no-ascii' they are "
+        "written as they are, encoded in UTF-8."
+    ),
+)
+@click.option(
+    "--indexed",
+    is_flag=True,
+    help=(
+        "Write an indexed dump instead of JSON, where each reference can be read "
+        "apart. It requires '--destination'."
+    ),
+)
+@click.option(
+    "--profile",
+    metavar="PATH",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=False, path_type=Path,
+    ),
+    help=(
+        "Run manifest loading under cProfile and write profile statistics to given "
+        "file path (commonly with extension '.pstats'). Daemon is never used when "
+        "profiling."
+    ),
+)
+@click.option(
+    "--profile-top",
+    metavar="INTEGER",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help=(
+        "Number of the most time consuming functions from parser and serializer to "
+        "log when profiling."
+    ),
+)
 @click.pass_context
-def parse_command(context, source, destination):
+def parse_command(context, source, destination, validate, socket_path, compact,
+                  sort_keys, ensure_ascii, indexed, profile, profile_top):
     """
     Parse a CSS manifest to validate it and possibly dump it to JSON.
 
-    'SOURCE' argument have to be an existing filepath to a CSS manifest.
+    'SOURCE' argument have to be an existing filepath to a CSS manifest or '-' to
+    read it from standard input.
 
     \f
 
@@ -36,29 +116,240 @@ def parse_command(context, source, destination):
 
         styleguide parse SOURCE --destination DESTINATION
 
+    Source can be read from standard input to use command in a pipe after the Sass
+    compiler ::
+
+        sass manifest.scss | styleguide parse - --compact > manifest.json
+
     Optional ``--destination`` is a file path destination where to write serialized
     JSON manifest. If not given serialized JSON will be outputed to standard output.
+
+    Optional ``--validate`` only validates the manifest and report all errors at
+    once.
+
+    Optional ``--socket`` is the Unix socket path of a running daemon to send the
+    parsing to. If daemon is not available, manifest is parsed locally. Daemon is
+    not used when source is read from standard input.
+
+    Optional ``--compact`` outputs JSON manifest on a single line without any
+    whitespace, ``--sort-keys`` sorts its keys and ``--no-ascii`` writes non ASCII
+    characters as they are instead of escaping them.
+
+    Optional ``--indexed`` writes an indexed dump (see ``py_css_styleguide.packed``)
+    to ``--destination`` instead of JSON. Its references can be decoded apart
+    without to read the whole dump.
+
+    Optional ``--profile`` is a file path where to write profile statistics of
+    manifest loading, they can be read with ``pstats`` or any compatible viewer.
+    The most time consuming functions from parser and serializer are logged, their
+    count is defined with ``--profile-top``.
     """
+    from ..model import Manifest
+
     logger = logging.getLogger("py-css-styleguide")
 
-    logger.debug("Parsing: {}".format(source.resolve()))
+    from_stdin = str(source) == "-"
+    json_options = {
+        "compact": compact,
+        "sort_keys": sort_keys,
+        "ensure_ascii": ensure_ascii,
+    }
+
+    if from_stdin:
+        logger.debug("Parsing: <stdin>")
+    else:
+        logger.debug("Parsing: %s", source.resolve())
+
+    if validate:
+        validate_manifest(read_source(source))
+        return
+
+    if indexed and not destination:
+        logger.critical("Option '--indexed' requires '--destination'")
+        raise click.Abort()
+
+    manifest = None
+    if socket_path and not profile and not from_stdin and not indexed:
+        manifest = get_daemon_manifest(source, socket_path)
+
+    if manifest is None:
+        manifest = Manifest()
+
+        try:
+            if profile:
+                profile_load(manifest, read_source(source), profile, profile_top)
+            else:
+                manifest.load(read_source(source))
+        except ParserErrors as e:
+            logger.critical(e)
+            for line in e.error_payload:
+                logger.error(line)
+
+            raise click.Abort()
+        except (SerializerError, StyleguideValidationError) as e:
+            logger.critical(e)
+
+            raise click.Abort()
+
+        if indexed:
+            from ..packed import dump_packed
+
+            dump_packed(manifest, destination)
+            return
+
+    # Write JSON chunk by chunk instead of building it whole
+    if destination:
+        with destination.open("w", encoding="utf-8") as fp:
+            manifest.dump(fp, **json_options)
+    else:
+        click.echo(manifest.to_json(**json_options))
+
+
+def read_source(source):
+    """
+    Read CSS manifest source.
+
+    Arguments:
+        source (pathlib.Path): Path to the CSS manifest, ``-`` means the standard
+            input.
+
+    Returns:
+        string: CSS manifest source.
+    """
+    with click.open_file(str(source), "r") as fp:
+        return fp.read()
+
+
+def profile_load(manifest, content, destination, top):
+    """
+    Load a manifest under cProfile, write profile statistics to a file and log the
+    most time consuming functions from parser and serializer.
+
+    Statistics are written and logged even if loading failed.
+
+    Arguments:
+        manifest (py_css_styleguide.model.Manifest): Manifest object to load.
+        content (string): CSS manifest source.
+        destination (pathlib.Path): File path where to write profile statistics.
+        top (int): Number of functions to log.
+    """
+    import cProfile
+    import pstats
+
+    from .. import parser, serializer
+
+    logger = logging.getLogger("py-css-styleguide")
+
+    profiler = cProfile.Profile()
+
+    try:
+        profiler.runcall(manifest.load, content)
+    finally:
+        profiler.dump_stats(str(destination))
+        logger.info("Profile statistics written to: %s", destination)
+
+        modules = {
+            os.path.abspath(parser.__file__): "parser",
+            os.path.abspath(serializer.__file__): "serializer",
+        }
+
+        # Function stats are tuples of primitive calls, total calls, own time
+        # and cumulative time, followed by callers
+        functions = [
+            (key, values)
+            for key, values in pstats.Stats(profiler).stats.items()
+            if os.path.abspath(key[0]) in modules
+        ]
+        functions.sort(key=lambda item: item[1][3], reverse=True)
+
+        for (filename, line, name), values in functions[:top]:
+            logger.info(
+                "%.6fs cumulative - %.6fs own - %d call(s) : %s.%s (line %d)",
+                values[3],
+                values[2],
+                values[1],
+                modules[os.path.abspath(filename)],
+                name,
+                line,
+            )
+
+
+def get_daemon_manifest(source, socket_path):
+    """
+    Request a daemon to parse a CSS manifest.
+
+    Arguments:
+        source (pathlib.Path): Path to the CSS manifest.
+        socket_path (string): Unix socket path of the daemon.
+
+    Raises:
+        click.Abort: If daemon responded with an error.
+
+    Returns:
+        py_css_styleguide.model.Manifest: Manifest loaded from daemon response or
+        ``None`` if daemon is not available.
+    """
+    from ..daemon import request_manifest
+    from ..model import Manifest
+
+    logger = logging.getLogger("py-css-styleguide")
+
+    try:
+        response = request_manifest(source, socket_path=socket_path)
+    except DaemonUnavailableError as e:
+        logger.debug("Daemon is not available, parsing locally: %s", e)
+        return None
+
+    if response["status"] != "success":
+        logger.critical(response["message"])
+        for line in response["errors"]:
+            logger.error(line)
+
+        raise click.Abort()
 
     manifest = Manifest()
+    manifest.from_dict(response["manifest"])
+
+    return manifest
+
+
+def validate_manifest(content):
+    """
+    Validate a CSS manifest and log every errors.
+
+    Arguments:
+        content (string): CSS manifest source to validate.
+
+    Raises:
+        click.Abort: If manifest has any error.
+    """
+    from ..parser import TinycssSourceParser
+    from ..serializer import ManifestSerializer
+
+    logger = logging.getLogger("py-css-styleguide")
+
+    parser = TinycssSourceParser()
 
     try:
-        manifest.load(source.read_text())
+        datas = parser.parse(content)
     except ParserErrors as e:
         logger.critical(e)
         for line in e.error_payload:
             logger.error(line)
 
         raise click.Abort()
-    except SerializerError as e:
-        logger.critical(e)
+
+    errors = ManifestSerializer().validate(datas, positions=parser.positions)
+
+    if errors:
+        logger.critical("Manifest is invalid due to %d error(s)", len(errors))
+        for error in errors:
+            message = "[{kind}] {message}".format(**error)
+            if error["line"] is not None:
+                message = "Line {line} - Column {column} : ".format(**error) + message
+
+            logger.error(message)
 
         raise click.Abort()
 
-    if destination:
-        destination.write_text(manifest.to_json())
-    else:
-        click.echo(manifest.to_json())
+    logger.info("Manifest is valid")
@@ -0,0 +1,72 @@
+import logging
+import os
+import signal
+
+import click
+
+from ..exceptions import DaemonUnavailableError
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    metavar="PATH",
+    envvar="PY_CSS_STYLEGUIDE_SOCKET",
+    help=(
+        "Unix socket path where to listen for parse requests. Default to "
+        "'py-css-styleguide.sock' in the user runtime directory from "
+        "'XDG_RUNTIME_DIR' or else in a directory only accessible to the current "
+        "user in the system temporary directory. It can also be given from "
+        "environment variable 'PY_CSS_STYLEGUIDE_SOCKET'."
+    ),
+)
+@click.pass_context
+def serve_command(context, socket_path):
+    """
+    Run a daemon to parse CSS manifests on requests from command 'parse'.
+
+    \f
+
+    **Usage** ::
+
+        styleguide serve --socket PATH
+
+    The daemon keeps a warm process and caches parsed manifests until their source
+    file changes. Use the same ``--socket`` value with command ``parse`` to send it
+    the parsing. Socket is only accessible to the current user.
+    """
+    from ..daemon import ManifestServer, get_default_socket_path, is_daemon_running
+
+    logger = logging.getLogger("py-css-styleguide")
+
+    if not socket_path:
+        try:
+            socket_path = get_default_socket_path()
+        except DaemonUnavailableError as e:
+            logger.critical(e)
+            raise click.Abort()
+
+    if os.path.exists(socket_path):
+        # Check for a running server before to remove a stale socket file
+        if is_daemon_running(socket_path=socket_path, timeout=1):
+            logger.critical("A daemon is already running on: %s", socket_path)
+            raise click.Abort()
+
+        os.remove(socket_path)
+
+    # Stop properly on termination signal so the socket file is removed
+    def terminate(signum, frame):
+        raise KeyboardInterrupt()
+
+    signal.signal(signal.SIGTERM, terminate)
+
+    server = ManifestServer(socket_path)
+    logger.info("Listening on: %s", socket_path)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping daemon")
+    finally:
+        server.server_close()
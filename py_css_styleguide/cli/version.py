@@ -1,7 +1,5 @@
 import click
 
-from py_css_styleguide import __version__
-
 
 @click.command()
 @click.pass_context
@@ -15,4 +13,6 @@ def version_command(context):
 
         styleguide version
     """
+    from py_css_styleguide import __version__
+
     click.echo("py-css-styleguide version {}".format(__version__))
@@ -0,0 +1,293 @@
+"""
+Compiler
+========
+
+Compile a Sass manifest in process with Libsass and load it into a manifest object
+without to write compiled CSS to a file.
+
+This requires the ``libsass`` package which is available with the ``sass`` extra
+requirements: ::
+
+    pip install py-css-styleguide[sass]
+
+Compiled CSS is cached for each manifest source until a file from its dependency
+graph (the source itself and every partials it imports, recursively) changes, so
+loading an unchanged manifest again does not need to compile it.
+
+.. Note::
+    Libsass does not support the Dartsass module system, you need to use the Libsass
+    mixin library (see ``py_css_styleguide.COMPILER_LIBSASS_HELPER``) in your
+    manifest.
+"""
+import hashlib
+import os
+import re
+
+from .exceptions import CompilerError
+from .model import Manifest
+
+try:
+    import sass
+except ImportError:
+    sass = None
+
+
+COMMENTS_REGEX = re.compile(r"/\*.*?\*/|(?:^|(?<=\s))//[^\n]*", re.DOTALL)
+"""
+Regex to match Sass comments
+"""
+
+IMPORT_RULE_REGEX = re.compile(r"@(?:import|use|forward)\s+([^;{]+)")
+"""
+Regex to match an import rule and capture its arguments
+"""
+
+IMPORT_PATH_REGEX = re.compile(r"""["']([^"']+)["']""")
+"""
+Regex to match every quoted paths from import rule arguments
+"""
+
+SASS_EXTENSIONS = (".scss", ".sass")
+"""
+File extensions for Sass sources.
+"""
+
+
+class ManifestCompiler(object):
+    """
+    Compile Sass manifest sources with Libsass and cache compiled CSS.
+
+    Keyword Arguments:
+        include_paths (list): Optional list of directory paths where to search for
+            imported sources, additionally to the directory of importer.
+        output_style (string): Libsass output style. Default to ``expanded``.
+
+    Attributes:
+        cache (dict): Compiled CSS for each manifest source path with the digest of
+            the dependency graph it has been compiled from.
+        files (dict): File digest and imported paths for each known source path
+            with the file signature (modification time and size) they have been
+            computed from. This avoids to read and hash again unchanged files.
+    """
+
+    def __init__(self, include_paths=None, output_style="expanded"):
+        self.include_paths = [str(path) for path in include_paths or []]
+        self.output_style = output_style
+
+        self.cache = {}
+        self.files = {}
+
+    def get_imports(self, content):
+        """
+        Find paths imported from a Sass source.
+
+        Builtin Sass modules, remote URLs and plain CSS imports are ignored.
+
+        Arguments:
+            content (string): Sass source.
+
+        Returns:
+            list: Imported paths as written in source.
+        """
+        content = COMMENTS_REGEX.sub("", content)
+
+        paths = []
+        for arguments in IMPORT_RULE_REGEX.findall(content):
+            for path in IMPORT_PATH_REGEX.findall(arguments):
+                if (
+                    path.startswith(("sass:", "http://", "https://", "//")) or
+                    path.endswith(".css")
+                ):
+                    continue
+
+                paths.append(path)
+
+        return paths
+
+    def resolve_import(self, path, basedir):
+        """
+        Resolve an imported path to an existing file.
+
+        Candidates are searched from importer directory then from include paths,
+        either as a partial (with leading ``_``), a plain file or a directory index.
+
+        Arguments:
+            path (string): Imported path as written in source.
+            basedir (string): Directory of the importer source.
+
+        Returns:
+            string: Absolute path to the resolved file or ``None`` if it does not
+            exist.
+        """
+        head, tail = os.path.split(path)
+
+        if tail.endswith(SASS_EXTENSIONS):
+            names = [tail, "_" + tail]
+            indexes = []
+        else:
+            names = [
+                prefix + tail + extension
+                for extension in SASS_EXTENSIONS
+                for prefix in ("_", "")
+            ]
+            indexes = [
+                os.path.join(tail, prefix + "index" + extension)
+                for extension in SASS_EXTENSIONS
+                for prefix in ("_", "")
+            ]
+
+        for directory in [basedir] + self.include_paths:
+            for name in names + indexes:
+                candidate = os.path.join(directory, head, name)
+                if os.path.isfile(candidate):
+                    return os.path.abspath(candidate)
+
+        return None
+
+    def get_file(self, path):
+        """
+        Get digest and resolved imports of a source file.
+
+        Results are cached until the file signature changes.
+
+        Arguments:
+            path (string): Absolute path to the source file.
+
+        Returns:
+            tuple: File content digest and list of resolved imported paths.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self.files.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(path, "rb") as fp:
+            content = fp.read()
+
+        basedir = os.path.dirname(path)
+        imports = [
+            resolved
+            for resolved in [
+                self.resolve_import(item, basedir)
+                for item in self.get_imports(content.decode("utf-8"))
+            ]
+            if resolved
+        ]
+
+        self.files[path] = (signature, (hashlib.sha256(content).hexdigest(), imports))
+
+        return self.files[path][1]
+
+    def get_dependencies(self, path):
+        """
+        Get every file from the dependency graph of a source.
+
+        Arguments:
+            path (string): Path to the source file.
+
+        Returns:
+            list: Absolute paths of source and every file it imports recursively, in
+            discovery order.
+        """
+        path = os.path.abspath(path)
+
+        dependencies = []
+        seen = set()
+        pending = [path]
+
+        while pending:
+            current = pending.pop(0)
+            if current in seen:
+                continue
+
+            seen.add(current)
+            dependencies.append(current)
+            pending.extend(self.get_file(current)[1])
+
+        return dependencies
+
+    def get_digest(self, path):
+        """
+        Get digest of the dependency graph of a source.
+
+        Arguments:
+            path (string): Path to the source file.
+
+        Returns:
+            string: Hexadecimal digest.
+        """
+        digest = hashlib.sha256()
+
+        for dependency in self.get_dependencies(path):
+            digest.update(dependency.encode("utf-8"))
+            digest.update(self.get_file(dependency)[0].encode("ascii"))
+
+        return digest.hexdigest()
+
+    def compile(self, path):
+        """
+        Compile a Sass manifest source to CSS.
+
+        Arguments:
+            path (string): Path to the Sass manifest source.
+
+        Raises:
+            CompilerError: If Libsass is not installed, if a source can not be read
+                or decoded or if compilation failed.
+
+        Returns:
+            string: Compiled CSS.
+        """
+        if sass is None:
+            raise CompilerError(
+                "Compiling Sass requires the 'libsass' package, you may install it "
+                "with the 'sass' extra requirements."
+            )
+
+        path = os.path.abspath(path)
+
+        try:
+            digest = self.get_digest(path)
+        except (OSError, UnicodeDecodeError) as e:
+            raise CompilerError("Unable to read Sass source: {}".format(e))
+
+        cached = self.cache.get(path)
+        if cached and cached[0] == digest:
+            return cached[1]
+
+        try:
+            css = sass.compile(
+                filename=path,
+                include_paths=self.include_paths,
+                output_style=self.output_style,
+            )
+        except sass.CompileError as e:
+            raise CompilerError(str(e))
+
+        self.cache[path] = (digest, css)
+
+        return css
+
+    def load(self, path, manifest=None, **kwargs):
+        """
+        Compile a Sass manifest source and load it into a manifest object.
+
+        Arguments:
+            path (string): Path to the Sass manifest source.
+
+        Keyword Arguments:
+            manifest (py_css_styleguide.model.Manifest): Manifest object to load.
+                Default to a new ``Manifest`` object.
+            **kwargs: Keyword arguments to give to ``Manifest.load()``.
+
+        Returns:
+            py_css_styleguide.model.Manifest: Loaded manifest object.
+        """
+        if manifest is None:
+            manifest = Manifest()
+
+        manifest.load(self.compile(path), filepath=str(path), **kwargs)
+
+        return manifest
@@ -0,0 +1,313 @@
+"""
+Daemon
+======
+
+A local server which keeps a warm process to parse CSS manifests on request, so
+frequent parsing does not pay for Python startup and imports each time.
+
+Server listens on a Unix socket. A client sends a single JSON line like
+``{"source": "/path/to/manifest.css"}`` and server responds with a single JSON line
+which is either ``{"status": "success", "manifest": {...}}`` with the manifest dump
+or ``{"status": "error", "message": "...", "errors": [...]}``.
+
+Responses are cached for each source until its file changes.
+
+.. Note::
+    This is only available on systems supporting Unix sockets.
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+
+from stat import S_ISDIR
+
+from .exceptions import (
+    DaemonUnavailableError,
+    ParserErrors,
+    SerializerError,
+    StyleguideValidationError,
+)
+from .model import Manifest
+from .splitview import json_default
+
+
+DEFAULT_SOCKET_NAME = "py-css-styleguide.sock"
+"""
+File name of the default Unix socket, see ``get_default_socket_path()``.
+"""
+
+
+logger = logging.getLogger("py-css-styleguide")
+
+
+def get_default_socket_path():
+    """
+    Get the default Unix socket path used by server and client.
+
+    Socket is created in the user runtime directory from ``XDG_RUNTIME_DIR`` if
+    any, else in a directory named after the user id in the system temporary
+    directory. This directory is created only accessible to the current user so
+    other local users can neither request the daemon nor bind the socket first.
+
+    Raises:
+        DaemonUnavailableError: If the directory in the system temporary directory
+            exists but is not a directory only accessible to the current user.
+
+    Returns:
+        string: Socket path.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, DEFAULT_SOCKET_NAME)
+
+    directory = os.path.join(
+        tempfile.gettempdir(), "py-css-styleguide-{}".format(os.getuid())
+    )
+
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    stat = os.lstat(directory)
+    if (
+        not S_ISDIR(stat.st_mode) or
+        stat.st_uid != os.getuid() or
+        stat.st_mode & 0o077
+    ):
+        raise DaemonUnavailableError(
+            "Socket directory must be a directory only accessible to current user: "
+            "{}".format(directory)
+        )
+
+    return os.path.join(directory, DEFAULT_SOCKET_NAME)
+
+
+class ManifestRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle a single parse request from a client.
+    """
+
+    def handle(self):
+        line = self.rfile.readline()
+
+        # Client only checked the server is running
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+            source = request["source"]
+        except (ValueError, TypeError, KeyError):
+            response = self.server.encode_response({
+                "status": "error",
+                "message": "Invalid request, it must be a JSON object with 'source'",
+                "errors": [],
+            })
+        else:
+            response = self.server.get_response(source)
+
+        self.wfile.write(response)
+
+
+class ManifestServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix socket server to parse CSS manifests.
+
+    Arguments:
+        socket_path (string): Path where to create the Unix socket.
+
+    Attributes:
+        cache (dict): Encoded responses for each source path with the file
+            signature they have been built from.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.cache = {}
+        self.cache_lock = threading.Lock()
+
+        super().__init__(socket_path, ManifestRequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+
+        # Only the current user can connect to the socket
+        os.chmod(self.server_address, 0o600)
+
+    def encode_response(self, payload):
+        """
+        Encode a response payload to a JSON line.
+
+        Arguments:
+            payload (dict): Response payload.
+
+        Returns:
+            bytes: Encoded JSON line.
+        """
+        content = json.dumps(payload, default=json_default)
+
+        return (content + "\n").encode("utf-8")
+
+    def parse(self, path):
+        """
+        Parse a CSS manifest and return response payload.
+
+        Arguments:
+            path (string): Path to the CSS manifest.
+
+        Returns:
+            dict: Response payload.
+        """
+        manifest = Manifest()
+
+        try:
+            with open(path, "r") as fp:
+                manifest.load(fp)
+        except (OSError, UnicodeDecodeError) as e:
+            return {
+                "status": "error",
+                "message": "Unable to read CSS manifest from: {}: {}".format(path, e),
+                "errors": [],
+            }
+        except ParserErrors as e:
+            return {"status": "error", "message": str(e), "errors": e.error_payload}
+        except (SerializerError, StyleguideValidationError) as e:
+            return {
+                "status": "error",
+                "message": str(e),
+                "errors": getattr(e, "error_payload", None) or [],
+            }
+
+        return {"status": "success", "manifest": manifest.to_dict()}
+
+    def get_response(self, source):
+        """
+        Get the encoded response for a source, either from cache or from a new parse
+        if source file has changed since it has been cached.
+
+        Arguments:
+            source (string): Path to the CSS manifest.
+
+        Returns:
+            bytes: Encoded JSON line.
+        """
+        path = os.path.abspath(source)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self.encode_response({
+                "status": "error",
+                "message": "Unable to find CSS manifest from: {}".format(source),
+                "errors": [],
+            })
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self.cache_lock:
+            cached = self.cache.get(path)
+
+        if cached and cached[0] == signature:
+            logger.debug("Serving cached manifest: %s", path)
+            return cached[1]
+
+        logger.debug("Parsing manifest: %s", path)
+        response = self.encode_response(self.parse(path))
+
+        with self.cache_lock:
+            self.cache[path] = (signature, response)
+
+        return response
+
+    def server_close(self):
+        super().server_close()
+
+        # Remove socket file so a next server can bind it
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def is_daemon_running(socket_path=None, timeout=None):
+    """
+    Check if a server is listening on a Unix socket.
+
+    It only connects to the socket without to send any request, so it never
+    triggers a parse.
+
+    Keyword Arguments:
+        socket_path (string): Path to the server Unix socket. Default to
+            ``get_default_socket_path()``.
+        timeout (float): Optional timeout in seconds for connection.
+
+    Returns:
+        bool: ``True`` if connection succeeded.
+    """
+    if socket_path is None:
+        try:
+            socket_path = get_default_socket_path()
+        except DaemonUnavailableError:
+            return False
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+
+    try:
+        client.connect(str(socket_path))
+    except OSError:
+        return False
+    finally:
+        client.close()
+
+    return True
+
+
+def request_manifest(source, socket_path=None, timeout=None):
+    """
+    Request a running server to parse a CSS manifest.
+
+    Arguments:
+        source (string): Path to the CSS manifest to parse.
+
+    Keyword Arguments:
+        socket_path (string): Path to the server Unix socket. Default to
+            ``get_default_socket_path()``.
+        timeout (float): Optional timeout in seconds for socket operations.
+
+    Raises:
+        DaemonUnavailableError: When there is no running server on socket.
+
+    Returns:
+        dict: Server response payload.
+    """
+    socket_path = socket_path or get_default_socket_path()
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+
+    try:
+        client.connect(str(socket_path))
+    except OSError as e:
+        client.close()
+        raise DaemonUnavailableError(
+            "Unable to connect to daemon from '{}': {}".format(socket_path, e)
+        )
+
+    with client, client.makefile("rwb") as stream:
+        request = json.dumps({"source": os.path.abspath(source)})
+        stream.write((request + "\n").encode("utf-8"))
+        stream.flush()
+
+        response = stream.readline()
+
+    if not response:
+        raise DaemonUnavailableError(
+            "Daemon from '{}' closed connection without response".format(socket_path)
+        )
+
+    return json.loads(response)
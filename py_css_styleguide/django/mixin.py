@@ -3,24 +3,90 @@ Mixin
 *****
 
 """
+import asyncio
+import copy
+import functools
 import json
 import logging
 import os
+import threading
+import weakref
 
 from django.contrib.staticfiles import finders
 
-from ..model import Manifest
+from ..exceptions import PackedManifestError
+from ..model import FrozenManifest, Manifest, locate_manifest
+from ..packed import is_packed_file, load_packed
 
 
 # Set the logger related to styleguide app
 logger = logging.getLogger("py-css-styleguide")
 
+# Pending asynchronous loads for each event loop, keyed from loading arguments
+_PENDING_LOADS = weakref.WeakKeyDictionary()
+
+
+class PendingLoad:
+    """
+    A CSS manifest load in progress from a thread that other threads can wait for.
+
+    Attributes:
+        done (threading.Event): Set once load has finished.
+        state (dict): Copy of loaded manifest attributes on success, only made if
+            there are waiting threads.
+        error (Exception): Raised exception on failure.
+        waiters (int): Number of threads waiting for this load.
+    """
+
+    __slots__ = ("done", "state", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.state = None
+        self.error = None
+        self.waiters = 0
+
+
+class PendingAsyncLoad:
+    """
+    A CSS manifest load in progress from an executor that other coroutines can
+    await.
+
+    Attributes:
+        future (asyncio.Future): Future of the load.
+        state (dict): Copy of loaded manifest attributes on success, only made if
+            there are waiting coroutines.
+        waiters (int): Number of coroutines waiting for this load, the one which
+            started it excluded.
+    """
+
+    __slots__ = ("future", "state", "waiters")
+
+    def __init__(self, future):
+        self.future = future
+        self.state = None
+        self.waiters = 0
+
+
+# Pending threaded loads keyed from CSS manifest path and dump options, the lock
+# is only held to get or register a pending load
+_PENDING_THREADED_LOADS = {}
+_PENDING_THREADED_LOADS_LOCK = threading.Lock()
+
 
 class StyleguideMixin:
     """
     A mixin to return a manifest object.
+
+    Attributes:
+        json_dump_options (dict): JSON encoding options to write JSON dump, like
+            ``{"compact": True, "sort_keys": True}``. See
+            ``py_css_styleguide.model.get_json_options()`` for available options.
+            Default to ``None`` for an indented JSON.
     """
 
+    json_dump_options = None
+
     def resolve_css_filepath(self, path):
         """
         Validate path or resolve static filepath if needed.
@@ -43,7 +109,46 @@ class StyleguideMixin:
                 return resolved
             return None
 
-    def get_css_manifest(self, manifest, path, json_filepath=None, save_dump=False):
+    def get_manifest_signature(self, css_filepath, json_filepath=None,
+                               development_mode=True):
+        """
+        Get a signature of the file a manifest would be loaded from.
+
+        In development mode this is the CSS manifest (or its manifest-only output) if
+        it exists, else this is the JSON dump. Signature changes when the file is
+        modified, created or removed so it can be used to invalidate a cached
+        manifest. A JSON dump written from a CSS manifest does not change signature.
+
+        Arguments:
+            css_filepath (string): Path to CSS manifest file.
+
+        Keyword Arguments:
+            json_filepath (string): Path to JSON manifest.
+            development_mode (boolean): If CSS manifest is used.
+
+        Returns:
+            tuple: File path, modification time and size. Modification time and
+            size are ``None`` if file does not exist.
+        """
+        path = None
+
+        if development_mode:
+            resolved_path = self.resolve_css_filepath(css_filepath)
+            if resolved_path:
+                path = locate_manifest(resolved_path)
+
+        if path is None and json_filepath:
+            path = str(json_filepath)
+
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return (path, None, None)
+
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def get_css_manifest(self, manifest, path, json_filepath=None, save_dump=False,
+                         only=None, exclude=None):
         """
         From given path, load CSS with manifest model and possibly save it if required.
 
@@ -53,13 +158,17 @@ class StyleguideMixin:
             path (string): Path to the CSS manifest. If this is a relative path, it is
                 assumed it is a file inside static directory to resolve by Django
                 static finder. Give a full absolute path if your file is out of the
-                enabled static directories.
+                enabled static directories. If a dedicated manifest-only output
+                exists for this path (see ``model.locate_manifest``), it is loaded
+                instead.
 
         Keyword Arguments:
             json_filepath (string): Absolute filepath for JSON dump destination. If
                 empty, no dump will be created.
             save_dump (boolean): To enable manifest JSON dump write. This can only works
                 if CSS manifest has been correctly loaded.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
 
         Returns:
             py_css_styleguide.model.Manifest: The manifest object with loaded
@@ -72,31 +181,110 @@ class StyleguideMixin:
         resolved_path = self.resolve_css_filepath(path)
 
         if resolved_path:
-            # Open and parse CSS
-            with open(resolved_path, "r") as fp:
-                manifest.load(fp)
-
-            # Save JSON manifest dump if required
-            if save_dump and json_filepath:
-                with open(json_filepath, "w") as fp:
-                    fp.write(manifest.to_json())
+            self.load_css_manifest(
+                manifest, resolved_path, json_filepath=json_filepath,
+                save_dump=save_dump, only=only, exclude=exclude,
+            )
         else:
             # Log CSS load fail details
             manifest.status = "failed"
-            msg = "Unable to find CSS manifest from: {}"
-            logger.warning(msg.format(path))
-            manifest.loading_error = msg.format(path)
+            logger.warning("Unable to find CSS manifest from: %s", path)
+            manifest.loading_error = "Unable to find CSS manifest from: {}".format(path)
 
         return manifest
 
-    def get_json_manifest(self, manifest, path):
+    def load_css_manifest(self, manifest, path, json_filepath=None, save_dump=False,
+                          only=None, exclude=None):
+        """
+        Load an existing CSS manifest and possibly save its JSON dump.
+
+        When many threads load the same manifest at the same time, only the first
+        one parses it (and writes the dump), the other ones wait for its result and
+        get a deep copy of it into their manifest object, or raise the same error.
+
+        Arguments:
+            manifest (py_css_styleguide.model.Manifest): Manifest model object to
+                load.
+            path (string): Resolved path to the CSS manifest.
+
+        Keyword Arguments:
+            json_filepath (string): Absolute filepath for JSON dump destination.
+            save_dump (boolean): To enable manifest JSON dump write.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
+        """
+        dump_options = self.json_dump_options or {}
+
+        key = (
+            path,
+            str(json_filepath) if json_filepath else None,
+            bool(save_dump),
+            tuple(only or []),
+            tuple(exclude or []),
+            tuple(sorted(dump_options.items())),
+        )
+
+        with _PENDING_THREADED_LOADS_LOCK:
+            pending = _PENDING_THREADED_LOADS.get(key)
+            leader = pending is None
+            if leader:
+                pending = _PENDING_THREADED_LOADS[key] = PendingLoad()
+            else:
+                pending.waiters += 1
+
+        if not leader:
+            pending.done.wait()
+
+            if pending.error is not None:
+                raise pending.error
+
+            # Each thread gets its own objects so a request can not alter another
+            manifest.__dict__.update(copy.deepcopy(pending.state))
+            return
+
+        try:
+            # Open and parse CSS, possibly from its manifest-only output
+            manifest.load_file(path, only=only, exclude=exclude)
+
+            # Save JSON manifest dump if required, a subset would overwrite the dump
+            # other loads may read
+            if save_dump and json_filepath and not (only or exclude):
+                with open(json_filepath, "w", encoding="utf-8") as fp:
+                    manifest.dump(fp, **dump_options)
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with _PENDING_THREADED_LOADS_LOCK:
+                del _PENDING_THREADED_LOADS[key]
+                waiters = pending.waiters
+
+            try:
+                # Copy attributes before leader thread can alter its manifest
+                if waiters and pending.error is None:
+                    pending.state = copy.deepcopy(manifest.__dict__)
+            except Exception as e:
+                pending.error = e
+            finally:
+                pending.done.set()
+
+    def get_json_manifest(self, manifest, path, only=None, exclude=None):
         """
         From given path, load JSON manifest dump.
 
+        Dump may also be an indexed dump (see ``py_css_styleguide.packed``), it is
+        detected from its leading bytes. Then a read only
+        ``py_css_styleguide.packed.PackedManifest`` is returned instead of given
+        manifest object, its references are only decoded when they are reached.
+
         Arguments:
             manifest (py_css_styleguide.model.Manifest): Manifest model object to use
                 to parse CSS manifest.
-            path (string): Path to the CSS manifest.
+            path (string): Path to the JSON manifest.
+
+        Keyword Arguments:
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
 
         Returns:
             py_css_styleguide.model.Manifest: The manifest object with loaded
@@ -106,30 +294,45 @@ class StyleguideMixin:
         manifest.status = "dump"
 
         try:
-            with open(path, "r") as fp:
+            if is_packed_file(path):
+                return load_packed(
+                    path, only=only, exclude=exclude, attributes={
+                        "status": manifest.status,
+                        "loading_error": manifest.loading_error,
+                    },
+                )
+
+            with open(path, "r", encoding="utf-8") as fp:
                 content = json.load(fp)
         except FileNotFoundError:
             # Log details
-            msg = "Unable to find JSON manifest from: {}"
-            logger.warning(msg.format(path))
-            manifest.loading_error = msg.format(path)
+            logger.warning("Unable to find JSON manifest from: %s", path)
+            manifest.loading_error = "Unable to find JSON manifest from: {}".format(
+                path
+            )
 
             manifest.status = "failed"
         except json.decoder.JSONDecodeError as e:
             # Log details
-            msg = "Invalid JSON manifest: {}"
-            logger.warning(msg.format(str(e)))
-            manifest.loading_error = msg.format(str(e))
+            logger.warning("Invalid JSON manifest: %s", e)
+            manifest.loading_error = "Invalid JSON manifest: {}".format(e)
+
+            manifest.status = "failed"
+        except PackedManifestError as e:
+            # Log details
+            logger.warning("Invalid indexed manifest: %s", e)
+            manifest.loading_error = "Invalid indexed manifest: {}".format(e)
 
             manifest.status = "failed"
         else:
             # Load dump from manifest model object "from dict"
-            manifest.from_dict(content)
+            manifest.from_dict(content, only=only, exclude=exclude)
 
         return manifest
 
     def get_manifest(
-        self, css_filepath, json_filepath=None, save_dump=True, development_mode=True
+        self, css_filepath, json_filepath=None, save_dump=True, development_mode=True,
+        only=None, exclude=None,
     ):
         """
         Get and load manifest, either from CSS or JSON file depending options.
@@ -145,6 +348,11 @@ class StyleguideMixin:
                 been given.
             development_mode (boolean): In development mode, CSS manifest is readed if
                 it exists then a JSON dump may be written depending ``save_dump``.
+            only (list): If not empty, only these references are loaded, content of
+                other references is not parsed nor serialized. JSON dump is never
+                written from such a manifest since it would miss other references.
+            exclude (list): References to not load. Like with ``only``, JSON dump is
+                never written when it is given.
 
         Returns:
             py_css_styleguide.model.Manifest: Manifest object.
@@ -158,10 +366,235 @@ class StyleguideMixin:
 
         if development_mode:
             manifest = self.get_css_manifest(
-                manifest, css_filepath, json_filepath=json_filepath, save_dump=save_dump
+                manifest, css_filepath, json_filepath=json_filepath,
+                save_dump=save_dump, only=only, exclude=exclude,
             )
 
         if manifest.status in ["empty", "failed"] and json_filepath:
-            manifest = self.get_json_manifest(manifest, json_filepath)
+            manifest = self.get_json_manifest(
+                manifest, json_filepath, only=only, exclude=exclude
+            )
+
+        return manifest
+
+    def get_manifest_key(self, css_filepath, json_filepath=None, save_dump=True,
+                         development_mode=True, only=None, exclude=None):
+        """
+        Get the default key to register a manifest from its loading arguments.
+
+        Arguments:
+            css_filepath (string): Path to CSS manifest file.
+
+        Keyword Arguments:
+            json_filepath (string): Path to JSON manifest.
+            save_dump (boolean): To enable manifest JSON dump write.
+            development_mode (boolean): If CSS manifest is used.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
+
+        Returns:
+            tuple: Manifest key.
+        """
+        return (
+            str(css_filepath),
+            str(json_filepath) if json_filepath else None,
+            save_dump,
+            development_mode,
+            tuple(only or []),
+            tuple(exclude or []),
+        )
+
+    def get_registered_manifest(
+        self, registry, css_filepath, key=None, json_filepath=None, save_dump=True,
+        development_mode=True, only=None, exclude=None,
+    ):
+        """
+        Get manifest from a registry or load it if it is not registered or if its
+        file has changed since it has been registered.
+
+        Loaded manifest is frozen before to be registered.
+
+        Arguments:
+            registry (py_css_styleguide.registry.ManifestRegistry): Registry where
+                to find or register manifest.
+            css_filepath (string): Path to CSS manifest file. See ``get_manifest``
+                for details.
+
+        Keyword Arguments:
+            key (object): Key to register manifest, like a styleguide name. Default
+                to ``None`` for a key from ``get_manifest_key``.
+            json_filepath (string): Path to JSON manifest (to read or write).
+            save_dump (boolean): To enable manifest JSON dump write.
+            development_mode (boolean): To read CSS manifest instead of JSON dump.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
+
+        Returns:
+            py_css_styleguide.model.FrozenManifest: Frozen manifest object.
+        """
+        if key is None:
+            key = self.get_manifest_key(
+                css_filepath, json_filepath=json_filepath, save_dump=save_dump,
+                development_mode=development_mode, only=only, exclude=exclude,
+            )
+
+        signature = self.get_manifest_signature(
+            css_filepath, json_filepath=json_filepath,
+            development_mode=development_mode,
+        )
+
+        manifest = registry.get(key, signature=signature)
+        if manifest is None:
+            manifest = self.get_manifest(
+                css_filepath, json_filepath=json_filepath, save_dump=save_dump,
+                development_mode=development_mode, only=only, exclude=exclude,
+            ).freeze()
+            registry.set(key, manifest, signature=signature)
+
+        return manifest
+
+    async def aget_manifest(
+        self, css_filepath, json_filepath=None, save_dump=True, development_mode=True,
+        only=None, exclude=None, executor=None,
+    ):
+        """
+        Asynchronous version of ``get_manifest``.
+
+        File reading, parsing and possible dump writing are done in an executor so
+        they do not block the event loop. Concurrent calls with the same arguments
+        on the same event loop share a single load, each of them gets its own deep
+        copy of the manifest. A read only manifest from an indexed dump is shared
+        as it is.
+
+        Arguments:
+            css_filepath (string): Path to CSS manifest file. See ``get_manifest``
+                for details.
+
+        Keyword Arguments:
+            json_filepath (string): Path to JSON manifest (to read or write).
+            save_dump (boolean): To enable manifest JSON dump write.
+            development_mode (boolean): To read CSS manifest instead of JSON dump.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
+            executor (concurrent.futures.Executor): Executor where to run loading.
+                Default to ``None`` to use the event loop default executor.
+
+        Returns:
+            py_css_styleguide.model.Manifest: Manifest object.
+        """
+        loop = asyncio.get_running_loop()
+        pending = _PENDING_LOADS.setdefault(loop, {})
+
+        key = self.get_manifest_key(
+            css_filepath, json_filepath=json_filepath, save_dump=save_dump,
+            development_mode=development_mode, only=only, exclude=exclude,
+        )
+
+        entry = pending.get(key)
+        leader = entry is None
+        if leader:
+            future = loop.run_in_executor(
+                executor,
+                functools.partial(
+                    self.get_manifest,
+                    css_filepath,
+                    json_filepath=json_filepath,
+                    save_dump=save_dump,
+                    development_mode=development_mode,
+                    only=only,
+                    exclude=exclude,
+                ),
+            )
+            entry = pending[key] = PendingAsyncLoad(future)
+
+            def release(done):
+                if pending.get(key) is entry:
+                    del pending[key]
+
+                # Copy attributes before the first caller can alter its manifest,
+                # this callback runs before any caller is resumed
+                if (
+                    entry.waiters and
+                    not done.cancelled() and
+                    done.exception() is None and
+                    not isinstance(done.result(), FrozenManifest)
+                ):
+                    entry.state = copy.deepcopy(done.result().__dict__)
+
+            future.add_done_callback(release)
+        else:
+            entry.waiters += 1
+
+        # A cancelled caller must not cancel the load shared with other callers
+        manifest = await asyncio.shield(entry.future)
+
+        # Each caller gets its own objects so a request can not alter another,
+        # frozen manifests from indexed dumps are read only and can be shared
+        if leader or entry.state is None:
+            return manifest
+
+        duplicate = Manifest()
+        duplicate.__dict__.update(copy.deepcopy(entry.state))
+
+        return duplicate
+
+    async def aget_registered_manifest(
+        self, registry, css_filepath, key=None, json_filepath=None, save_dump=True,
+        development_mode=True, only=None, exclude=None, executor=None,
+    ):
+        """
+        Asynchronous version of ``get_registered_manifest``.
+
+        Concurrent calls for a manifest not registered yet share a single load and
+        get the same frozen manifest.
+
+        Arguments:
+            registry (py_css_styleguide.registry.ManifestRegistry): Registry where
+                to find or register manifest.
+            css_filepath (string): Path to CSS manifest file. See ``get_manifest``
+                for details.
+
+        Keyword Arguments:
+            key (object): Key to register manifest. Default to ``None`` for a key
+                from ``get_manifest_key``.
+            json_filepath (string): Path to JSON manifest (to read or write).
+            save_dump (boolean): To enable manifest JSON dump write.
+            development_mode (boolean): To read CSS manifest instead of JSON dump.
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
+            executor (concurrent.futures.Executor): Executor where to run loading.
+
+        Returns:
+            py_css_styleguide.model.FrozenManifest: Frozen manifest object.
+        """
+        if key is None:
+            key = self.get_manifest_key(
+                css_filepath, json_filepath=json_filepath, save_dump=save_dump,
+                development_mode=development_mode, only=only, exclude=exclude,
+            )
+
+        signature = self.get_manifest_signature(
+            css_filepath, json_filepath=json_filepath,
+            development_mode=development_mode,
+        )
+
+        manifest = registry.get(key, signature=signature)
+        if manifest is not None:
+            return manifest
+
+        manifest = await self.aget_manifest(
+            css_filepath, json_filepath=json_filepath, save_dump=save_dump,
+            development_mode=development_mode, only=only, exclude=exclude,
+            executor=executor,
+        )
+
+        # Concurrent calls share the same load, only the first one to finish
+        # registers it
+        registered = registry.get(key, signature=signature)
+        if registered is not None:
+            return registered
+
+        manifest = manifest.freeze()
+        registry.set(key, manifest, signature=signature)
 
         return manifest
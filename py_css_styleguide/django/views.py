@@ -3,18 +3,36 @@ View
 ****
 
 """
-from django.views.generic import TemplateView
+import django
 
+from django.core.exceptions import ImproperlyConfigured
+from django.views.generic import TemplateView, View
+from django.views.generic.base import ContextMixin, TemplateResponseMixin
+
+from ..registry import ManifestRegistry
 from .mixin import StyleguideMixin
 
 
-class StyleguideViewMixin(StyleguideMixin, TemplateView):
+MANIFEST_REGISTRY = ManifestRegistry()
+"""
+Default registry for views with manifest cache enabled and without their own
+registry. It has no limits.
+"""
+
+
+class BaseStyleguideViewMixin(StyleguideMixin):
     """
-    Display styleguide from a manifest.
+    Manifest options and registry shared by synchronous and asynchronous styleguide
+    views.
 
-    Note than template from ``template_name`` is not shipped in this application. This
-    is just a recommended template path you may use or not, it is at your
-    responsability.
+    With ``cache_manifest`` enabled, loaded manifest is frozen and kept in
+    ``manifest_registry`` (or ``MANIFEST_REGISTRY`` if empty) under
+    ``manifest_key`` until its file changes. Give your own registry with limits
+    when you serve many styleguides.
+
+    When a page only needs a few references, set them in ``manifest_only`` (or
+    the ones it does not need in ``manifest_exclude``) so other references are
+    not loaded. JSON dump is not written from such a subset.
     """
 
     template_name = "styleguide/index.html"
@@ -22,6 +40,51 @@ class StyleguideViewMixin(StyleguideMixin, TemplateView):
     manifest_json_filepath = None
     save_dump = True
     development_mode = True
+    cache_manifest = False
+    manifest_registry = None
+    manifest_key = None
+    manifest_only = None
+    manifest_exclude = None
+
+    def get_manifest_registry(self):
+        """
+        Get registry where to keep manifest.
+
+        Returns:
+            py_css_styleguide.registry.ManifestRegistry: Registry from
+            ``manifest_registry`` or the default one.
+        """
+        if self.manifest_registry is None:
+            return MANIFEST_REGISTRY
+
+        return self.manifest_registry
+
+    def get_manifest_options(self):
+        """
+        Get manifest loading options from view attributes.
+
+        Returns:
+            dict: Keyword arguments for ``get_manifest()`` and its variants.
+        """
+        return {
+            "json_filepath": self.manifest_json_filepath,
+            "save_dump": self.save_dump,
+            "development_mode": self.development_mode,
+            "only": self.manifest_only,
+            "exclude": self.manifest_exclude,
+        }
+
+
+class StyleguideViewMixin(BaseStyleguideViewMixin, TemplateView):
+    """
+    Display styleguide from a manifest.
+
+    Note than template from ``template_name`` is not shipped in this application. This
+    is just a recommended template path you may use or not, it is at your
+    responsability.
+
+    See ``BaseStyleguideViewMixin`` about manifest options and cache.
+    """
 
     def get_context_data(self, **kwargs):
         """
@@ -29,15 +92,81 @@ class StyleguideViewMixin(StyleguideMixin, TemplateView):
         """
         context = super().get_context_data(**kwargs)
 
-        context.update(
-            {
-                "styleguide": self.get_manifest(
-                    self.manifest_css_filepath,
-                    json_filepath=self.manifest_json_filepath,
-                    save_dump=self.save_dump,
-                    development_mode=self.development_mode,
-                )
-            }
-        )
+        options = self.get_manifest_options()
+
+        if self.cache_manifest:
+            manifest = self.get_registered_manifest(
+                self.get_manifest_registry(),
+                self.manifest_css_filepath,
+                key=self.manifest_key,
+                **options
+            )
+        else:
+            manifest = self.get_manifest(self.manifest_css_filepath, **options)
+
+        context.update({"styleguide": manifest})
 
         return context
+
+
+class StyleguideAsyncViewMixin(
+    BaseStyleguideViewMixin, TemplateResponseMixin, ContextMixin, View
+):
+    """
+    Asynchronous version of ``StyleguideViewMixin`` to display styleguide from a
+    manifest.
+
+    Under ASGI, requests are served from the event loop without a thread for each
+    of them, manifest loading is done in an executor only when required:
+
+    * Loaded manifests are kept in a registry until the file they have been loaded
+      from changes, see ``BaseStyleguideViewMixin`` about registry options;
+    * Concurrent requests for a manifest not loaded yet share a single load;
+    * Cached manifests are frozen (see ``model.FrozenManifest``) since they are
+      shared between requests, lists from references are tuples.
+
+    .. Note::
+        Asynchronous views require Django>=4.1, ``as_view()`` raises
+        ``ImproperlyConfigured`` with older versions.
+    """
+
+    cache_manifest = True
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        if django.VERSION < (4, 1):
+            raise ImproperlyConfigured(
+                "Asynchronous styleguide views require Django>=4.1"
+            )
+
+        return super().as_view(**initkwargs)
+
+    async def aget_cached_manifest(self):
+        """
+        Get manifest from registry or load it if file has changed since it has been
+        registered.
+
+        Returns:
+            py_css_styleguide.model.FrozenManifest: Frozen manifest object if cache
+            is enabled, else a ``Manifest`` object.
+        """
+        options = self.get_manifest_options()
+
+        if not self.cache_manifest:
+            return await self.aget_manifest(self.manifest_css_filepath, **options)
+
+        return await self.aget_registered_manifest(
+            self.get_manifest_registry(),
+            self.manifest_css_filepath,
+            key=self.manifest_key,
+            **options
+        )
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Render template with styleguide in context.
+        """
+        context = self.get_context_data(**kwargs)
+        context["styleguide"] = await self.aget_cached_manifest()
+
+        return self.render_to_response(context)
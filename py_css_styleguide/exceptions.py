@@ -36,9 +36,33 @@ class ParserErrors(PyCssStyleguideException):
 class SerializerError(PyCssStyleguideException):
     """
     Exception to raise when there is a syntax issue during serialization.
+
+    Attribute ``prop`` contains the name of the property involved in error if any.
+
+    Keyword Arguments:
+        prop (string): Name of the reference property involved in error. Default to
+            ``None`` for errors not related to a specific property.
     """
+    def __init__(self, *args, **kwargs):
+        self.prop = kwargs.pop("prop", None)
+        super().__init__(*args, **kwargs)
 
-    pass
+
+class SerializerErrors(SerializerError):
+    """
+    Exception to raise when there is one or many errors collected during a
+    serialization that did not stop at the first error.
+
+    Attribute ``error_payload`` contains a list of error messages.
+
+    Keyword Arguments:
+        error_payload (list): A list of error messages, one for each failed
+            reference. It won't output as exception message from traceback, you need
+            to exploit it yourself if needed.
+    """
+    def __init__(self, *args, **kwargs):
+        self.error_payload = kwargs.pop("error_payload", None)
+        super().__init__(*args, **kwargs)
 
 
 class StyleguideValidationError(PyCssStyleguideException):
@@ -49,6 +73,30 @@ class StyleguideValidationError(PyCssStyleguideException):
     pass
 
 
+class DaemonUnavailableError(PyCssStyleguideException):
+    """
+    Exception to raise when a daemon server can not be reached.
+    """
+
+    pass
+
+
+class CompilerError(PyCssStyleguideException):
+    """
+    Exception to raise when a Sass manifest can not be compiled.
+    """
+
+    pass
+
+
+class PackedManifestError(PyCssStyleguideException):
+    """
+    Exception to raise when a packed manifest buffer is invalid.
+    """
+
+    pass
+
+
 class StyleguideDeprecationWarning(DeprecationWarning):
     """
     A deprecation warning explicitely named after application to distinct it from
@@ -0,0 +1,89 @@
+"""
+Frozen structures
+=================
+
+Read only structures to share manifest datas between threads (or processes)
+without to copy them.
+
+Dictionnaries are frozen to ``FrozenDict`` and lists to tuples, recursively. A
+``FrozenDict`` is still a ``dict`` so templates, comparisons and the ``json``
+module use it like the original dictionnary, only its mutation methods are
+disabled.
+
+Split views from ``splitview`` are already read only and are kept as they are.
+"""
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+
+class FrozenDict(dict):
+    """
+    Read only dictionnary.
+
+    Every method which would mutate dictionnary raises a ``TypeError``. Since it
+    can not change, a copy of a frozen dictionnary is the dictionnary itself.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "'{}' object does not support mutation".format(type(self).__name__)
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, dict.__repr__(self))
+
+    def __reduce__(self):
+        # Default dict pickling would fill the new object with item assignments
+        return (type(self), (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(value):
+    """
+    Recursively freeze a value.
+
+    Arguments:
+        value (object): Value to freeze.
+
+    Returns:
+        object: A ``FrozenDict`` for a dictionnary, a tuple for a list or a tuple,
+        else the value unchanged.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    elif isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+def thaw(value):
+    """
+    Recursively thaw a frozen value to mutable structures.
+
+    Arguments:
+        value (object): Value to thaw.
+
+    Returns:
+        object: A ``collections.OrderedDict`` for a mapping (like a dictionnary or
+        a ``splitview.SplitMapping``), a list for a sequence (like a tuple or a
+        ``splitview.SplitView``) which is not a string, else the value unchanged.
+    """
+    if isinstance(value, Mapping):
+        return OrderedDict((k, thaw(v)) for k, v in value.items())
+    elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return [thaw(item) for item in value]
+
+    return value
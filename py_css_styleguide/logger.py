@@ -1,18 +1,59 @@
+import datetime
+import json
 import logging
 
-import colorlog
 
+HANDLER_NAME = "py-css-styleguide"
+"""
+Name given to the handler added by ``init_logger`` so it can be found again.
+"""
 
-def init_logger(name, level, printout=True):
+LOG_FORMATS = ("text", "json")
+"""
+Available log output formats.
+"""
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format log records as JSON objects, one for each line.
+
+    Each object has items ``time`` (ISO 8601 local time with milliseconds),
+    ``level``, ``logger`` and ``message``. Item ``exception`` is added when record
+    has exception informations.
+    """
+
+    def format(self, record):
+        payload = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload)
+
+
+def init_logger(name, level, printout=True, log_format="text"):
     """
     Initialize app logger to configure its level/handler/formatter/etc..
 
+    This can be called many times, the handler added from a previous call is
+    replaced so log records are never written twice.
+
     Arguments:
         name (str): Logger name used to instanciate and retrieve it.
         level (str): Level name (``debug``, ``info``, etc..) to enable.
 
     Keyword Arguments:
         printout (bool): If False, logs will never be outputed.
+        log_format (str): Output format, either ``text`` for colored messages or
+            ``json`` for JSON lines. Default to ``text``.
 
     Returns:
         logging.Logger: Application logger.
@@ -20,13 +61,25 @@ def init_logger(name, level, printout=True):
     root_logger = logging.getLogger(name)
     root_logger.setLevel(level)
 
+    # Remove handler from a previous initialization
+    for handler in list(root_logger.handlers):
+        if handler.get_name() == HANDLER_NAME:
+            root_logger.removeHandler(handler)
+
     # Redirect outputs to the void space, mostly for usage within unittests
     if not printout:
         from io import StringIO
         dummystream = StringIO()
         handler = logging.StreamHandler(dummystream)
+    # Standard output with JSON lines
+    elif log_format == "json":
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonLinesFormatter())
     # Standard output with colored messages
     else:
+        # Imported here since it is only required for printed out logs
+        import colorlog
+
         handler = logging.StreamHandler()
         handler.setFormatter(
             colorlog.ColoredFormatter(
@@ -35,6 +88,7 @@ def init_logger(name, level, printout=True):
             )
         )
 
+    handler.set_name(HANDLER_NAME)
     root_logger.addHandler(handler)
 
     return root_logger
@@ -9,11 +9,205 @@ Each reference rule is stored in as object attribute and every metas rules are
 stored in ``Manifest.metas`` attribute.
 
 """
+import asyncio
+import functools
+import io
 import json
+import os
 
+from collections import OrderedDict
+
+from .frozen import freeze, thaw
 from .parser import TinycssSourceParser
 from .serializer import ManifestSerializer
-from .nomenclature import RULE_META
+from .splitview import json_default
+from .stats import ManifestStats
+from .nomenclature import (
+    CUSTOM_PROPERTIES_SELECTORS,
+    CUSTOM_PROPERTY_PATTERN,
+    MANIFEST_OUTPUT_SUFFIX,
+    RULE_META,
+    is_wanted_reference,
+)
+
+
+def locate_manifest(path):
+    """
+    Find the dedicated manifest-only CSS output for a stylesheet.
+
+    A manifest-only output is a CSS file which only contains the styleguide rules,
+    named after the stylesheet with ``nomenclature.MANIFEST_OUTPUT_SUFFIX`` (like
+    ``main.styleguide.css`` for ``main.css``). Parsing it is faster than parsing the
+    whole stylesheet.
+
+    Arguments:
+        path (string or pathlib.Path): Path to a stylesheet.
+
+    Returns:
+        string: Path to the manifest-only output if it exists, else the given path.
+    """
+    path = str(path)
+
+    if path.endswith(MANIFEST_OUTPUT_SUFFIX):
+        return path
+
+    candidate = os.path.splitext(path)[0] + MANIFEST_OUTPUT_SUFFIX
+    if os.path.isfile(candidate):
+        return candidate
+
+    return path
+
+
+DUMP_BUFFER_SIZE = 16384
+"""
+Character count of JSON chunks grouped for each write of a streamed dump.
+"""
+
+
+def get_json_options(indent=4, compact=False, sort_keys=False, ensure_ascii=True):
+    """
+    Get keyword arguments for ``json.dumps()`` to encode a manifest.
+
+    Keyword Arguments:
+        indent (int): Space indentation, default to ``4``. ``None`` means a single
+            line.
+        compact (boolean): If enabled, JSON is on a single line without any
+            whitespace between items, ``indent`` is ignored. Default to ``False``.
+        sort_keys (boolean): If enabled, dictionnary keys are sorted so the same
+            manifest always gives the same JSON. Default to ``False``.
+        ensure_ascii (boolean): If disabled, non ASCII characters are written as
+            they are instead of escaped, JSON must then be written with an UTF-8
+            encoding. Default to ``True``.
+
+    Returns:
+        dict: Keyword arguments.
+    """
+    if compact:
+        indent = None
+        separators = (",", ":")
+    elif indent is None:
+        separators = (", ", ": ")
+    else:
+        separators = (",", ": ")
+
+    return {
+        "indent": indent,
+        "separators": separators,
+        "sort_keys": sort_keys,
+        "ensure_ascii": ensure_ascii,
+        "default": json_default,
+    }
+
+
+def iterencode_manifest(manifest, **kwargs):
+    """
+    Encode manifest metas and references to JSON chunks.
+
+    Values are encoded chunk by chunk with ``json.JSONEncoder.iterencode()``, so
+    neither the whole JSON nor a single reference is ever built in memory. Joined
+    chunks are the same than the string returned by ``json.dumps()`` on
+    ``Manifest.to_dict()`` with the same options.
+
+    Arguments:
+        manifest (Manifest): Manifest to encode, it may be a ``FrozenManifest``.
+
+    Keyword Arguments:
+        **kwargs: Encoding options, see ``get_json_options``.
+
+    Returns:
+        generator: JSON chunks.
+    """
+    options = get_json_options(**kwargs)
+    encoder = json.JSONEncoder(**options)
+    indent = options["indent"]
+    item_separator, key_separator = options["separators"]
+
+    if indent is None:
+        newline = ""
+    else:
+        newline = "\n" + (" " * indent if isinstance(indent, int) else indent)
+
+    names = [RULE_META] + list(manifest._rule_attrs)
+    if options["sort_keys"]:
+        names.sort()
+
+    yield "{"
+
+    for position, name in enumerate(names):
+        yield "".join((
+            item_separator if position else "",
+            newline,
+            encoder.encode(name),
+            key_separator,
+        ))
+
+        chunks = encoder.iterencode(getattr(manifest, name))
+        if indent is None:
+            yield from chunks
+        else:
+            # Value is nested one level, strings from JSON never contain a raw
+            # newline, only indentation does
+            for chunk in chunks:
+                yield chunk.replace("\n", newline)
+
+    yield "}" if indent is None else "\n}"
+
+
+def encode_manifest(manifest, **kwargs):
+    """
+    Encode manifest metas and references to a JSON string.
+
+    Single line JSON is encoded at once with ``json.dumps()`` which builds it
+    directly. Indented JSON is written chunk by chunk from ``iterencode_manifest``
+    since ``json.dumps()`` would keep every small chunk from its pure Python
+    encoder in memory before joining them.
+
+    Arguments:
+        manifest (Manifest): Manifest to encode, it may be a ``FrozenManifest``.
+
+    Keyword Arguments:
+        **kwargs: Encoding options, see ``get_json_options``.
+
+    Returns:
+        string: JSON datas.
+    """
+    options = get_json_options(**kwargs)
+
+    if options["indent"] is None:
+        return json.dumps(manifest.to_dict(), **options)
+
+    fp = io.StringIO()
+    write_chunks(fp, iterencode_manifest(manifest, **kwargs))
+
+    return fp.getvalue()
+
+
+def write_chunks(fp, chunks, size=DUMP_BUFFER_SIZE):
+    """
+    Write chunks to a file-like object, grouped to limit the number of writes.
+
+    Arguments:
+        fp (file-object): File-like object opened in text mode.
+        chunks (iterable): Strings to write.
+
+    Keyword Arguments:
+        size (int): Character count to group before each write. Default to
+            ``DUMP_BUFFER_SIZE``.
+    """
+    pending = []
+    length = 0
+
+    for chunk in chunks:
+        pending.append(chunk)
+        length += len(chunk)
+
+        if length >= size:
+            fp.write("".join(pending))
+            pending = []
+            length = 0
+
+    if pending:
+        fp.write("".join(pending))
 
 
 class Manifest(object):
@@ -33,6 +227,12 @@ class Manifest(object):
         metas (dict): Dictionnary of every meta datas from manifest. Either filled by
             serializer (with ``load`` method) or dump content (with ``from_dict``
             method).
+        diagnostics (list): List of diagnostics collected by serializer during
+            ``load`` method when option ``collect_diagnostics`` is enabled. See
+            ``ManifestSerializer.diagnostics`` for details.
+        stats (py_css_styleguide.stats.ManifestStats): Phase and reference durations
+            recorded during ``load`` method when statistics are enabled, else it is
+            ``None``.
     """
 
     def __init__(self):
@@ -41,8 +241,11 @@ class Manifest(object):
         self._rule_attrs = []
 
         self.metas = {}
+        self.diagnostics = []
+        self.stats = None
 
-    def load(self, source, filepath=None):
+    def load(self, source, filepath=None, serializer_options=None, stats=False,
+             stats_hooks=None, only=None, exclude=None):
         """
         Load source as manifest attributes
 
@@ -58,10 +261,29 @@ class Manifest(object):
                 string. If ``source`` argument is a file-like object, you
                 should not need to bother of this argument since filepath will
                 be filled from source ``name`` attribute.
+            serializer_options (dict): Optional keyword arguments to give to
+                ``ManifestSerializer``. For example use
+                ``{"collect_diagnostics": True}`` to collect deprecation warnings
+                into attribute ``Manifest.diagnostics`` and emit them once for each
+                kind.
+            stats (boolean): If enabled, phase and reference durations are recorded
+                into attribute ``Manifest.stats``. Default to ``False``.
+            stats_hooks (list): Optional list of callables to forward recorded
+                durations to, for example to a metrics system. Giving hooks enables
+                statistics. See ``stats.ManifestStats`` for hook signature.
+            only (list): If not empty, only these enabled references are loaded.
+                Content of other reference rules is not digested by parser nor
+                serialized, and they are not listed in metas.
+            exclude (list): Enabled references to not load.
 
         Returns:
             dict: Dictionnary of serialized rules.
         """
+        self.stats = None
+        if stats or stats_hooks:
+            self.stats = ManifestStats(hooks=stats_hooks)
+            load_start = start = self.stats.clock()
+
         # Set _path if source is a file-like object
         try:
             self._path = source.name
@@ -74,17 +296,140 @@ class Manifest(object):
         except AttributeError:
             source_content = source
 
+        if self.stats is not None:
+            self.stats.add_phase("read", start)
+            start = self.stats.clock()
+
         # Parse and serialize given source
-        parser = TinycssSourceParser()
+        parser = TinycssSourceParser(stats=self.stats, only=only, exclude=exclude)
         self._datas = parser.parse(source_content)
 
-        serializer = ManifestSerializer()
+        if self.stats is not None:
+            self.stats.add_phase("parse", start)
+            start = self.stats.clock()
+
+        serializer = ManifestSerializer(
+            stats=self.stats, only=only, exclude=exclude, **(serializer_options or {})
+        )
         references = serializer.serialize(self._datas)
 
-        # Copy serialized metas
+        if self.stats is not None:
+            self.stats.add_phase("serialize", start)
+            start = self.stats.clock()
+
+        # Copy serialized metas and possible diagnostics
         self.metas = serializer._metas
+        self.diagnostics = serializer.diagnostics
 
         # Set every enabled rule as object attribute
+        for k, v in references.items():
+            self._set_rule(k, v)
+
+        if self.stats is not None:
+            self.stats.add_phase("attributes", start)
+            self.stats.add_phase("load", load_start)
+
+        return self._datas
+
+    async def aload(self, source, executor=None, **kwargs):
+        """
+        Asynchronous version of ``load`` method.
+
+        Reading from a file-like source, parsing and serialization are done in an
+        executor so they do not block the event loop.
+
+        Arguments:
+            source (string or file-object): CSS source to parse and serialize. See
+                ``load`` method for details.
+
+        Keyword Arguments:
+            executor (concurrent.futures.Executor): Executor where to run loading.
+                Default to ``None`` to use the event loop default executor.
+            **kwargs: Keyword arguments to give to ``load`` method.
+
+        Returns:
+            dict: Dictionnary of serialized rules.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            executor, functools.partial(self.load, source, **kwargs)
+        )
+
+    def load_file(self, path, locate=True, **kwargs):
+        """
+        Open and load a CSS manifest file.
+
+        Arguments:
+            path (string or pathlib.Path): Path to the CSS manifest.
+
+        Keyword Arguments:
+            locate (boolean): If enabled, the dedicated manifest-only output of given
+                path is loaded instead when it exists, see ``locate_manifest``.
+                Default to ``True``.
+            **kwargs: Keyword arguments to give to ``Manifest.load()``.
+
+        Returns:
+            dict: Dictionnary of serialized rules.
+        """
+        if locate:
+            path = locate_manifest(path)
+
+        with open(path, "r") as fp:
+            return self.load(fp, **kwargs)
+
+    def load_custom_properties(self, source, filepath=None,
+                               pattern=CUSTOM_PROPERTY_PATTERN,
+                               selectors=CUSTOM_PROPERTIES_SELECTORS):
+        """
+        Load design tokens from custom properties as manifest attributes.
+
+        Unlike ``load`` method, source does not need any styleguide rules. Custom
+        properties from ``:root`` and ``:host`` rules are grouped into flat
+        references with a naming pattern, for example with default pattern
+        ``--color-primary: #ff0000`` becomes item ``primary`` of reference
+        ``color``.
+
+        Arguments:
+            source (string or file-object): CSS source to parse. It can be either a
+                string or a file-like object.
+
+        Keyword Arguments:
+            filepath (string): Optional filepath to memorize if source comes
+                from a file. See ``load`` method for details.
+            pattern (string or re.Pattern): Regex pattern to group custom properties,
+                it must define named groups ``reference`` and ``key``. Default to
+                ``nomenclature.CUSTOM_PROPERTY_PATTERN``.
+            selectors (tuple): Selectors of rules where to collect custom
+                properties. Default to ``nomenclature.CUSTOM_PROPERTIES_SELECTORS``.
+
+        Returns:
+            dict: Dictionnary of collected custom properties.
+        """
+        # Set _path if source is a file-like object
+        try:
+            self._path = source.name
+        except AttributeError:
+            self._path = filepath
+
+        # Get source content either it's a string or a file-like object
+        try:
+            source_content = source.read()
+        except AttributeError:
+            source_content = source
+
+        parser = TinycssSourceParser()
+        self._datas = parser.consume_custom_properties(
+            source_content, selectors=selectors
+        )
+
+        serializer = ManifestSerializer()
+        references = serializer.serialize_custom_properties(
+            self._datas, pattern=pattern
+        )
+
+        self.metas = serializer._metas
+
         for k, v in references.items():
             self._set_rule(k, v)
 
@@ -132,19 +477,69 @@ class Manifest(object):
 
         return agregate
 
-    def to_json(self, indent=4):
+    def to_json(self, indent=4, compact=False, sort_keys=False, ensure_ascii=True):
         """
         Serialize metas and reference attributes to a JSON string.
 
         Keyword Arguments:
             indent (int): Space indentation, default to ``4``.
+            compact (boolean): To output JSON on a single line without whitespaces.
+            sort_keys (boolean): To sort dictionnary keys.
+            ensure_ascii (boolean): To escape non ASCII characters. Default to
+                ``True``.
 
         Returns:
             string: JSON datas.
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        return encode_manifest(
+            self, indent=indent, compact=compact, sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+        )
+
+    def dump(self, fp, indent=4, compact=False, sort_keys=False, ensure_ascii=True):
+        """
+        Write metas and reference attributes as JSON to a file-like object.
+
+        Opposed to ``to_json``, JSON is encoded and written by small chunks so
+        memory does not grow with the JSON size.
+
+        Arguments:
+            fp (file-object): File-like object opened in text mode. It must use an
+                UTF-8 encoding when ``ensure_ascii`` is disabled.
+
+        Keyword Arguments:
+            indent (int): Space indentation, default to ``4``.
+            compact (boolean): To output JSON on a single line without whitespaces.
+            sort_keys (boolean): To sort dictionnary keys.
+            ensure_ascii (boolean): To escape non ASCII characters. Default to
+                ``True``.
+        """
+        write_chunks(
+            fp,
+            iterencode_manifest(
+                self, indent=indent, compact=compact, sort_keys=sort_keys,
+                ensure_ascii=ensure_ascii,
+            ),
+        )
+
+    def freeze(self):
+        """
+        Build a read only copy of manifest to share between threads.
 
-    def from_dict(self, data):
+        Returns:
+            FrozenManifest: Frozen manifest with the same metas, references and
+            every other public attributes, except ``stats``.
+        """
+        attributes = {
+            k: v
+            for k, v in self.__dict__.items()
+            if not k.startswith("_") and k not in self._rule_attrs and
+            k not in ("metas", "stats")
+        }
+
+        return FrozenManifest(self.to_dict(), path=self._path, attributes=attributes)
+
+    def from_dict(self, data, only=None, exclude=None):
         """
         Load given data as manifest attributes.
 
@@ -155,9 +550,178 @@ class Manifest(object):
             data (dict): A dictionnary of datas to load. This dictionnary have to be
                 in the same format and structure than the one returned by ``to_dict``
                 method.
+
+        Keyword Arguments:
+            only (list): If not empty, only these references are loaded.
+            exclude (list): References to not load.
         """
         self.metas = data[RULE_META]
 
+        if only or exclude:
+            self.metas = OrderedDict(self.metas)
+            self.metas["references"] = [
+                name
+                for name in self.metas.get("references", [])
+                if is_wanted_reference(name, only, exclude)
+            ]
+
         for name, properties in data.items():
-            if name != RULE_META:
+            if name != RULE_META and is_wanted_reference(name, only, exclude):
                 self._set_rule(name, properties)
+
+
+class FrozenManifest(object):
+    """
+    Read only manifest.
+
+    References, metas and other attributes are frozen with ``frozen.freeze()``, so
+    a frozen manifest can be cached and shared between threads (or pickled to
+    other processes) without defensive copies. Use ``thaw()`` to get a mutable
+    ``Manifest`` back.
+
+    Commonly you would get it from ``Manifest.freeze()``.
+
+    Arguments:
+        data (dict): Metas and references in the same format than the one
+            returned by ``Manifest.to_dict()``.
+
+    Keyword Arguments:
+        path (string): Possible filepath of manifest source.
+        attributes (dict): Other attributes to set, like ``diagnostics``.
+
+    Attributes:
+        _path (string): Possible filepath of manifest source.
+        _rule_attrs (tuple): Names of reference attributes.
+        metas (py_css_styleguide.frozen.FrozenDict): Meta datas from manifest.
+        diagnostics (tuple): Diagnostics collected during load.
+        stats (None): Statistics are never kept in a frozen manifest.
+    """
+
+    def __init__(self, data, path=None, attributes=None):
+        attributes = dict(attributes or {})
+        attributes.setdefault("diagnostics", [])
+
+        references = [name for name in data if name != RULE_META]
+
+        values = {
+            "_path": path,
+            "_rule_attrs": tuple(references),
+            "_attributes": tuple(attributes),
+            "metas": freeze(data[RULE_META]),
+            "stats": None,
+        }
+        values.update((k, freeze(v)) for k, v in attributes.items())
+        values.update((name, freeze(data[name])) for name in references)
+
+        self.__dict__.update(values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "Can not set attribute '{}' on a frozen manifest".format(name)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "Can not delete attribute '{}' on a frozen manifest".format(name)
+        )
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (
+                self.to_dict(),
+                self._path,
+                {k: getattr(self, k) for k in self._attributes},
+            ),
+        )
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def to_dict(self):
+        """
+        Serialize metas and reference attributes to a dictionnary.
+
+        Returns:
+            dict: Data dictionnary with frozen values.
+        """
+        agregate = {RULE_META: self.metas}
+
+        agregate.update({k: getattr(self, k) for k in self._rule_attrs})
+
+        return agregate
+
+    def to_json(self, indent=4, compact=False, sort_keys=False, ensure_ascii=True):
+        """
+        Serialize metas and reference attributes to a JSON string.
+
+        Keyword Arguments:
+            indent (int): Space indentation, default to ``4``.
+            compact (boolean): To output JSON on a single line without whitespaces.
+            sort_keys (boolean): To sort dictionnary keys.
+            ensure_ascii (boolean): To escape non ASCII characters. Default to
+                ``True``.
+
+        Returns:
+            string: JSON datas.
+        """
+        return encode_manifest(
+            self, indent=indent, compact=compact, sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+        )
+
+    def dump(self, fp, indent=4, compact=False, sort_keys=False, ensure_ascii=True):
+        """
+        Write metas and reference attributes as JSON to a file-like object.
+
+        Opposed to ``to_json``, JSON is encoded and written by small chunks so
+        memory does not grow with the JSON size.
+
+        Arguments:
+            fp (file-object): File-like object opened in text mode. It must use an
+                UTF-8 encoding when ``ensure_ascii`` is disabled.
+
+        Keyword Arguments:
+            indent (int): Space indentation, default to ``4``.
+            compact (boolean): To output JSON on a single line without whitespaces.
+            sort_keys (boolean): To sort dictionnary keys.
+            ensure_ascii (boolean): To escape non ASCII characters. Default to
+                ``True``.
+        """
+        write_chunks(
+            fp,
+            iterencode_manifest(
+                self, indent=indent, compact=compact, sort_keys=sort_keys,
+                ensure_ascii=ensure_ascii,
+            ),
+        )
+
+    def freeze(self):
+        """
+        Frozen manifest is already read only.
+
+        Returns:
+            FrozenManifest: The frozen manifest itself.
+        """
+        return self
+
+    def thaw(self):
+        """
+        Build a mutable manifest from frozen manifest.
+
+        Returns:
+            Manifest: A new manifest object with mutable copies of metas, references
+            and other attributes.
+        """
+        manifest = Manifest()
+        manifest._path = self._path
+
+        for name in self._attributes:
+            setattr(manifest, name, thaw(getattr(self, name)))
+
+        manifest.from_dict(thaw(self.to_dict()))
+
+        return manifest
@@ -24,6 +24,7 @@ There is some reserved name:
 * For rule property name they are registred in ``RESERVED_PROPERTY_NAMES``;
 
 """
+from functools import lru_cache
 from string import ascii_letters, digits
 
 from .exceptions import StyleguideValidationError
@@ -38,12 +39,46 @@ RULE_META_COMPILER = "-".join((RULE_BASE_PREFIX, RULE_META, "compiler"))
 
 RULE_REFERENCE = "-".join((RULE_BASE_PREFIX, "reference"))
 
+CUSTOM_PROPERTIES_SELECTORS = (":root", ":host")
+"""
+Selectors of rules where to collect design tokens from custom properties
+"""
+
+CUSTOM_PROPERTY_PATTERN = r"^(?P<reference>[a-zA-Z][a-zA-Z0-9_]*)-(?P<key>.+)$"
+"""
+Default regex pattern to group custom properties into references, named group
+``reference`` is the reference name and named group ``key`` is the item key in
+reference. For example ``--color-primary`` goes to key ``primary`` of reference
+``color``
+"""
+
+MANIFEST_OUTPUT_SUFFIX = ".styleguide.css"
+"""
+Suffix of a dedicated manifest-only CSS output, it replaces the ``.css`` extension
+of the stylesheet it comes with (like ``main.styleguide.css`` for ``main.css``)
+"""
+
 RULE_ALLOWED_START = ascii_letters
 RULE_ALLOWED_CHARS = ascii_letters + digits + "_"
 
 PROPERTY_ALLOWED_START = ascii_letters
 PROPERTY_ALLOWED_CHARS = ascii_letters + digits + "_"
 
+RULE_ALLOWED_CHARSET = frozenset(RULE_ALLOWED_CHARS)
+"""
+Set of ``RULE_ALLOWED_CHARS`` for fast validation
+"""
+
+PROPERTY_ALLOWED_CHARSET = frozenset(PROPERTY_ALLOWED_CHARS)
+"""
+Set of ``PROPERTY_ALLOWED_CHARS`` for fast validation
+"""
+
+VALIDATION_CACHE_SIZE = 4096
+"""
+Maximum number of valid names to remember for each name validator
+"""
+
 FORBIDDEN_PREFIXES = ("_", "-")
 """
 Rule and property names can not start with following strings
@@ -56,6 +91,15 @@ RESERVED_RULE_NAMES = (
     "to_json",
     "from_dict",
     "metas",
+    "diagnostics",
+    "stats",
+    "load_file",
+    "load_custom_properties",
+    "aload",
+    "freeze",
+    "thaw",
+    "dump",
+    "release",
 )
 """
 Rule name can not be one of the following string
@@ -107,10 +151,34 @@ def is_reserved_property(name):
     return name in RESERVED_PROPERTY_NAMES
 
 
+def is_wanted_reference(name, only=None, exclude=None):
+    """
+    Check a reference name against a subset of reference names to load.
+
+    Arguments:
+        name (string): Reference name.
+
+    Keyword Arguments:
+        only (list): If not empty, only these reference names are wanted.
+        exclude (list): Reference names which are never wanted.
+
+    Returns:
+        bool: ``True`` if reference is wanted.
+    """
+    if only and name not in only:
+        return False
+
+    return not (exclude and name in exclude)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def is_valid_rule(name):
     """
     Validate rule name.
 
+    Valid names are memoized so repeated names are only checked once, invalid
+    names are never memoized since they raise an exception.
+
     Arguments:
         name (string): Rule name.
 
@@ -132,21 +200,24 @@ def is_valid_rule(name):
         msg = "Rule name '{}' must starts with a letter"
         raise StyleguideValidationError(msg.format(name))
 
-    for item in name:
-        if item not in RULE_ALLOWED_CHARS:
-            msg = (
-                "Invalid rule name '{}': it must only contains "
-                "letters, numbers and '_' character"
-            )
-            raise StyleguideValidationError(msg.format(name))
+    if not RULE_ALLOWED_CHARSET.issuperset(name):
+        msg = (
+            "Invalid rule name '{}': it must only contains "
+            "letters, numbers and '_' character"
+        )
+        raise StyleguideValidationError(msg.format(name))
 
     return True
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def is_valid_property(name):
     """
     Validate property name.
 
+    Valid names are memoized so repeated names are only checked once, invalid
+    names are never memoized since they raise an exception.
+
     Arguments:
         name (string): Property name.
 
@@ -168,12 +239,11 @@ def is_valid_property(name):
         msg = "Variable name '{}' must starts with a letter"
         raise StyleguideValidationError(msg.format(name))
 
-    for item in name:
-        if item not in PROPERTY_ALLOWED_CHARS:
-            msg = (
-                "Invalid variable name '{}': it must only contains "
-                "letters, numbers and '_' character"
-            )
-            raise StyleguideValidationError(msg.format(name))
+    if not PROPERTY_ALLOWED_CHARSET.issuperset(name):
+        msg = (
+            "Invalid variable name '{}': it must only contains "
+            "letters, numbers and '_' character"
+        )
+        raise StyleguideValidationError(msg.format(name))
 
     return True
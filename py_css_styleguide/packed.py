@@ -0,0 +1,332 @@
+"""
+Packed manifest
+===============
+
+A compact binary layout for a manifest where each reference is encoded apart, so
+a reference can be decoded from the buffer without to decode the whole manifest.
+
+Layout is:
+
+* ``PACKED_MAGIC`` bytes;
+* The index length as a 32 bits unsigned little endian integer;
+* The index, a JSON object encoded in UTF-8 with items ``path``, ``metas``,
+  ``references`` and ``attributes``. Metas are a ``[offset, length]`` pair,
+  references and attributes are lists of ``[name, offset, length]`` items;
+* The payload where metas, every reference and every attribute are JSON values
+  encoded in UTF-8. Offsets are relative to the payload start.
+
+A packed manifest can be read from any object supporting the buffer protocol
+like ``bytes``, a ``memoryview`` on a shared memory segment or a ``mmap``.
+
+Packed manifests can also be written to files as indexed dumps, an alternative to
+JSON dumps. Opening an indexed dump with ``load_packed()`` maps the file in memory
+and only reads its index, so reaching a single reference from a big dump only
+reads and decodes this reference.
+"""
+import json
+import mmap
+import struct
+
+from .exceptions import PackedManifestError
+from .frozen import freeze
+from .model import FrozenManifest
+from .nomenclature import RULE_META, is_wanted_reference
+from .splitview import json_default
+
+
+PACKED_MAGIC = b"PYCSSSG\x01"
+"""
+Leading bytes of a packed manifest, the last one is the layout version.
+"""
+
+PACKED_INDEX_LENGTH = struct.Struct("<I")
+"""
+Structure of the index length following the magic bytes.
+"""
+
+PACKED_HEADER_SIZE = len(PACKED_MAGIC) + PACKED_INDEX_LENGTH.size
+"""
+Size of the fixed header before the index.
+"""
+
+
+def encode_value(value):
+    """
+    Encode a manifest value to compact JSON bytes.
+
+    Arguments:
+        value (object): Value to encode.
+
+    Returns:
+        bytes: Encoded value.
+    """
+    return json.dumps(
+        value, separators=(",", ":"), default=json_default
+    ).encode("utf-8")
+
+
+def pack_manifest(manifest):
+    """
+    Pack a manifest to the packed layout.
+
+    Arguments:
+        manifest (py_css_styleguide.model.Manifest): Manifest to pack, it may be a
+            ``FrozenManifest``.
+
+    Returns:
+        bytes: Packed manifest.
+    """
+    if not isinstance(manifest, FrozenManifest):
+        manifest = manifest.freeze()
+
+    payload = []
+    offset = 0
+
+    def add(value):
+        nonlocal offset
+        content = encode_value(value)
+        payload.append(content)
+        position = [offset, len(content)]
+        offset += len(content)
+        return position
+
+    index = {
+        "path": manifest._path,
+        "metas": add(manifest.metas),
+        "references": [
+            [name] + add(getattr(manifest, name)) for name in manifest._rule_attrs
+        ],
+        "attributes": [
+            [name] + add(getattr(manifest, name)) for name in manifest._attributes
+        ],
+    }
+    index = encode_value(index)
+
+    return b"".join(
+        [PACKED_MAGIC, PACKED_INDEX_LENGTH.pack(len(index)), index] + payload
+    )
+
+
+def is_packed(buffer):
+    """
+    Check if a buffer starts with the packed layout magic bytes.
+
+    Arguments:
+        buffer (bytes-like): Buffer to check.
+
+    Returns:
+        bool: ``True`` if buffer looks like a packed manifest.
+    """
+    return bytes(buffer[:len(PACKED_MAGIC)]) == PACKED_MAGIC
+
+
+def read_index(buffer):
+    """
+    Read the index of a packed manifest.
+
+    Arguments:
+        buffer (bytes-like): Packed manifest buffer.
+
+    Raises:
+        PackedManifestError: If buffer is not a packed manifest.
+
+    Returns:
+        tuple: The index dictionnary and the payload start position.
+    """
+    if not is_packed(buffer):
+        raise PackedManifestError("Buffer is not a packed manifest")
+
+    if len(buffer) < PACKED_HEADER_SIZE:
+        raise PackedManifestError("Packed manifest header is truncated")
+
+    length = PACKED_INDEX_LENGTH.unpack_from(buffer, len(PACKED_MAGIC))[0]
+    start = PACKED_HEADER_SIZE + length
+
+    try:
+        index = json.loads(bytes(buffer[PACKED_HEADER_SIZE:start]).decode("utf-8"))
+    except ValueError as e:
+        raise PackedManifestError("Invalid packed manifest index: {}".format(e))
+
+    return index, start
+
+
+class PackedManifest(FrozenManifest):
+    """
+    Frozen manifest which decodes its references from a packed buffer.
+
+    Only the index is decoded on init, metas, references and other attributes are
+    decoded and frozen the first time they are reached, then kept on object. The
+    buffer is never copied, so references which are never reached do not use any
+    memory out of the buffer.
+
+    Arguments:
+        buffer (bytes-like): Packed manifest buffer, it must stay available as long
+            as the packed manifest is used.
+
+    Keyword Arguments:
+        only (list): If not empty, only these references are available.
+        exclude (list): References to not make available.
+        attributes (dict): Other attributes to set, they override the packed ones.
+
+    Attributes:
+        _buffer (memoryview): Read only view on buffer.
+        _positions (dict): Payload absolute offset and length for each value name.
+    """
+
+    def __init__(self, buffer, only=None, exclude=None, attributes=None):
+        view = memoryview(buffer)
+        buffer = view.toreadonly()
+        view.release()
+
+        try:
+            index, start = read_index(buffer)
+        except PackedManifestError:
+            # Release view so buffer owner can be closed
+            buffer.release()
+            raise
+
+        attributes = attributes or {}
+
+        references = [
+            item
+            for item in index["references"]
+            if is_wanted_reference(item[0], only, exclude)
+        ]
+        names = tuple(name for name, *_ in references)
+
+        positions = {RULE_META: (start + index["metas"][0], index["metas"][1])}
+        positions.update(
+            (name, (start + offset, length))
+            for name, offset, length in references + index["attributes"]
+            if name not in attributes
+        )
+
+        self.__dict__.update({
+            "_path": index["path"],
+            "_rule_attrs": names,
+            "_attributes": tuple(
+                [name for name, *_ in index["attributes"] if name not in attributes] +
+                list(attributes)
+            ),
+            "_buffer": buffer,
+            "_positions": positions,
+            "stats": None,
+        })
+        self.__dict__.update((k, freeze(v)) for k, v in attributes.items())
+
+        # Metas only list available references
+        if len(names) != len(index["references"]):
+            metas = self.metas
+            self.__dict__[RULE_META] = freeze(dict(metas, references=list(names)))
+
+    def __getattr__(self, name):
+        # Only called for attributes which are not decoded yet
+        try:
+            offset, length = self.__dict__["_positions"][name]
+        except KeyError:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
+
+        value = freeze(
+            json.loads(bytes(self._buffer[offset:offset + length]).decode("utf-8"))
+        )
+        self.__dict__[name] = value
+
+        return value
+
+    def __reduce__(self):
+        # Buffer may not be picklable, send a plain frozen manifest instead
+        return (
+            FrozenManifest,
+            (
+                self.to_dict(),
+                self._path,
+                {k: getattr(self, k) for k in self._attributes},
+            ),
+        )
+
+    def release(self):
+        """
+        Release the view on buffer so its owner can be closed.
+
+        References which have not been decoded yet can not be reached anymore.
+        """
+        self._buffer.release()
+
+
+def estimate_packed_size(manifest):
+    """
+    Estimate memory size of a packed manifest without to decode its values.
+
+    Size is the encoded length of its available metas, references and attributes
+    in the buffer. Decoded values use more memory but decoding them to measure
+    would defeat lazy decoding.
+
+    Arguments:
+        manifest (PackedManifest): Packed manifest to estimate.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    return sum(length for offset, length in manifest._positions.values())
+
+
+def dump_packed(manifest, path):
+    """
+    Write a manifest to an indexed dump file.
+
+    Arguments:
+        manifest (py_css_styleguide.model.Manifest): Manifest to dump, it may be a
+            ``FrozenManifest``.
+        path (string or pathlib.Path): Destination file path.
+    """
+    with open(path, "wb") as fp:
+        fp.write(pack_manifest(manifest))
+
+
+def is_packed_file(path):
+    """
+    Check if a file is an indexed dump from its leading bytes.
+
+    Arguments:
+        path (string or pathlib.Path): File path.
+
+    Returns:
+        bool: ``True`` if file starts with ``PACKED_MAGIC``.
+    """
+    with open(path, "rb") as fp:
+        return is_packed(fp.read(len(PACKED_MAGIC)))
+
+
+def load_packed(path, **kwargs):
+    """
+    Open an indexed dump file.
+
+    File is mapped in memory, only its index is read on opening and each
+    reference is read and decoded when it is reached. File stays mapped as long as
+    returned manifest is used.
+
+    Arguments:
+        path (string or pathlib.Path): Indexed dump file path.
+
+    Keyword Arguments:
+        **kwargs: Keyword arguments to give to ``PackedManifest``, like ``only``.
+
+    Raises:
+        PackedManifestError: If file is not an indexed dump.
+
+    Returns:
+        PackedManifest: Packed manifest over file.
+    """
+    with open(path, "rb") as fp:
+        try:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise PackedManifestError("Buffer is not a packed manifest")
+
+    try:
+        return PackedManifest(mapped, **kwargs)
+    except PackedManifestError:
+        mapped.close()
+        raise
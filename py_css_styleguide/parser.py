@@ -14,10 +14,15 @@ other syntax for non styleguide rules.
 """
 from collections import OrderedDict
 
-from tinycss2 import parse_stylesheet
+from tinycss2 import parse_declaration_list, parse_stylesheet, serialize
 from tinycss2.ast import ParseError as TinyCSS2ParseError
 
-from .nomenclature import RULE_BASE_PREFIX
+from .nomenclature import (
+    CUSTOM_PROPERTIES_SELECTORS,
+    RULE_BASE_PREFIX,
+    RULE_REFERENCE,
+    is_wanted_reference,
+)
 from .exceptions import ParserErrors
 
 
@@ -27,8 +32,28 @@ class TinycssSourceParser(object):
 
     Since tinycss2 only return tokens, this parser is in charge to turn them
     to usable datas: a dict of properties for each selector.
+
+    Keyword Arguments:
+        stats (py_css_styleguide.stats.ManifestStats): Optional recorder for parsing
+            phase durations. Default to ``None`` to not record anything.
+        only (list): If not empty, content of reference rules is only digested for
+            these reference names, other reference rules are ignored.
+        exclude (list): Reference names of rules to ignore without to digest their
+            content.
+
+    Attributes:
+        positions (collections.OrderedDict): Source positions of consumed rules,
+            filled during parsing. Each item is named after its rule name and is
+            a dictionnary with items ``line`` and ``column`` for the rule selector
+            and item ``properties`` which is a dictionnary of property positions.
     """
 
+    def __init__(self, stats=None, only=None, exclude=None):
+        self.stats = stats
+        self.only = frozenset(only or [])
+        self.exclude = frozenset(exclude or [])
+        self.positions = OrderedDict()
+
     def digest_prelude(self, rule):
         """
         Walk on rule prelude (aka CSS selector) tokens to return a string of
@@ -54,7 +79,7 @@ class TinycssSourceParser(object):
 
         return "__".join(name)
 
-    def digest_content(self, rule):
+    def digest_content(self, rule, positions=None):
         """
         Walk on rule content tokens to return a dict of properties.
 
@@ -65,6 +90,10 @@ class TinycssSourceParser(object):
             rule (tinycss2.ast.QualifiedRule): Qualified rule object as
                 returned by  tinycss2.
 
+        Keyword Arguments:
+            positions (dict): If given, the source line and column of each property
+                will be stored in it.
+
         Returns:
             dict: Dictionnary of retrieved variables and properties.
         """
@@ -85,6 +114,12 @@ class TinycssSourceParser(object):
                 current_key = name
                 data[current_key] = None
 
+                if positions is not None:
+                    positions[current_key] = {
+                        "line": token.source_line,
+                        "column": token.source_column,
+                    }
+
             # Assume first following string or number token is the property value.
             if token.type == "string":
                 data[current_key] = token.value
@@ -94,20 +129,27 @@ class TinycssSourceParser(object):
 
         return data
 
-    def consume(self, source):
+    def get_rules(self, source):
         """
-        Parse source and consume tokens from tinycss2.
+        Tokenize source with tinycss2 and return its rules.
 
         Arguments:
             source (string): Source content to parse.
 
+        Raises:
+            ParserErrors: If there is any parsing error in source.
+
         Returns:
-            dict: Retrieved rules.
+            list: Tinycss2 rule objects.
         """
-        manifest = OrderedDict()
+        if self.stats is not None:
+            start = self.stats.clock()
 
         rules = parse_stylesheet(source, skip_comments=True, skip_whitespace=True)
 
+        if self.stats is not None:
+            self.stats.add_phase("parse.tokenize", start)
+
         errors = [
             item
             for item in rules
@@ -129,6 +171,26 @@ class TinycssSourceParser(object):
                 error_payload=error_payload,
             )
 
+        return rules
+
+    def consume(self, source):
+        """
+        Parse source and consume tokens from tinycss2.
+
+        Arguments:
+            source (string): Source content to parse.
+
+        Returns:
+            dict: Retrieved rules.
+        """
+        manifest = OrderedDict()
+        self.positions = OrderedDict()
+
+        rules = self.get_rules(source)
+
+        if self.stats is not None:
+            start = self.stats.clock()
+
         for rule in rules:
             # Gather rule selector+properties
             name = self.digest_prelude(rule)
@@ -137,11 +199,92 @@ class TinycssSourceParser(object):
             if not name.startswith(RULE_BASE_PREFIX):
                 continue
 
-            properties = self.digest_content(rule)
+            # Ignore unwanted references
+            if (self.only or self.exclude) and name.startswith(RULE_REFERENCE):
+                if not is_wanted_reference(
+                    name[len(RULE_REFERENCE) + 1:], self.only, self.exclude
+                ):
+                    continue
+
+            self.positions[name] = {
+                "line": rule.source_line,
+                "column": rule.source_column,
+                "properties": OrderedDict(),
+            }
+            properties = self.digest_content(
+                rule, positions=self.positions[name]["properties"]
+            )
             manifest[name] = properties
 
+        if self.stats is not None:
+            self.stats.add_phase("parse.rules", start)
+
         return manifest
 
+    def consume_custom_properties(self, source,
+                                  selectors=CUSTOM_PROPERTIES_SELECTORS):
+        """
+        Parse source and collect custom properties declared in given selectors.
+
+        Custom properties are collected in a single pass over rules, every other
+        rules and properties are ignored. When a custom property is declared many
+        times, the last declaration wins.
+
+        Arguments:
+            source (string): Source content to parse.
+
+        Keyword Arguments:
+            selectors (tuple): Selectors of rules where to collect custom properties.
+                A rule with a selector list matches if any of its selectors is in
+                given ones. Default to ``nomenclature.CUSTOM_PROPERTIES_SELECTORS``.
+
+        Returns:
+            collections.OrderedDict: Values for each custom property name without its
+            leading dashes. A value which is only a string is unquoted, every other
+            value is kept as written in source.
+        """
+        properties = OrderedDict()
+
+        rules = self.get_rules(source)
+
+        if self.stats is not None:
+            start = self.stats.clock()
+
+        for rule in rules:
+            if rule.type != "qualified-rule":
+                continue
+
+            prelude = {item.strip() for item in serialize(rule.prelude).split(",")}
+            if prelude.isdisjoint(selectors):
+                continue
+
+            for declaration in parse_declaration_list(
+                rule.content, skip_whitespace=True, skip_comments=True
+            ):
+                if (
+                    declaration.type != "declaration" or
+                    not declaration.name.startswith("--")
+                ):
+                    continue
+
+                tokens = [
+                    token
+                    for token in declaration.value
+                    if token.type not in ("whitespace", "comment")
+                ]
+
+                if len(tokens) == 1 and tokens[0].type == "string":
+                    value = tokens[0].value
+                else:
+                    value = serialize(declaration.value).strip()
+
+                properties[declaration.name[2:]] = value
+
+        if self.stats is not None:
+            self.stats.add_phase("parse.rules", start)
+
+        return properties
+
     def parse(self, source):
         """
         Read and parse CSS source and return dict of rules.
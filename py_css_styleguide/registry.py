@@ -0,0 +1,250 @@
+"""
+Registry
+========
+
+A registry keeps loaded manifests in memory for many styleguides (like one for
+each brand or theme) with a size aware LRU eviction.
+
+Each manifest is registered under a key (commonly a name or a path) with an
+optional signature of the file it has been loaded from (see
+``django.mixin.StyleguideMixin.get_manifest_signature``), a manifest is stale and
+dropped when it is requested with another signature.
+
+Manifest size is estimated from the size of its metas and references objects, or
+from the encoded size of its references for a packed manifest so they are not
+decoded.
+When registry exceeds its maximum number of entries or its maximum size, least
+recently used manifests are evicted first.
+
+Registered manifests are shared with every caller, you should register frozen
+manifests (see ``model.Manifest.freeze()``).
+"""
+import sys
+import threading
+
+from collections import OrderedDict
+
+from .packed import PackedManifest, estimate_packed_size
+
+
+def estimate_size(value):
+    """
+    Estimate memory size of a value and every object it contains.
+
+    Objects shared many times are only counted once.
+
+    Arguments:
+        value (object): Value to estimate, commonly the dictionnary from
+            ``Manifest.to_dict()``.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    size = 0
+    seen = set()
+    pending = [value]
+
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+
+    return size
+
+
+def estimate_manifest_size(manifest):
+    """
+    Estimate memory size of a manifest.
+
+    A packed manifest is estimated from its buffer without to decode its
+    references, see ``packed.estimate_packed_size()``.
+
+    Arguments:
+        manifest (py_css_styleguide.model.Manifest): Manifest to estimate, it may
+            be a ``FrozenManifest`` or a ``PackedManifest``.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    if isinstance(manifest, PackedManifest):
+        return estimate_packed_size(manifest)
+
+    return estimate_size(manifest.to_dict())
+
+
+class ManifestRegistry(object):
+    """
+    Manifests registry with a size aware LRU eviction.
+
+    Registry is thread safe.
+
+    Keyword Arguments:
+        max_entries (int): Maximum number of registered manifests. Default to
+            ``None`` for no limit.
+        max_bytes (int): Maximum estimated size of registered manifests in bytes.
+            A manifest bigger than this size is never registered. Default to
+            ``None`` for no limit.
+        hooks (list): Optional list of callables to call when a manifest is removed
+            from registry. Each hook is called with arguments ``event`` (one of
+            ``evict``, ``stale``, ``replace`` or ``invalidate``), ``key`` and
+            ``manifest``.
+
+    Attributes:
+        entries (collections.OrderedDict): Signature, manifest and estimated size
+            for each key, from the least to the most recently used.
+        size (int): Estimated size of registered manifests in bytes.
+        counters (collections.OrderedDict): Number of ``hits``, ``misses``,
+            ``evictions``, ``stales``, ``invalidations`` and ``rejections``.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, hooks=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hooks = list(hooks or [])
+
+        self.entries = OrderedDict()
+        self.size = 0
+        self.counters = OrderedDict(
+            (name, 0)
+            for name in (
+                "hits", "misses", "evictions", "stales", "invalidations",
+                "rejections",
+            )
+        )
+
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def _remove(self, key, event):
+        signature, manifest, size = self.entries.pop(key)
+        self.size -= size
+
+        for hook in self.hooks:
+            hook(event, key, manifest)
+
+    def get(self, key, signature=None):
+        """
+        Get a registered manifest.
+
+        Arguments:
+            key (object): Manifest key.
+
+        Keyword Arguments:
+            signature (object): Signature of the file manifest would be loaded from.
+                If it is different from the registered one, manifest is stale and
+                removed. Default to ``None`` to ignore signature.
+
+        Returns:
+            object: Registered manifest or ``None`` if there is none.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and signature is not None and entry[0] != signature:
+                self._remove(key, "stale")
+                self.counters["stales"] += 1
+                entry = None
+
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.counters["hits"] += 1
+
+            return entry[1]
+
+    def set(self, key, manifest, signature=None):
+        """
+        Register a manifest then evict least recently used manifests if registry
+        exceeds its limits.
+
+        Arguments:
+            key (object): Manifest key.
+            manifest (object): Manifest to register.
+
+        Keyword Arguments:
+            signature (object): Signature of the file manifest has been loaded from.
+
+        Returns:
+            bool: ``True`` if manifest has been registered, ``False`` if it is bigger
+            than ``max_bytes``.
+        """
+        size = estimate_manifest_size(manifest)
+
+        with self._lock:
+            if key in self.entries:
+                self._remove(key, "replace")
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.counters["rejections"] += 1
+                return False
+
+            self.entries[key] = (signature, manifest, size)
+            self.size += size
+
+            while self.entries and (
+                (self.max_entries is not None and len(self.entries) > self.max_entries)
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._remove(next(iter(self.entries)), "evict")
+                self.counters["evictions"] += 1
+
+            return True
+
+    def invalidate(self, key):
+        """
+        Remove a registered manifest, like when its source has been rebuilt.
+
+        Arguments:
+            key (object): Manifest key.
+
+        Returns:
+            bool: ``True`` if a manifest was registered for this key.
+        """
+        with self._lock:
+            if key not in self.entries:
+                return False
+
+            self._remove(key, "invalidate")
+            self.counters["invalidations"] += 1
+
+            return True
+
+    def clear(self):
+        """
+        Remove every registered manifests.
+        """
+        with self._lock:
+            for key in list(self.entries):
+                self._remove(key, "invalidate")
+                self.counters["invalidations"] += 1
+
+    def stats(self):
+        """
+        Return registry statistics.
+
+        Returns:
+            collections.OrderedDict: Items ``entries`` (number of registered
+            manifests), ``size`` (their estimated size in bytes) and every
+            counters.
+        """
+        with self._lock:
+            stats = OrderedDict((("entries", len(self.entries)), ("size", self.size)))
+            stats.update(self.counters)
+
+            return stats
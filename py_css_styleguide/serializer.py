@@ -6,20 +6,30 @@ Serializer
 import ast
 import datetime
 import json
+import re
 
 from collections import OrderedDict
 from warnings import warn
 
 from .nomenclature import (
+    CUSTOM_PROPERTY_PATTERN,
     RULE_META_REFERENCES,
     RULE_META_COMPILER,
     RULE_REFERENCE,
     REFERENCE_STRUCTURES,
     is_valid_rule,
     is_valid_property,
+    is_wanted_reference,
 )
 
-from .exceptions import SerializerError, StyleguideUserWarning
+from .splitview import SplitMapping, SplitView
+from .stats import ManifestStats
+from .exceptions import (
+    SerializerError,
+    SerializerErrors,
+    StyleguideUserWarning,
+    StyleguideValidationError,
+)
 
 
 class ManifestSerializer(object):
@@ -37,10 +47,31 @@ class ManifestSerializer(object):
             evaluation to avoid possibly Python crash with very large string to evaluate
             with ``ast.literal_eval`` (see Python documentation for detail). Default to
             ``ManifestSerializer._DEFAULT_EVALUATION_LIMIT``.
+        collect_diagnostics (boolean): If enabled, deprecation and truncation
+            warnings are not emitted for each reference, instead they are collected
+            during serialization then emitted once for each kind at the end of
+            ``ManifestSerializer.serialize()``. Default to ``False``.
+        lazy_split (boolean): If enabled, values split on white spaces are returned
+            as a ``splitview.SplitView`` instead of a list and a flat structure
+            from such values is returned as a ``splitview.SplitMapping`` instead of
+            a dictionnary. These views only store item offsets over the original
+            string. Default to ``False``.
+        stats (py_css_styleguide.stats.ManifestStats): Optional recorder for
+            serialization phase and reference durations. Default to ``None`` to not
+            record anything.
+        only (list): If not empty, only these enabled references are serialized.
+            Other references are not serialized nor listed in metas.
+        exclude (list): Enabled references to not serialize nor list in metas.
 
     Attributes:
         _metas (collections.OrderedDict): Buffer to store serialized metas
             from parsed source.
+        _diagnostics (collections.OrderedDict): Buffer to store reference names
+            for each collected diagnostic kind.
+        diagnostics (list): List of collected diagnostics from the last
+            serialization. Each item is a dictionnary with items ``kind``,
+            ``message`` and ``references``. It is always empty if
+            ``collect_diagnostics`` is disabled.
         _DEFAULT_SPLITTER (string): Default value splitter used for some
             structure kinds.
         _DEFAULT_CLEANER (string): Default cleaner name.
@@ -48,18 +79,53 @@ class ManifestSerializer(object):
         _DEFAULT_EVALUATION_LIMIT (int): Default limit of string character length for
             evaluation. It has been set to 1000 characters which should be a
             reasonnable large limit in our context.
+        _DIAGNOSTIC_MESSAGES (dict): Aggregated message template for each
+            diagnostic kind.
     """
 
     _DEFAULT_SPLITTER = "white-space"
     _DEFAULT_CLEANER = "none"
     _DEFAULT_COMPILER_SUPPORT = "libsass"
     _DEFAULT_EVALUATION_LIMIT = 1000
-
-    def __init__(self, compiler_support=None, evaluation_limit=None):
+    _DIAGNOSTIC_MESSAGES = {
+        "deprecated-splitter": (
+            "{count} reference(s) use deprecated '--splitter: \"json-list\";', "
+            "change it to '--splitter: \"object-list\";' instead: {refs}"
+        ),
+        "deprecated-structure": (
+            "{count} reference(s) use deprecated '--structure: \"json\";', change "
+            "it to '--structure: \"object-complex\";' instead: {refs}"
+        ),
+        "evaluation-limit": (
+            "{count} reference(s) have a string value length that is over the "
+            "evaluation limit ({limit}). They have been truncated and may leads to "
+            "errors or unexpected results. Either you upgrade the limit or ensure "
+            "your string values keeps below the limit: {refs}"
+        ),
+    }
+
+    def __init__(self, compiler_support=None, evaluation_limit=None,
+                 collect_diagnostics=False, lazy_split=False, stats=None,
+                 only=None, exclude=None):
         self.compiler_support = compiler_support or self._DEFAULT_COMPILER_SUPPORT
         self.evaluation_limit = evaluation_limit or self._DEFAULT_EVALUATION_LIMIT
+        self.collect_diagnostics = collect_diagnostics
+        self.lazy_split = lazy_split
+        self.stats = stats
+        self.only = frozenset(only or [])
+        self.exclude = frozenset(exclude or [])
 
         self._metas = OrderedDict({"compiler_support": self.compiler_support})
+        self._diagnostics = OrderedDict()
+        self.diagnostics = []
+
+    def __getstate__(self):
+        # Recorder is not sent to process pool workers since it may hold hooks which
+        # can not be pickled, workers return reference durations instead
+        state = self.__dict__.copy()
+        state["stats"] = None
+
+        return state
 
     def get_ref_varname(self, name):
         """
@@ -77,6 +143,50 @@ class ManifestSerializer(object):
         """
         return "-".join((RULE_REFERENCE, name))
 
+    def add_diagnostic(self, kind, name):
+        """
+        Collect a diagnostic for a reference.
+
+        A reference is recorded only once for each diagnostic kind and nothing is
+        formatted at this point, it is deferred to
+        ``ManifestSerializer.flush_diagnostics()``.
+
+        Arguments:
+            kind (string): Diagnostic kind name, it must be an item from
+                ``ManifestSerializer._DIAGNOSTIC_MESSAGES``.
+            name (string): Reference name.
+        """
+        self._diagnostics.setdefault(kind, OrderedDict())[name] = True
+
+    def flush_diagnostics(self):
+        """
+        Build the diagnostics list from collected diagnostics and emit a single
+        warning for each diagnostic kind.
+
+        Returns:
+            list: List of diagnostics, also stored in attribute
+            ``ManifestSerializer.diagnostics``.
+        """
+        self.diagnostics = []
+
+        for kind, names in self._diagnostics.items():
+            references = list(names.keys())
+            message = self._DIAGNOSTIC_MESSAGES[kind].format(
+                count=len(references),
+                limit=self.evaluation_limit,
+                refs=", ".join([self.get_ref_varname(item) for item in references]),
+            )
+            self.diagnostics.append(OrderedDict((
+                ("kind", kind),
+                ("message", message),
+                ("references", references),
+            )))
+            warn(message, StyleguideUserWarning)
+
+        self._diagnostics = OrderedDict()
+
+        return self.diagnostics
+
     def limit_evaluation_string(self, name, value):
         """
         Truncate given string value to the string evaluation length limit.
@@ -96,7 +206,9 @@ class ManifestSerializer(object):
             return value
 
         # If string is over the limit, emit a warning.
-        if len(value) > self.evaluation_limit:
+        if len(value) > self.evaluation_limit and self.collect_diagnostics:
+            self.add_diagnostic("evaluation-limit", name)
+        elif len(value) > self.evaluation_limit:
             message = (
                 "Reference '{ref}' has a string value length that is over the "
                 "evaluation limit ({limit}). It has been truncated and may leads to "
@@ -135,7 +247,9 @@ class ManifestSerializer(object):
             cleaner (string):
 
         Returns:
-            list: List of values parsed from given original JSON list.
+            list or splitview.SplitView: List of values parsed from given original
+            JSON list. Values split on white spaces are returned as a
+            ``splitview.SplitView`` if ``ManifestSerializer.lazy_split`` is enabled.
         """
         items = []
         cleaner = cleaner or self._DEFAULT_CLEANER
@@ -147,7 +261,9 @@ class ManifestSerializer(object):
         # Split items using evaluation (JSON or Python depending compiler)
         if mode == "object-list" or mode == "json-list":
             #  Until deprecated mode name is removed, warn about its usage
-            if mode == "json-list":
+            if mode == "json-list" and self.collect_diagnostics:
+                self.add_diagnostic("deprecated-splitter", name)
+            elif mode == "json-list":
                 message = (
                     "Reference '{ref}' use deprecated '--splitter: \"json-list\";', "
                     "change it to '--splitter: \"object-list\";' instead."
@@ -167,7 +283,8 @@ class ManifestSerializer(object):
                         "splitting values from '{prop}': {err}'"
                     )
                     raise SerializerError(
-                        msg.format(ref=self.get_ref_varname(name), prop=prop, err=e)
+                        msg.format(ref=self.get_ref_varname(name), prop=prop, err=e),
+                        prop=prop,
                     )
             # Evaluate string as JSON for Libsass compiler
             else:
@@ -179,7 +296,8 @@ class ManifestSerializer(object):
                         "splitting values from '{prop}': {err}'"
                     )
                     raise SerializerError(
-                        msg.format(ref=self.get_ref_varname(name), prop=prop, err=e)
+                        msg.format(ref=self.get_ref_varname(name), prop=prop, err=e),
+                        prop=prop,
                     )
 
             # Clean leading and ending whitespaces
@@ -194,6 +312,8 @@ class ManifestSerializer(object):
                 items = cleaned
 
         # Default splitter on whitespaces
+        elif self.lazy_split:
+            items = SplitView(value, cleaner=cleaner)
         else:
             if len(value) > 0:
                 # Ignore multiple whitespaces
@@ -225,7 +345,7 @@ class ManifestSerializer(object):
                 "String reference '{}' lacks of required 'value' variable "
                 "or is empty"
             )
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="value")
 
         return value
 
@@ -254,7 +374,7 @@ class ManifestSerializer(object):
                 "Number reference '{}' lacks of required 'value' variable "
                 "or is empty"
             )
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="value")
 
         try:
             value = int(value)
@@ -266,7 +386,7 @@ class ManifestSerializer(object):
                     "Number reference '{}' value is either not a valid integer or "
                     "valid float or is empty: {}"
                 )
-                raise SerializerError(msg.format(name, value))
+                raise SerializerError(msg.format(name, value), prop="value")
 
         return value
 
@@ -285,7 +405,8 @@ class ManifestSerializer(object):
             datas (dict): Datas to serialize.
 
         Returns:
-            dict: Flat dictionnay of serialized reference datas.
+            dict or splitview.SplitMapping: Flat dictionnay of serialized reference
+            datas.
         """
         keys = datas.get("keys", None)
         values = datas.get("values", None)
@@ -294,7 +415,7 @@ class ManifestSerializer(object):
 
         if not keys:
             msg = "Flat reference '{}' lacks of required 'keys' variable or is empty"
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="keys")
         else:
             keys = self.value_splitter(
                 name,
@@ -308,7 +429,7 @@ class ManifestSerializer(object):
             msg = (
                 "Flat reference '{}' lacks of required 'values' variable or is empty"
             )
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="values")
         else:
             values = self.value_splitter(
                 name,
@@ -323,11 +444,17 @@ class ManifestSerializer(object):
                 "Flat reference '{name}' has different lengths for 'keys' ({klength}) "
                 "and 'values' ({vlength}) variables"
             )
-            raise SerializerError(msg.format(
-                name=name,
-                klength=len(keys),
-                vlength=len(values),
-            ))
+            raise SerializerError(
+                msg.format(
+                    name=name,
+                    klength=len(keys),
+                    vlength=len(values),
+                ),
+                prop="values",
+            )
+
+        if isinstance(keys, SplitView) and isinstance(values, SplitView):
+            return SplitMapping(keys, values)
 
         return OrderedDict(zip(keys, values))
 
@@ -354,7 +481,7 @@ class ManifestSerializer(object):
             msg = (
                 "List reference '{}' lacks of required 'items' variable or is empty"
             )
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="items")
         else:
             items = self.value_splitter(
                 name, "items",
@@ -386,7 +513,7 @@ class ManifestSerializer(object):
             msg = (
                 "Nested reference '{}' lacks of required 'keys' variable or is empty"
             )
-            raise SerializerError(msg.format(name))
+            raise SerializerError(msg.format(name), prop="keys")
         else:
             keys = self.value_splitter(
                 name,
@@ -407,7 +534,7 @@ class ManifestSerializer(object):
             if k not in ("keys", "structure", "splitter", "cleaner"):
                 values = self.value_splitter(
                     name,
-                    "values",
+                    k,
                     v,
                     mode=splitter,
                     cleaner=cleaner
@@ -418,12 +545,15 @@ class ManifestSerializer(object):
                         "Nested reference '{name}' has different length for values "
                         "({vlength}) of '{prop}' and 'keys' ({klength})"
                     )
-                    raise SerializerError(msg.format(
-                        name=name,
+                    raise SerializerError(
+                        msg.format(
+                            name=name,
+                            prop=k,
+                            klength=len(keys),
+                            vlength=len(values),
+                        ),
                         prop=k,
-                        klength=len(keys),
-                        vlength=len(values),
-                    ))
+                    )
 
                 # Put each value to its respective key using position index.
                 for i, item in enumerate(values):
@@ -448,7 +578,9 @@ class ManifestSerializer(object):
 
         if data_object is None:
             msg = "JSON reference '{refname}' lacks of required 'object' variable"
-            raise SerializerError(msg.format(refname=self.get_ref_varname(name)))
+            raise SerializerError(
+                msg.format(refname=self.get_ref_varname(name)), prop="object"
+            )
 
         if compiler_support == "dartsass":
             try:
@@ -461,7 +593,8 @@ class ManifestSerializer(object):
                 raise SerializerError(
                     msg.format(
                         ref=self.get_ref_varname(name), values=data_object, err=e
-                    )
+                    ),
+                    prop="object",
                 )
             else:
                 return content
@@ -471,7 +604,8 @@ class ManifestSerializer(object):
             except json.JSONDecodeError as e:
                 msg = "JSON reference '{refname}' raised error from JSON decoder: {err}"
                 raise SerializerError(
-                    msg.format(refname=self.get_ref_varname(name), err=e)
+                    msg.format(refname=self.get_ref_varname(name), err=e),
+                    prop="object",
                 )
             else:
                 return content
@@ -488,11 +622,17 @@ class ManifestSerializer(object):
         Returns:
             object: Object depending from content.
         """
-        message = (
-            "Reference '{ref}' use deprecated '--structure: \"json\";', change it to "
-            "'--structure: \"object-complex\";' instead."
-        )
-        warn(message.format(ref=self.get_ref_varname(name)), StyleguideUserWarning)
+        if self.collect_diagnostics:
+            self.add_diagnostic("deprecated-structure", name)
+        else:
+            message = (
+                "Reference '{ref}' use deprecated '--structure: \"json\";', change "
+                "it to '--structure: \"object-complex\";' instead."
+            )
+            warn(
+                message.format(ref=self.get_ref_varname(name)), StyleguideUserWarning
+            )
+
         return self.serialize_to_complex(name, datas)
 
     def get_meta_compiler(self, datas):
@@ -531,6 +671,27 @@ class ManifestSerializer(object):
         If both of these variables are defined, only the manual enable mode "--names" is
         used.
 
+        Arguments:
+            datas (dict): Data where to search for meta references declaration.
+                This is commonly the fully parsed manifest.
+
+        Returns:
+            list: A list of reference names.
+        """
+        names = self.get_meta_reference_candidates(datas)
+
+        for item in names:
+            is_valid_rule(item)
+
+        return names
+
+    def get_meta_reference_candidates(self, datas):
+        """
+        Get enabled reference declarations without to validate their names.
+
+        See ``ManifestSerializer.get_meta_reference_names()`` for details about
+        enabling modes.
+
         Arguments:
             datas (dict): Data where to search for meta references declaration.
                 This is commonly the fully parsed manifest.
@@ -564,9 +725,6 @@ class ManifestSerializer(object):
                 )
                 raise SerializerError(msg.format(RULE_META_REFERENCES))
 
-        for item in names:
-            is_valid_rule(item)
-
         return names
 
     def get_reference(self, datas, name):
@@ -605,12 +763,14 @@ class ManifestSerializer(object):
                 structure_mode = properties["structure"]
             else:
                 msg = "Invalid structure mode name '{}' for reference '{}'"
-                raise SerializerError(msg.format(properties["structure"], name))
+                raise SerializerError(
+                    msg.format(properties["structure"], name), prop="structure"
+                )
             # Clean structure from props so it does not trigger validation
             del properties["structure"]
         else:
             msg = "Structure variable '--structure' is missing from reference '{}'"
-            raise SerializerError(msg.format(rule_name))
+            raise SerializerError(msg.format(rule_name), prop="structure")
 
         # Validate variable names
         for item in properties.keys():
@@ -637,6 +797,226 @@ class ManifestSerializer(object):
 
         return context
 
+    def get_timed_reference(self, datas, name):
+        """
+        Get serialized reference datas with its serialization duration.
+
+        Arguments:
+            datas (dict): Data where to search for reference declaration.
+            name (string): Reference name to get and serialize.
+
+        Returns:
+            tuple: Serialized reference datas and its serialization duration in
+            seconds.
+        """
+        start = ManifestStats.clock()
+        reference = self.get_reference(datas, name)
+
+        return reference, ManifestStats.clock() - start
+
+    def serialize_custom_properties(self, properties,
+                                    pattern=CUSTOM_PROPERTY_PATTERN):
+        """
+        Group custom properties into references with a naming pattern.
+
+        Every reference is a flat structure of keys and values. Custom properties
+        which do not match the pattern are ignored.
+
+        Only references are returned, metas are assigned to attribute
+        ``ManifestSerializer._metas``, there is no compiler support in metas since
+        custom properties do not need any compiler helper.
+
+        Arguments:
+            properties (dict): Custom property values, commonly from
+                ``TinycssSourceParser.consume_custom_properties()``.
+
+        Keyword Arguments:
+            pattern (string or re.Pattern): Regex pattern to match property names,
+                it must define named groups ``reference`` and ``key``. Default to
+                ``nomenclature.CUSTOM_PROPERTY_PATTERN``.
+
+        Raises:
+            StyleguideValidationError: If a reference name is invalid or reserved.
+
+        Returns:
+            collections.OrderedDict: Serialized references datas.
+        """
+        if self.stats is not None:
+            start = self.stats.clock()
+
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        references = OrderedDict()
+        for name, value in properties.items():
+            match = regex.match(name)
+            if match is None:
+                continue
+
+            reference = match.group("reference")
+            if reference not in references:
+                is_valid_rule(reference)
+                references[reference] = OrderedDict()
+
+            references[reference][match.group("key")] = value
+
+        self._metas = OrderedDict({
+                "references": list(references.keys()),
+                "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        })
+
+        if self.stats is not None:
+            self.stats.add_phase("serialize.references", start)
+
+        return references
+
+    def get_validation_error(self, error, positions, rule_name, name=None, prop=None):
+        """
+        Build a validation error report item.
+
+        Arguments:
+            error (Exception): The raised exception to report.
+            positions (dict): Source positions as collected from parser
+                ``TinycssSourceParser.positions``.
+            rule_name (string): Name of the manifest rule where the error occured.
+
+        Keyword Arguments:
+            name (string): Reference name involved in error if any.
+            prop (string): Property name involved in error if any.
+
+        Returns:
+            collections.OrderedDict: Error report with items ``reference``,
+            ``property``, ``kind``, ``message``, ``line`` and ``column``. Line and
+            column are ``None`` if the position is unknown.
+        """
+        position = {}
+        rule = positions.get(rule_name, None)
+
+        if rule:
+            position = rule["properties"].get(prop, None) or rule
+
+        return OrderedDict((
+            ("reference", name),
+            ("property", prop),
+            ("kind", type(error).__name__),
+            ("message", str(error)),
+            ("line", position.get("line", None)),
+            ("column", position.get("column", None)),
+        ))
+
+    def validate_reference(self, datas, name, positions=None):
+        """
+        Validate a reference and collect all of its errors.
+
+        Every property names are validated then reference is serialized (without
+        the invalid properties) to find possible serialization errors. Given datas
+        are not modified.
+
+        Arguments:
+            datas (dict): Data where to search for reference declaration. This
+                is commonly the fully parsed manifest.
+            name (string): Reference name to validate.
+
+        Keyword Arguments:
+            positions (dict): Optional source positions as collected from parser
+                ``TinycssSourceParser.positions``.
+
+        Returns:
+            list: List of error reports as returned from
+            ``ManifestSerializer.get_validation_error()``.
+        """
+        positions = positions or {}
+        rule_name = self.get_ref_varname(name)
+        errors = []
+
+        if rule_name not in datas:
+            msg = "Unable to find enabled reference name '{}'"
+            return [
+                self.get_validation_error(
+                    SerializerError(msg.format(name)),
+                    positions,
+                    RULE_META_REFERENCES,
+                    name=name,
+                )
+            ]
+
+        properties = OrderedDict()
+        for item, value in datas[rule_name].items():
+            if item != "structure":
+                try:
+                    is_valid_property(item)
+                except StyleguideValidationError as e:
+                    errors.append(
+                        self.get_validation_error(
+                            e, positions, rule_name, name=name, prop=item
+                        )
+                    )
+                    continue
+
+            properties[item] = value
+
+        try:
+            self.get_reference({rule_name: properties}, name)
+        except (SerializerError, StyleguideValidationError) as e:
+            errors.append(
+                self.get_validation_error(
+                    e, positions, rule_name, name=name, prop=getattr(e, "prop", None)
+                )
+            )
+
+        return errors
+
+    def validate(self, datas, positions=None):
+        """
+        Validate datas and collect every errors instead of stopping on the first one.
+
+        Opposed to ``ManifestSerializer.serialize()`` this does not raise any
+        exception for invalid metas or references, every error is collected to
+        report them all at once.
+
+        Arguments:
+            datas (dict): Data where to search for reference declarations. This
+                is commonly the fully parsed manifest.
+
+        Keyword Arguments:
+            positions (dict): Optional source positions as collected from parser
+                ``TinycssSourceParser.positions``. If given, error reports will
+                include their line and column from source.
+
+        Returns:
+            list: List of error reports as returned from
+            ``ManifestSerializer.get_validation_error()``. The list is empty if
+            there is no error.
+        """
+        positions = positions or {}
+        errors = []
+
+        self._metas = OrderedDict({
+            "compiler_support": self.get_meta_compiler(datas),
+        })
+
+        try:
+            names = self.get_meta_reference_candidates(datas)
+        except SerializerError as e:
+            return [self.get_validation_error(e, positions, RULE_META_REFERENCES)]
+
+        names_prop = (
+            "names" if datas[RULE_META_REFERENCES].get("names", None) else "auto"
+        )
+
+        for name in names:
+            try:
+                is_valid_rule(name)
+            except StyleguideValidationError as e:
+                errors.append(
+                    self.get_validation_error(
+                        e, positions, RULE_META_REFERENCES, name=name, prop=names_prop
+                    )
+                )
+            else:
+                errors.extend(self.validate_reference(datas, name, positions))
+
+        return errors
+
     def get_available_references(self, datas):
         """
         Get available manifest reference names.
@@ -662,7 +1042,7 @@ class ManifestSerializer(object):
 
         return names
 
-    def get_enabled_references(self, datas, meta_references):
+    def get_enabled_references(self, datas, meta_references, executor=None):
         """
         Get enabled manifest references declarations.
 
@@ -674,17 +1054,62 @@ class ManifestSerializer(object):
                 This is commonly the fully parsed manifest.
             meta_references (list): List of enabled reference names.
 
+        Keyword Arguments:
+            executor (concurrent.futures.Executor): Optional executor used to
+                serialize references concurrently. See
+                ``ManifestSerializer.serialize()`` for details.
+
         Returns:
             collections.OrderedDict: Serialized enabled references datas.
         """
         references = OrderedDict()
 
+        if executor is None:
+            for section in meta_references:
+                if self.stats is None:
+                    references[section] = self.get_reference(datas, section)
+                else:
+                    references[section], duration = self.get_timed_reference(
+                        datas, section
+                    )
+                    self.stats.add_reference(section, duration)
+
+            return references
+
+        getter = self.get_reference if self.stats is None else self.get_timed_reference
+
+        # Only give its own rule to each job so a process pool does not have to
+        # pickle the whole manifest for every reference
+        jobs = OrderedDict()
         for section in meta_references:
-            references[section] = self.get_reference(datas, section)
+            rule_name = self.get_ref_varname(section)
+            rule = {rule_name: datas[rule_name]} if rule_name in datas else {}
+            jobs[section] = executor.submit(getter, rule, section)
+
+        # Results are collected in the enabled references order and every error is
+        # kept to be raised at once
+        errors = []
+        for section, job in jobs.items():
+            try:
+                if self.stats is None:
+                    references[section] = job.result()
+                else:
+                    references[section], duration = job.result()
+                    self.stats.add_reference(section, duration)
+            except (SerializerError, StyleguideValidationError) as e:
+                errors.append(str(e))
+
+        if errors:
+            raise SerializerErrors(
+                "Unable to serialize manifest due to {} reference error(s)".format(
+                    len(errors)
+                ),
+                error_payload=errors,
+            )
 
         return references
 
-    def serialize(self, datas):
+    def serialize(self, datas, executor=None):
         """
         Serialize datas to manifest structure with metas and references.
 
@@ -695,13 +1120,57 @@ class ManifestSerializer(object):
             datas (dict): Data where to search for reference declarations. This
                 is commonly the fully parsed manifest.
 
+        Keyword Arguments:
+            executor (concurrent.futures.Executor): Optional executor (like a
+                ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor``) to serialize
+                references concurrently. Returned references keep the enabled
+                references order and instead of stopping on the first error, every
+                reference error is collected and raised at once with a
+                ``SerializerErrors`` exception. Note than with a process pool,
+                warnings emitted and diagnostics collected from workers are not
+                forwarded to the main process.
+                Default is ``None`` to serialize references one after another.
+
+        Raises:
+            SerializerErrors: Only with an executor when one or more references
+                failed to serialize, the exception attribute ``error_payload``
+                contains the error message of each failed reference.
+
         Returns:
             collections.OrderedDict: Serialized enabled references datas.
         """
+        if self.stats is not None:
+            start = self.stats.clock()
+
+        names = self.get_meta_reference_names(datas)
+        if self.only or self.exclude:
+            names = [
+                name
+                for name in names
+                if is_wanted_reference(name, self.only, self.exclude)
+            ]
+
         self._metas = OrderedDict({
                 "compiler_support": self.get_meta_compiler(datas),
-                "references": self.get_meta_reference_names(datas),
+                "references": names,
                 "created": datetime.datetime.now().isoformat(timespec="seconds"),
         })
 
-        return self.get_enabled_references(datas, self._metas["references"])
+        self._diagnostics = OrderedDict()
+        self.diagnostics = []
+
+        if self.stats is not None:
+            self.stats.add_phase("serialize.metas", start)
+            start = self.stats.clock()
+
+        references = self.get_enabled_references(
+            datas, self._metas["references"], executor=executor
+        )
+
+        if self.stats is not None:
+            self.stats.add_phase("serialize.references", start)
+
+        if self.collect_diagnostics:
+            self.flush_diagnostics()
+
+        return references
@@ -0,0 +1,188 @@
+"""
+Shared manifest
+===============
+
+Store a packed manifest (see ``packed``) in a ``multiprocessing.shared_memory``
+segment so every worker process reads the same memory pages.
+
+With preforked workers (like Gunicorn ones), a manifest loaded before forking is
+copied in each worker as soon as its objects are touched, because reference
+counting writes into their memory pages. A shared manifest only holds a buffer on
+the segment: references are decoded in a worker when they are reached, so memory
+used for each worker stays small whatever the number of workers is.
+
+Commonly the master process creates the segment once: ::
+
+    from py_css_styleguide.model import Manifest
+    from py_css_styleguide.shared import SharedManifest
+
+    manifest = Manifest()
+    manifest.load_file("styleguide_manifest.css")
+    shared = SharedManifest.create(manifest, name="styleguide")
+
+Then workers, either forked or started apart, attach to it read only: ::
+
+    shared = SharedManifest.attach("styleguide")
+    shared.manifest.palette
+
+The process which created the segment is its owner and should ``unlink()`` it
+when it stops.
+"""
+import mmap
+import os
+
+from multiprocessing import shared_memory
+
+try:
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+
+from .packed import PackedManifest, pack_manifest
+
+
+class _UntrackedSharedMemory(shared_memory.SharedMemory):
+    """
+    Shared memory segment attached without to be registered to the resource
+    tracker.
+
+    Before Python 3.13 every attached segment is registered to the resource tracker
+    which would remove it when the attaching process stops. It can not be
+    unregistered after since a tracker shared with the owner would forget the owner
+    registration, so this opens segment like ``SharedMemory`` does on POSIX systems
+    without to register it.
+
+    Arguments:
+        name (string): Segment name.
+    """
+
+    def __init__(self, name):
+        self._name = "/" + name
+        self._fd = _posixshmem.shm_open(self._name, os.O_RDWR, mode=self._mode)
+
+        try:
+            self._size = os.fstat(self._fd).st_size
+            self._mmap = mmap.mmap(self._fd, self._size)
+        except OSError:
+            self.close()
+            raise
+
+        self._buf = memoryview(self._mmap)
+
+    def __reduce__(self):
+        return (self.__class__, (self.name,))
+
+
+class SharedManifest(object):
+    """
+    A packed manifest in a shared memory segment.
+
+    You should not create it directly, use ``create()`` or ``attach()``.
+
+    Arguments:
+        segment (multiprocessing.shared_memory.SharedMemory): Shared memory
+            segment with a packed manifest.
+
+    Keyword Arguments:
+        owner (boolean): If the segment has been created from this object.
+
+    Attributes:
+        segment (multiprocessing.shared_memory.SharedMemory): Shared memory
+            segment.
+        owner (boolean): If the segment has been created from this object.
+        manifest (py_css_styleguide.packed.PackedManifest): Read only manifest
+            decoded from segment.
+    """
+
+    def __init__(self, segment, owner=False):
+        self.segment = segment
+        self.owner = owner
+        self.manifest = PackedManifest(segment.buf)
+
+    @property
+    def name(self):
+        """
+        Segment name to give to ``attach()``.
+
+        Returns:
+            string: Segment name.
+        """
+        return self.segment.name
+
+    @classmethod
+    def create(cls, manifest, name=None):
+        """
+        Pack a manifest into a new shared memory segment.
+
+        Arguments:
+            manifest (py_css_styleguide.model.Manifest): Manifest to store, it may
+                be a ``FrozenManifest``.
+
+        Keyword Arguments:
+            name (string): Segment name. Default to ``None`` for a random name.
+
+        Raises:
+            FileExistsError: If a segment already exists with the same name.
+
+        Returns:
+            SharedManifest: Shared manifest which owns the segment.
+        """
+        content = pack_manifest(manifest)
+
+        segment = shared_memory.SharedMemory(
+            name=name, create=True, size=len(content)
+        )
+        segment.buf[:len(content)] = content
+
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to an existing shared memory segment.
+
+        Attached segment is not tracked for cleanup, so it is not removed when
+        the attaching process stops, only its owner can remove it.
+
+        Arguments:
+            name (string): Segment name.
+
+        Raises:
+            FileNotFoundError: If there is no segment with this name.
+            py_css_styleguide.exceptions.PackedManifestError: If segment does not
+                hold a packed manifest.
+
+        Returns:
+            SharedManifest: Shared manifest attached to the segment.
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Resource tracker is only used on POSIX systems
+            if _posixshmem is None:
+                segment = shared_memory.SharedMemory(name=name)
+            else:
+                segment = _UntrackedSharedMemory(name)
+
+        try:
+            return cls(segment)
+        except Exception:
+            segment.close()
+            raise
+
+    def close(self):
+        """
+        Close access to the segment from this process.
+
+        Manifest references which have not been reached yet are not available
+        anymore.
+        """
+        self.manifest.release()
+        self.segment.close()
+
+    def unlink(self):
+        """
+        Close and remove the segment, only its owner should do it.
+        """
+        self.close()
+        self.segment.unlink()
@@ -0,0 +1,149 @@
+"""
+Split views
+===========
+
+Lightweight read only structures over an original string value, they are used by
+serializer instead of lists and dictionnaries when option ``lazy_split`` is enabled.
+
+Only item offsets are stored and items are sliced from the original string when
+they are reached, so a reference with many items does not hold every item string
+twice (once in parsed datas and once in serialized datas).
+
+These structures behave like a list or a dictionnary for templates and comparisons,
+however the ``json`` module is not able to encode them directly, you will need to
+use ``json_default`` as the ``default`` argument of ``json.dump()`` or
+``json.dumps()``.
+"""
+import re
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+
+WHITESPACES_ITEM_REGEX = re.compile(r"\S+")
+"""
+Regex to match items between whitespaces
+"""
+
+
+class SplitView(Sequence):
+    """
+    Read only sequence of the items from a string split on whitespaces.
+
+    Arguments:
+        value (string): Original string to split.
+
+    Keyword Arguments:
+        cleaner (string): If value is ``whitespaces``, multiple whitespaces are
+            ignored like with ``str.split()``. Else every single white space is a
+            separator like with ``str.split(" ")``. Default to ``None``.
+    """
+
+    __slots__ = ("_value", "_offsets")
+
+    def __init__(self, value, cleaner=None):
+        self._value = value
+        # Smaller offsets are enough for any string under 4GB
+        self._offsets = array("I" if len(value) < 2 ** 32 else "Q")
+
+        if not value:
+            return
+
+        # Ignore multiple whitespaces
+        if cleaner == "whitespaces":
+            for match in WHITESPACES_ITEM_REGEX.finditer(value):
+                self._offsets.extend(match.span())
+        # Keep every whitespaces
+        else:
+            start = 0
+            end = value.find(" ")
+            while end != -1:
+                self._offsets.append(start)
+                self._offsets.append(end)
+                start = end + 1
+                end = value.find(" ", start)
+
+            self._offsets.append(start)
+            self._offsets.append(len(value))
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("SplitView index out of range")
+
+        return self._value[self._offsets[index * 2]:self._offsets[index * 2 + 1]]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+
+class SplitMapping(Mapping):
+    """
+    Read only mapping of keys to values from two split views.
+
+    Keys are indexed once to be able to get items, values are only sliced when they
+    are reached. Like with a dictionnary built from ``zip(keys, values)``, a
+    duplicated key keeps its first position with its last value.
+
+    Arguments:
+        keys (SplitView): Split view of keys.
+        values (SplitView): Split view of values, it must have the same length than
+            keys.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, keys, values):
+        self._index = {key: i for i, key in enumerate(keys)}
+        self._values = values
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
+
+
+def json_default(obj):
+    """
+    Turn split views to their builtin type so they can be encoded by ``json``.
+
+    Arguments:
+        obj (object): Object that ``json`` was not able to encode.
+
+    Returns:
+        list or dict: List for a ``SplitView`` or dictionnary for a
+        ``SplitMapping``.
+    """
+    if isinstance(obj, SplitView):
+        return list(obj)
+    elif isinstance(obj, SplitMapping):
+        return dict(obj.items())
+
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__)
+    )
@@ -0,0 +1,107 @@
+"""
+Statistics
+==========
+
+Durations recorder to instrument manifest loading.
+
+A recorder is only created when statistics are requested, when they are not,
+instrumented code only checks for a ``None`` value so the overhead is close to
+nothing.
+
+Recorded phases are:
+
+``read``
+    Reading source content from a string or a file-like object;
+``parse``
+    Whole parsing with ``TinycssSourceParser``;
+``parse.tokenize``
+    Tokenizing source with tinycss2;
+``parse.rules``
+    Filtering styleguide rules and digesting their properties;
+``serialize``
+    Whole serialization with ``ManifestSerializer``;
+``serialize.metas``
+    Serializing metas;
+``serialize.references``
+    Serializing every enabled references, duration of each reference is recorded
+    apart;
+``attributes``
+    Setting serialized references as manifest attributes;
+``load``
+    Whole manifest loading.
+
+Durations are in seconds.
+"""
+import time
+
+from collections import OrderedDict
+
+
+class ManifestStats(object):
+    """
+    Record phase and reference durations.
+
+    Keyword Arguments:
+        hooks (list): Optional list of callables to forward every recorded duration,
+            for example to a metrics system. Each hook is called with arguments
+            ``kind`` (either ``phase`` or ``reference``), ``name`` and ``duration``.
+            Hooks are always called from the process and thread which record
+            durations.
+
+    Attributes:
+        phases (collections.OrderedDict): Duration for each phase name, in recording
+            order.
+        references (collections.OrderedDict): Serialization duration for each
+            reference name.
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, hooks=None):
+        self.hooks = list(hooks or [])
+        self.phases = OrderedDict()
+        self.references = OrderedDict()
+
+    def _forward(self, kind, name, duration):
+        for hook in self.hooks:
+            hook(kind, name, duration)
+
+    def add_phase(self, name, start):
+        """
+        Record a phase duration.
+
+        Arguments:
+            name (string): Phase name.
+            start (float): Phase start time as returned by ``ManifestStats.clock()``.
+
+        Returns:
+            float: Phase duration.
+        """
+        duration = self.clock() - start
+        self.phases[name] = duration
+        self._forward("phase", name, duration)
+
+        return duration
+
+    def add_reference(self, name, duration):
+        """
+        Record a reference serialization duration.
+
+        Arguments:
+            name (string): Reference name.
+            duration (float): Serialization duration.
+        """
+        self.references[name] = duration
+        self._forward("reference", name, duration)
+
+    def to_dict(self):
+        """
+        Return recorded durations.
+
+        Returns:
+            collections.OrderedDict: Items ``phases`` and ``references``.
+        """
+        return OrderedDict((
+            ("phases", OrderedDict(self.phases)),
+            ("references", OrderedDict(self.references)),
+        ))
@@ -0,0 +1,113 @@
+import json
+import logging
+
+from click.testing import CliRunner
+
+from py_css_styleguide.cli.entrypoint import cli_frontend
+from py_css_styleguide.logger import HANDLER_NAME, JsonLinesFormatter, init_logger
+
+
+def get_named_handlers(logger):
+    return [item for item in logger.handlers if item.get_name() == HANDLER_NAME]
+
+
+def test_init_logger_idempotent():
+    """
+    Logger initialization should replace its previous handler instead of adding
+    another one.
+    """
+    logger = init_logger("py-css-styleguide-test", "INFO", printout=False)
+    first = get_named_handlers(logger)
+
+    logger = init_logger("py-css-styleguide-test", "DEBUG", printout=False)
+    second = get_named_handlers(logger)
+
+    assert len(first) == 1
+    assert len(second) == 1
+    assert first[0] is not second[0]
+    assert logger.level == logging.DEBUG
+
+    # Foreign handlers are kept
+    foreign = logging.NullHandler()
+    logger.addHandler(foreign)
+    logger = init_logger("py-css-styleguide-test", "DEBUG", printout=False)
+    assert foreign in logger.handlers
+    assert len(get_named_handlers(logger)) == 1
+
+    logger.removeHandler(foreign)
+
+
+def test_cli_reinvoke_handlers():
+    """
+    Invoking CLI many times in the same process should not pile up handlers.
+    """
+    runner = CliRunner()
+
+    for i in range(3):
+        result = runner.invoke(cli_frontend, ["version"])
+        assert result.exit_code == 0
+
+    logger = logging.getLogger("py-css-styleguide")
+    assert len(get_named_handlers(logger)) == 1
+
+
+def test_json_lines_formatter():
+    """
+    Formatter should output a JSON object with lazily formatted message.
+    """
+    record = logging.LogRecord(
+        "py-css-styleguide", logging.WARNING, __file__, 1, "Foo %s: %d",
+        ("bar", 42), None,
+    )
+
+    payload = json.loads(JsonLinesFormatter().format(record))
+
+    assert list(payload.keys()) == ["time", "level", "logger", "message"]
+    assert payload["level"] == "WARNING"
+    assert payload["logger"] == "py-css-styleguide"
+    assert payload["message"] == "Foo bar: 42"
+
+
+def test_json_lines_formatter_exception():
+    """
+    Formatter should include exception traceback when there is one.
+    """
+    try:
+        raise ValueError("Nope")
+    except ValueError:
+        import sys
+        exc_info = sys.exc_info()
+
+    record = logging.LogRecord(
+        "py-css-styleguide", logging.ERROR, __file__, 1, "Failed", None, exc_info,
+    )
+
+    payload = json.loads(JsonLinesFormatter().format(record))
+
+    assert payload["exception"].endswith("ValueError: Nope")
+
+
+def test_cli_log_format_json(tests_settings):
+    """
+    CLI option should output logs as JSON lines.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "--verbose", "5",
+            "--log-format", "json",
+            "parse",
+            str(tests_settings.fixtures_path / "manifest_sample.css"),
+            "--validate",
+        ]
+    )
+
+    assert result.exit_code == 0
+
+    # With validation, output only contains logs
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [(item["level"], item["message"]) for item in lines][-1] == (
+        "INFO", "Manifest is valid"
+    )
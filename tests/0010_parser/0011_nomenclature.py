@@ -11,7 +11,10 @@ from py_css_styleguide.nomenclature import (
 
 @pytest.mark.parametrize(
     "name, expected",
-    [("palette", False), ("load", True), ("to_dict", True), ("to_json", True)],
+    [
+        ("palette", False), ("load", True), ("to_dict", True), ("to_json", True),
+        ("dump", True), ("release", True),
+    ],
 )
 def test_nomenclature_is_reserved_rule(name, expected):
     assert is_reserved_rule(name) == expected
@@ -48,3 +51,20 @@ def test_nomenclature_is_valid_property_success(name):
 def test_nomenclature_is_valid_property_error(name):
     with pytest.raises(StyleguideValidationError):
         is_valid_property(name)
+
+
+def test_nomenclature_validation_memoization():
+    """
+    Valid names should be memoized while invalid names should always raise.
+    """
+    is_valid_property.cache_clear()
+
+    assert is_valid_property("palette") is True
+    assert is_valid_property("palette") is True
+    assert is_valid_property.cache_info().hits == 1
+
+    for i in range(2):
+        with pytest.raises(StyleguideValidationError):
+            is_valid_property("foo-bar")
+
+    assert is_valid_property.cache_info().currsize == 1
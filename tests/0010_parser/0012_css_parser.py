@@ -107,3 +107,66 @@ def test_css_parser_error():
             "qualified rule."
         )
     ]
+
+
+def test_css_parser_positions():
+    """
+    Parser should collect source positions of rules and their properties.
+    """
+    parser = TinycssSourceParser()
+    parser.parse((
+        ".foo { content: \"bar\"; }\n"
+        ".styleguide-foo {\n"
+        "    --myvar: \"ping\";\n"
+        "    quote: \"pika\";\n"
+        "}\n"
+    ))
+
+    assert parser.positions == {
+        "styleguide-foo": {
+            "line": 2,
+            "column": 1,
+            "properties": {
+                "myvar": {"line": 3, "column": 5},
+                "quote": {"line": 4, "column": 5},
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize("options,expected", [
+    ({}, ["styleguide-metas-references", "styleguide-reference-foo",
+          "styleguide-reference-bar", "styleguide-other"]),
+    ({"only": ["bar"]}, ["styleguide-metas-references", "styleguide-reference-bar",
+                         "styleguide-other"]),
+    ({"exclude": ["bar"]}, ["styleguide-metas-references", "styleguide-reference-foo",
+                            "styleguide-other"]),
+    ({"only": ["foo", "bar"], "exclude": ["foo"]}, [
+        "styleguide-metas-references", "styleguide-reference-bar", "styleguide-other"
+    ]),
+])
+def test_css_parser_subset(options, expected):
+    """
+    Parser should ignore unwanted reference rules without to digest them and keep
+    every other styleguide rules.
+    """
+    source = (
+        '.styleguide-metas-references{--names: "foo bar"}'
+        '.styleguide-reference-foo{--structure: "string"; --value: "foo"}'
+        '.styleguide-reference-bar{--structure: "string"; --value: "bar"}'
+        '.styleguide-other{--value: "other"}'
+    )
+
+    parser = TinycssSourceParser(**options)
+    digested = []
+    digest_content = parser.digest_content
+
+    def spy(rule, positions=None):
+        digested.append(parser.digest_prelude(rule))
+        return digest_content(rule, positions=positions)
+
+    parser.digest_content = spy
+
+    assert list(parser.parse(source).keys()) == expected
+    assert digested == expected
+    assert list(parser.positions.keys()) == expected
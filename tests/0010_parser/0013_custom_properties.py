@@ -0,0 +1,55 @@
+import pytest
+
+from py_css_styleguide.exceptions import ParserErrors
+from py_css_styleguide.parser import TinycssSourceParser
+
+
+def test_consume_custom_properties():
+    """
+    Custom properties should be collected from root and host rules only.
+    """
+    source = (
+        ":root {\n"
+        "    --color-primary: #ff0000;\n"
+        "    --font-base: \"Inter\";\n"
+        "    --font-stack: \"Inter\", sans-serif;\n"
+        "    --space-sm: calc(1rem / 2);\n"
+        "    color: black;\n"
+        "}\n"
+        ".foo { --color-nope: #000000; }\n"
+        "@media (min-width: 10px) { :root { --color-nope: #000000; } }\n"
+        ":host, .bar { --space-lg: 2rem; }\n"
+        ":root { --color-primary: #00ff00; }\n"
+    )
+
+    parser = TinycssSourceParser()
+
+    assert parser.consume_custom_properties(source) == {
+        "color-primary": "#00ff00",
+        "font-base": "Inter",
+        "font-stack": "\"Inter\", sans-serif",
+        "space-sm": "calc(1rem / 2)",
+        "space-lg": "2rem",
+    }
+
+    # Last declaration wins but first position is kept
+    assert list(parser.consume_custom_properties(source).keys())[0] == "color-primary"
+
+
+def test_consume_custom_properties_selectors():
+    """
+    Custom properties should be collected only from given selectors.
+    """
+    source = ":root { --a-b: 1; }\n.theme { --c-d: 2; }"
+
+    assert TinycssSourceParser().consume_custom_properties(
+        source, selectors=(".theme",)
+    ) == {"c-d": "2"}
+
+
+def test_consume_custom_properties_errors():
+    """
+    Invalid source should raise the same errors than with manifest parsing.
+    """
+    with pytest.raises(ParserErrors):
+        TinycssSourceParser().consume_custom_properties("nope")
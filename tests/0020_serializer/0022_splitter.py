@@ -94,3 +94,54 @@ def test_serialize_to_json_deprecated():
         serialized = serializer.serialize_to_json("foo", context)
 
     assert serialized == expected
+
+
+def test_collect_diagnostics(recwarn):
+    """
+    With diagnostics collect enabled, deprecations should be recorded once for each
+    reference and emitted in a single warning for each kind.
+    """
+    context = {
+        "styleguide-metas-references": {"names": "foo bar ping"},
+        "styleguide-reference-foo": {
+            "structure": "list",
+            "splitter": "json-list",
+            "items": '["foo"]',
+        },
+        "styleguide-reference-bar": {
+            "structure": "flat",
+            "splitter": "json-list",
+            "keys": '["bar"]',
+            "values": '["bar"]',
+        },
+        "styleguide-reference-ping": {
+            "structure": "json",
+            "object": '{"ping": "pong"}',
+        },
+    }
+    serializer = ManifestSerializer(collect_diagnostics=True)
+
+    references = serializer.serialize(context)
+
+    assert references == {
+        "foo": ["foo"],
+        "bar": {"bar": "bar"},
+        "ping": {"ping": "pong"},
+    }
+
+    assert [(item["kind"], item["references"]) for item in serializer.diagnostics] == [
+        ("deprecated-splitter", ["foo", "bar"]),
+        ("deprecated-structure", ["ping"]),
+    ]
+
+    assert [str(item.message) for item in recwarn] == [
+        (
+            "2 reference(s) use deprecated '--splitter: \"json-list\";', change it to "
+            "'--splitter: \"object-list\";' instead: styleguide-reference-foo, "
+            "styleguide-reference-bar"
+        ),
+        (
+            "1 reference(s) use deprecated '--structure: \"json\";', change it to "
+            "'--structure: \"object-complex\";' instead: styleguide-reference-ping"
+        ),
+    ]
@@ -350,3 +350,137 @@ def test_serialize(context, expected):
     references = serializer.serialize(context)
 
     assert references == expected
+
+
+def test_validate_success():
+    """
+    Validation of a valid manifest should not return any error and should not
+    modify given datas.
+    """
+    context = {
+        "styleguide-metas-references": {"names": "palette"},
+        "styleguide-reference-palette": {
+            "structure": "flat",
+            "keys": "black white",
+            "values": "#000000 #ffffff",
+        },
+    }
+
+    serializer = ManifestSerializer()
+
+    assert serializer.validate(context) == []
+    assert context["styleguide-reference-palette"]["structure"] == "flat"
+
+
+def test_validate_errors():
+    """
+    Validation should collect every errors from metas and references with their
+    source positions when available.
+    """
+    context = OrderedDict((
+        (
+            "styleguide-metas-references",
+            {"names": "palette nope spaces bad-name text"},
+        ),
+        (
+            "styleguide-reference-palette",
+            {
+                "structure": "flat",
+                "keys": "black white",
+                "font-color": "red",
+                "values": "#000000",
+            },
+        ),
+        (
+            "styleguide-reference-spaces",
+            {"structure": "whatever", "items": "short large"},
+        ),
+        ("styleguide-reference-text", {"structure": "string"}),
+    ))
+    positions = {
+        "styleguide-metas-references": {
+            "line": 1,
+            "column": 1,
+            "properties": {"names": {"line": 2, "column": 5}},
+        },
+        "styleguide-reference-palette": {
+            "line": 4,
+            "column": 1,
+            "properties": {
+                "structure": {"line": 5, "column": 5},
+                "keys": {"line": 6, "column": 5},
+                "font-color": {"line": 7, "column": 5},
+                "values": {"line": 8, "column": 5},
+            },
+        },
+    }
+
+    serializer = ManifestSerializer()
+    errors = serializer.validate(context, positions=positions)
+
+    assert [
+        (item["reference"], item["property"], item["kind"], item["line"])
+        for item in errors
+    ] == [
+        ("palette", "font-color", "StyleguideValidationError", 7),
+        ("palette", "values", "SerializerError", 8),
+        ("nope", None, "SerializerError", 1),
+        ("spaces", "structure", "SerializerError", None),
+        ("bad-name", "names", "StyleguideValidationError", 2),
+        ("text", "value", "SerializerError", None),
+    ]
+    assert errors[1]["message"] == (
+        "Flat reference 'palette' has different lengths for 'keys' (2) and "
+        "'values' (1) variables"
+    )
+
+
+def test_validate_metas_error():
+    """
+    Validation should report missing meta references as a single error.
+    """
+    serializer = ManifestSerializer()
+    errors = serializer.validate({"styleguide-reference-foo": {"value": "bar"}})
+
+    assert errors == [
+        {
+            "reference": None,
+            "property": None,
+            "kind": "SerializerError",
+            "message": "Manifest lacks of '.styleguide-metas-references' or is empty",
+            "line": None,
+            "column": None,
+        }
+    ]
+
+
+@pytest.mark.parametrize("options,expected", [
+    ({}, ["foo", "bar", "ping"]),
+    ({"only": ["bar"]}, ["bar"]),
+    ({"only": ["bar", "nope"]}, ["bar"]),
+    ({"exclude": ["foo", "ping"]}, ["bar"]),
+    ({"only": ["foo", "bar"], "exclude": ["foo"]}, ["bar"]),
+])
+def test_serialize_subset(options, expected):
+    """
+    Serializer should only serialize wanted references and list them in metas.
+    """
+    datas = OrderedDict((
+        ("styleguide-metas-references", {"names": "foo bar ping"}),
+        (
+            "styleguide-reference-bar",
+            {"structure": "string", "value": "bar"},
+        ),
+    ))
+    # Unwanted references may be missing from datas
+    for name in ("foo", "ping"):
+        if name in expected:
+            datas["styleguide-reference-" + name] = {
+                "structure": "string", "value": name
+            }
+
+    serializer = ManifestSerializer(**options)
+    references = serializer.serialize(datas)
+
+    assert list(references.keys()) == expected
+    assert serializer._metas["references"] == expected
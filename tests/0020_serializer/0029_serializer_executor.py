@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from py_css_styleguide.exceptions import SerializerError, SerializerErrors
+from py_css_styleguide.serializer import ManifestSerializer
+
+
+def get_context():
+    """
+    Build a new manifest context since serializer alters given datas.
+    """
+    return OrderedDict((
+        ("styleguide-metas-references", {"names": "foo pika palette spaces"}),
+        (
+            "styleguide-reference-spaces",
+            {"structure": "list", "items": "short normal large"},
+        ),
+        ("styleguide-reference-pika", {"structure": "string", "value": "chu"}),
+        (
+            "styleguide-reference-palette",
+            {
+                "structure": "flat",
+                "keys": "black white",
+                "values": "#000000 #ffffff",
+            },
+        ),
+        ("styleguide-reference-foo", {"structure": "number", "value": "42"}),
+    ))
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_serialize_executor(executor_class):
+    """
+    Serialization with an executor should return the same references in the same
+    order than the sequential serialization.
+    """
+    expected = ManifestSerializer().serialize(get_context())
+
+    serializer = ManifestSerializer()
+    with executor_class(max_workers=2) as executor:
+        references = serializer.serialize(get_context(), executor=executor)
+
+    assert references == expected
+    assert list(references.keys()) == ["foo", "pika", "palette", "spaces"]
+
+
+def test_serialize_executor_errors():
+    """
+    Serialization with an executor should collect every reference errors and raise
+    them at once.
+    """
+    context = get_context()
+    context["styleguide-metas-references"] = {
+        "names": "foo nope pika palette spaces"
+    }
+    context["styleguide-reference-pika"] = {"structure": "string"}
+    context["styleguide-reference-palette"]["font-color"] = "red blue"
+
+    serializer = ManifestSerializer()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(SerializerErrors) as excinfo:
+            serializer.serialize(context, executor=executor)
+
+    assert isinstance(excinfo.value, SerializerError) is True
+    assert str(excinfo.value) == (
+        "Unable to serialize manifest due to 3 reference error(s)"
+    )
+    assert excinfo.value.error_payload == [
+        "Unable to find enabled reference name 'nope'",
+        "String reference 'pika' lacks of required 'value' variable or is empty",
+        (
+            "Invalid variable name 'font-color': it must only contains letters, "
+            "numbers and '_' character"
+        ),
+    ]
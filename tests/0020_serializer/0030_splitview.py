@@ -0,0 +1,112 @@
+import json
+from collections import OrderedDict
+
+import pytest
+
+from py_css_styleguide.serializer import ManifestSerializer
+from py_css_styleguide.splitview import SplitMapping, SplitView, json_default
+
+
+@pytest.mark.parametrize("value, cleaner", [
+    ("", None),
+    ("", "whitespaces"),
+    ("foo", None),
+    ("foo bar", None),
+    ("foo bar téléphone maison", None),
+    ("foo   bar  téléphone   maison", None),
+    ("foo   bar  téléphone   maison", "whitespaces"),
+    (" black   between  white ", None),
+    (" black   between  white ", "whitespaces"),
+])
+def test_splitview_items(value, cleaner):
+    """
+    Split view should have the same items than the list from the serializer legacy
+    splitter.
+    """
+    expected = ManifestSerializer().value_splitter(
+        "ref", "prop", value, "white-space", cleaner=cleaner
+    )
+
+    view = SplitView(value, cleaner=cleaner)
+
+    assert len(view) == len(expected)
+    assert list(view) == expected
+    assert view == expected
+    assert expected == view
+    assert json.dumps(view, default=json_default) == json.dumps(expected)
+
+
+def test_splitview_sequence():
+    """
+    Split view should behave like a read only list.
+    """
+    view = SplitView("foo bar ping")
+
+    assert view[0] == "foo"
+    assert view[-1] == "ping"
+    assert view[1:] == ["bar", "ping"]
+    assert "bar" in view
+    assert view.index("ping") == 2
+    assert view != ["foo", "bar"]
+    assert repr(view) == "SplitView(['foo', 'bar', 'ping'])"
+
+    with pytest.raises(IndexError):
+        view[3]
+
+    with pytest.raises(TypeError):
+        view[0] = "nope"
+
+
+def test_splitmapping():
+    """
+    Split mapping should behave like a read only dictionnary built from zipped keys
+    and values.
+    """
+    keys = "black white black grey"
+    values = "#000000 #ffffff #010101 #404040"
+    expected = OrderedDict(zip(keys.split(" "), values.split(" ")))
+
+    mapping = SplitMapping(SplitView(keys), SplitView(values))
+
+    assert mapping == expected
+    assert expected == mapping
+    assert list(mapping.items()) == list(expected.items())
+    assert mapping["black"] == "#010101"
+    assert len(mapping) == 3
+    assert json.dumps(mapping, default=json_default) == json.dumps(expected)
+
+
+def test_serialize_lazy_split():
+    """
+    With lazy split enabled, serializer should return split views for white space
+    splitter and builtin types for other splitters.
+    """
+    context = {
+        "styleguide-metas-references": {"names": "palette spaces columns"},
+        "styleguide-reference-palette": {
+            "structure": "flat",
+            "keys": "black white",
+            "values": "#000000 #ffffff",
+        },
+        "styleguide-reference-spaces": {
+            "structure": "list",
+            "items": "tiny short normal",
+        },
+        "styleguide-reference-columns": {
+            "structure": "list",
+            "splitter": "object-list",
+            "items": '["w30", "w50"]',
+        },
+    }
+
+    references = ManifestSerializer(lazy_split=True).serialize(context)
+
+    assert isinstance(references["palette"], SplitMapping) is True
+    assert isinstance(references["spaces"], SplitView) is True
+    assert isinstance(references["columns"], list) is True
+
+    assert references == {
+        "palette": {"black": "#000000", "white": "#ffffff"},
+        "spaces": ["tiny", "short", "normal"],
+        "columns": ["w30", "w50"],
+    }
@@ -100,3 +100,62 @@ def test_manifest_from_dict():
     }
 
     assert manifest.to_dict() == source
+
+
+def test_manifest_load_diagnostics(recwarn):
+    """
+    Manifest.load() should pass serializer options and store collected
+    diagnostics.
+    """
+    source = (
+        ".styleguide-metas-references{\n"
+        '    --names: "palette";\n'
+        "}\n"
+        "\n"
+        ".styleguide-reference-palette{\n"
+        '    --structure: "json";\n'
+        '    --object: \'{"black": "#000000"}\';\n'
+        "}"
+    )
+
+    manifest = Manifest()
+    manifest.load(source, serializer_options={"collect_diagnostics": True})
+
+    assert manifest.palette == {"black": "#000000"}
+    assert len(recwarn) == 1
+    assert manifest.diagnostics[0]["kind"] == "deprecated-structure"
+    assert manifest.diagnostics[0]["references"] == ["palette"]
+
+
+def test_manifest_load_subset(tests_settings):
+    """
+    Manifest should only load wanted references from CSS or from a dictionnary.
+    """
+    manifest = Manifest()
+    manifest.load_file(
+        tests_settings.fixtures_path / "manifest_sample.css",
+        only=["palette", "spaces"],
+        exclude=["spaces"],
+    )
+
+    assert manifest.metas["references"] == ["palette"]
+    assert manifest._rule_attrs == ["palette"]
+    assert list(manifest._datas.keys()) == [
+        "styleguide-metas-references", "styleguide-reference-palette"
+    ]
+    assert hasattr(manifest, "spaces") is False
+
+    full = Manifest()
+    full.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+    source = full.to_dict()
+
+    manifest = Manifest()
+    manifest.from_dict(source, exclude=["palette", "columns"])
+
+    assert manifest.metas["references"] == ["text_color", "spaces"]
+    assert manifest._rule_attrs == ["text_color", "spaces"]
+    assert manifest.spaces == full.spaces
+    # Given datas are not modified
+    assert source["metas"]["references"] == [
+        "palette", "text_color", "spaces", "columns"
+    ]
@@ -1,8 +1,17 @@
+import io
 import json
+import tracemalloc
 
+import pytest
 from freezegun import freeze_time
 
-from py_css_styleguide.model import Manifest
+from py_css_styleguide.exceptions import StyleguideValidationError
+from py_css_styleguide.model import (
+    Manifest,
+    get_json_options,
+    iterencode_manifest,
+    write_chunks,
+)
 
 
 @freeze_time("2012-10-15 10:00:00")
@@ -117,3 +126,151 @@ def test_manifest_to_json():
     }
 
     assert dump == expected
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_manifest_to_json_lazy_split(tests_settings):
+    """
+    Manifest.to_json() should encode references from lazy split structures like
+    builtin ones.
+    """
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    expected = Manifest()
+    expected.load(source_filepath.read_text())
+
+    manifest = Manifest()
+    manifest.load(
+        source_filepath.read_text(), serializer_options={"lazy_split": True}
+    )
+
+    assert manifest.to_json() == expected.to_json()
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+@pytest.mark.parametrize("lazy_split", [False, True])
+def test_manifest_dump(tests_settings, indent, lazy_split):
+    """
+    Manifest.dump() should write the same JSON than json.dumps() and
+    Manifest.to_json() from small chunks.
+    """
+    manifest = Manifest()
+    manifest.load_file(
+        tests_settings.fixtures_path / "manifest_sample.css",
+        serializer_options={"lazy_split": lazy_split},
+    )
+
+    expected = json.dumps(manifest.to_dict(), **get_json_options(indent=indent))
+
+    chunks = list(iterencode_manifest(manifest, indent=indent))
+    assert "".join(chunks) == expected
+    # References are never encoded whole
+    assert max(len(chunk) for chunk in chunks) < len(
+        json.dumps(manifest.palette, **get_json_options(indent=None))
+    )
+
+    assert manifest.to_json(indent=indent) == expected
+
+    fp = io.StringIO()
+    manifest.dump(fp, indent=indent)
+    assert fp.getvalue() == manifest.to_json(indent=indent)
+    assert json.loads(fp.getvalue()) == json.loads(manifest.to_json())
+
+    frozen = manifest.freeze()
+    fp = io.StringIO()
+    frozen.dump(fp, indent=indent)
+    assert fp.getvalue() == manifest.to_json(indent=indent)
+
+
+def test_manifest_dump_memory():
+    """
+    Memory used to dump a manifest should not grow with its JSON size, even for a
+    single big reference.
+    """
+    manifest = Manifest()
+    manifest.from_dict({
+        "metas": {"references": ["big"]},
+        "big": {
+            "item{}".format(i): {"color": "#{:06x}".format(i)} for i in range(20000)
+        },
+    })
+
+    class NullWriter:
+        size = 0
+
+        def write(self, content):
+            self.size += len(content)
+
+    fp = NullWriter()
+    tracemalloc.start()
+    try:
+        manifest.dump(fp)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert fp.size > 1000000
+    assert peak < fp.size / 4
+
+
+def test_write_chunks():
+    """
+    Chunks should be grouped until given size before each write.
+    """
+    writes = []
+
+    class Writer:
+        def write(self, content):
+            writes.append(content)
+
+    write_chunks(Writer(), ["ab", "cd", "e", "fghi", "j"], size=4)
+
+    assert writes == ["abcd", "efghi", "j"]
+
+
+def test_manifest_json_options(tests_settings):
+    """
+    JSON options should give a compact, sorted or unescaped JSON and the same one
+    from Manifest.to_json() and Manifest.dump().
+    """
+    manifest = Manifest()
+    manifest.from_dict({
+        "metas": {"references": ["zeta", "alpha"]},
+        "zeta": {"b": "é", "a": "x"},
+        "alpha": ["1"],
+    })
+
+    assert manifest.to_json(compact=True) == (
+        '{"metas":{"references":["zeta","alpha"]},'
+        '"zeta":{"b":"\\u00e9","a":"x"},"alpha":["1"]}'
+    )
+    assert manifest.to_json(compact=True, sort_keys=True, ensure_ascii=False) == (
+        '{"alpha":["1"],"metas":{"references":["zeta","alpha"]},'
+        '"zeta":{"a":"x","b":"é"}}'
+    )
+    # Compact ignores indent
+    assert manifest.to_json(indent=4, compact=True) == manifest.to_json(compact=True)
+
+    for options in [
+        {"compact": True},
+        {"sort_keys": True},
+        {"indent": None, "sort_keys": True, "ensure_ascii": False},
+    ]:
+        fp = io.StringIO()
+        manifest.dump(fp, **options)
+        assert fp.getvalue() == manifest.to_json(**options)
+        assert json.loads(fp.getvalue()) == json.loads(manifest.to_json())
+
+
+def test_manifest_dump_reserved():
+    """
+    A reference can not be named after the dump method.
+    """
+    manifest = Manifest()
+
+    with pytest.raises(StyleguideValidationError):
+        manifest.load(
+            ".styleguide-metas-references { --names: \"dump\"; }\n"
+            ".styleguide-reference-dump { --structure: \"string\"; --value: \"1\"; }\n"
+        )
+
+    assert callable(manifest.dump) is True
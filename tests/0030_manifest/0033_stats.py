@@ -0,0 +1,111 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from py_css_styleguide.benchmark import build_manifest
+from py_css_styleguide.exceptions import ParserErrors
+from py_css_styleguide.model import Manifest
+from py_css_styleguide.parser import TinycssSourceParser
+from py_css_styleguide.serializer import ManifestSerializer
+from py_css_styleguide.stats import ManifestStats
+
+
+def test_stats_disabled():
+    """
+    Statistics should not be recorded by default.
+    """
+    manifest = Manifest()
+    manifest.load(build_manifest(references=2))
+
+    assert manifest.stats is None
+
+
+def test_stats_load(tests_settings):
+    """
+    Manifest load should record every phase and reference durations.
+    """
+    manifest = Manifest()
+    with tests_settings.fixtures_path.joinpath("manifest_sample.css").open() as fp:
+        manifest.load(fp, stats=True)
+
+    assert list(manifest.stats.phases.keys()) == [
+        "read",
+        "parse.tokenize",
+        "parse.rules",
+        "parse",
+        "serialize.metas",
+        "serialize.references",
+        "serialize",
+        "attributes",
+        "load",
+    ]
+    assert list(manifest.stats.references.keys()) == manifest.metas["references"]
+    assert all(v >= 0 for v in manifest.stats.phases.values())
+
+    assert manifest.stats.phases["load"] >= manifest.stats.phases["parse"]
+    assert manifest.stats.to_dict() == {
+        "phases": manifest.stats.phases,
+        "references": manifest.stats.references,
+    }
+
+
+def test_stats_hooks():
+    """
+    Hooks should receive every recorded durations and enable statistics.
+    """
+    calls = []
+
+    manifest = Manifest()
+    manifest.load(
+        build_manifest(references=2),
+        stats_hooks=[lambda *args: calls.append(args)],
+    )
+
+    assert [(kind, name) for kind, name, duration in calls] == [
+        ("phase", "read"),
+        ("phase", "parse.tokenize"),
+        ("phase", "parse.rules"),
+        ("phase", "parse"),
+        ("phase", "serialize.metas"),
+        ("reference", "ref0"),
+        ("reference", "ref1"),
+        ("phase", "serialize.references"),
+        ("phase", "serialize"),
+        ("phase", "attributes"),
+        ("phase", "load"),
+    ]
+    assert calls[0][2] == manifest.stats.phases["read"]
+
+
+def test_stats_parser_errors():
+    """
+    Recorder given to parser should only have the phases reached before error.
+    """
+    stats = ManifestStats()
+    parser = TinycssSourceParser(stats=stats)
+
+    with pytest.raises(ParserErrors):
+        parser.parse("nope")
+
+    assert list(stats.phases.keys()) == ["parse.tokenize"]
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_stats_serializer_executor(executor_class):
+    """
+    Reference durations should be recorded from executor workers even if recorder
+    hooks can not be pickled.
+    """
+    calls = []
+    stats = ManifestStats(hooks=[lambda *args: calls.append(args)])
+
+    serializer = ManifestSerializer(stats=stats)
+    datas = TinycssSourceParser().parse(build_manifest(references=4))
+
+    with executor_class(max_workers=2) as executor:
+        serializer.serialize(datas, executor=executor)
+
+    assert list(stats.references.keys()) == ["ref0", "ref1", "ref2", "ref3"]
+    assert [name for kind, name, duration in calls if kind == "reference"] == [
+        "ref0", "ref1", "ref2", "ref3"
+    ]
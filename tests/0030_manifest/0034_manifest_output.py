@@ -0,0 +1,89 @@
+import json
+import shutil
+
+from freezegun import freeze_time
+
+from py_css_styleguide.compiler import ManifestCompiler
+from py_css_styleguide.django.mixin import StyleguideMixin
+from py_css_styleguide.model import Manifest, locate_manifest
+
+
+def test_locate_manifest(tmp_path):
+    """
+    Manifest-only output should be located from its stylesheet path when it exists.
+    """
+    stylesheet = tmp_path / "main.css"
+    output = tmp_path / "main.styleguide.css"
+
+    # No manifest-only output yet
+    assert locate_manifest(stylesheet) == str(stylesheet)
+
+    output.write_text("")
+    assert locate_manifest(stylesheet) == str(output)
+    assert locate_manifest(str(stylesheet)) == str(output)
+
+    # Already a manifest-only output
+    assert locate_manifest(output) == str(output)
+
+
+def test_load_file(tests_settings, tmp_path):
+    """
+    Manifest should load the manifest-only output instead of the whole stylesheet,
+    except if location is disabled.
+    """
+    stylesheet = tmp_path / "main.css"
+    output = tmp_path / "main.styleguide.css"
+
+    shutil.copy(tests_settings.fixtures_path / "manifest_sample.css", stylesheet)
+
+    manifest = Manifest()
+    manifest.load_file(stylesheet)
+    assert manifest._path == str(stylesheet)
+    assert len(manifest._rule_attrs) == 4
+
+    output.write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"1\"; }\n"
+    )
+
+    manifest = Manifest()
+    manifest.load_file(stylesheet)
+    assert manifest._path == str(output)
+    assert manifest._rule_attrs == ["version"]
+
+    manifest = Manifest()
+    manifest.load_file(stylesheet, locate=False)
+    assert manifest._path == str(stylesheet)
+
+
+def test_mixin_manifest_output(tests_settings, tmp_path):
+    """
+    Django mixin should load the manifest-only output when it exists.
+    """
+    stylesheet = tmp_path / "main.css"
+    shutil.copy(tests_settings.fixtures_path / "manifest_sample.css", stylesheet)
+    (tmp_path / "main.styleguide.css").write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"1\"; }\n"
+    )
+
+    manifest = StyleguideMixin().get_manifest(str(stylesheet), save_dump=False)
+
+    assert manifest.status == "live"
+    assert manifest.metas["references"] == ["version"]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_manifest_only_helpers(tests_settings):
+    """
+    Manifest-only Sass source written with helper mixins should produce the same
+    manifest than the one written with plain rules.
+    """
+    expected = json.loads(
+        (tests_settings.fixtures_path / "json" / "sample_libsass.json").read_text()
+    )
+
+    sources = tests_settings.fixtures_path / "sass" / "scss"
+    manifest = ManifestCompiler().load(sources / "sample_manifest_only.scss")
+
+    assert json.loads(manifest.to_json()) == expected
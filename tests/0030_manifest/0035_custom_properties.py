@@ -0,0 +1,77 @@
+import re
+
+import pytest
+
+from py_css_styleguide.exceptions import StyleguideValidationError
+from py_css_styleguide.model import Manifest
+
+
+def test_load_custom_properties():
+    """
+    Custom properties should be grouped into flat references.
+    """
+    source = (
+        ":root {\n"
+        "    --color-primary: #ff0000;\n"
+        "    --color-text-muted: #404040;\n"
+        "    --space-sm: .5rem;\n"
+        "    --orphan: 1;\n"
+        "}\n"
+    )
+
+    manifest = Manifest()
+    manifest.load_custom_properties(source)
+
+    assert manifest._path is None
+    assert manifest.metas["references"] == ["color", "space"]
+    assert manifest.color == {"primary": "#ff0000", "text-muted": "#404040"}
+    assert manifest.space == {"sm": ".5rem"}
+    assert list(manifest.to_dict().keys()) == ["metas", "color", "space"]
+
+
+def test_load_custom_properties_pattern():
+    """
+    Grouping pattern can be changed.
+    """
+    source = ":root { --ds-color-primary: red; --ds-space-sm: 1px; --other: 2; }"
+
+    manifest = Manifest()
+    manifest.load_custom_properties(
+        source, pattern=re.compile(r"^ds-(?P<reference>[a-z]+)-(?P<key>.+)$")
+    )
+
+    assert manifest.to_dict() == {
+        "metas": manifest.metas,
+        "color": {"primary": "red"},
+        "space": {"sm": "1px"},
+    }
+
+
+def test_load_custom_properties_reserved():
+    """
+    Reference name from custom properties should be validated.
+    """
+    manifest = Manifest()
+
+    with pytest.raises(StyleguideValidationError):
+        manifest.load_custom_properties(":root { --metas-foo: 1; }")
+
+
+def test_load_custom_properties_many(tests_settings):
+    """
+    Thousands of tokens should be grouped without any styleguide rule.
+    """
+    source = ":root {{\n{}\n}}".format(
+        "\n".join(
+            "  --group{}-token{}: #{:06x};".format(i % 50, i, i) for i in range(5000)
+        )
+    )
+
+    manifest = Manifest()
+    with tests_settings.fixtures_path.joinpath("manifest_sample.css").open() as fp:
+        manifest.load_custom_properties(fp.read() + source, filepath="tokens.css")
+
+    assert manifest._path == "tokens.css"
+    assert len(manifest.metas["references"]) == 50
+    assert len(manifest.group0) == 100
+    assert manifest.group49["token4999"] == "#001387"
@@ -0,0 +1,161 @@
+import copy
+import json
+import pickle
+from collections import OrderedDict
+
+import pytest
+
+from py_css_styleguide.frozen import FrozenDict, freeze, thaw
+from py_css_styleguide.model import FrozenManifest, Manifest
+from py_css_styleguide.splitview import SplitView
+
+
+def test_frozen_dict_readonly():
+    """
+    Every mutation method of a frozen dictionnary should raise an error.
+    """
+    frozen = FrozenDict({"foo": "bar"})
+
+    mutations = [
+        lambda: frozen.__setitem__("ping", "pong"),
+        lambda: frozen.__delitem__("foo"),
+        lambda: frozen.clear(),
+        lambda: frozen.pop("foo"),
+        lambda: frozen.popitem(),
+        lambda: frozen.setdefault("ping", "pong"),
+        lambda: frozen.update({"ping": "pong"}),
+    ]
+    for mutation in mutations:
+        with pytest.raises(TypeError):
+            mutation()
+
+    assert frozen == {"foo": "bar"}
+    assert repr(frozen) == "FrozenDict({'foo': 'bar'})"
+    assert json.dumps(frozen) == '{"foo": "bar"}'
+
+
+def test_frozen_dict_copy():
+    """
+    Frozen dictionnary should be copied as itself and pickled to a frozen
+    dictionnary.
+    """
+    frozen = FrozenDict({"foo": ("bar",)})
+
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert isinstance(restored, FrozenDict)
+    assert restored == frozen
+
+
+def test_freeze_thaw():
+    """
+    Structures should be frozen recursively and thawed back to mutable
+    structures.
+    """
+    split = SplitView("a b")
+    value = OrderedDict([
+        ("items", [1, {"nested": [2, 3]}]),
+        ("split", split),
+        ("name", "foo"),
+    ])
+
+    frozen = freeze(value)
+    assert isinstance(frozen, FrozenDict)
+    assert frozen["items"] == (1, {"nested": (2, 3)})
+    assert isinstance(frozen["items"][1], FrozenDict)
+    assert frozen["split"] is split
+    assert freeze(frozen) is frozen
+
+    thawed = thaw(frozen)
+    assert thawed == value
+    assert type(thawed) is OrderedDict
+    assert type(thawed["items"][1]) is OrderedDict
+    assert thawed["items"][1]["nested"] == [2, 3]
+
+
+def test_manifest_freeze(tests_settings):
+    """
+    Frozen manifest should have the same references than manifest without to
+    allow mutations.
+    """
+    manifest = Manifest()
+    manifest.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+    manifest.status = "live"
+
+    frozen = manifest.freeze()
+
+    assert isinstance(frozen, FrozenManifest)
+    assert frozen._rule_attrs == ("palette", "text_color", "spaces", "columns")
+    assert frozen.metas["references"] == (
+        "palette", "text_color", "spaces", "columns"
+    )
+    assert frozen.palette == {"black": "#000000", "white": "#ffffff"}
+    assert frozen.status == "live"
+    assert frozen.diagnostics == ()
+    assert frozen.stats is None
+    assert frozen.to_json() == manifest.to_json()
+
+    with pytest.raises(AttributeError):
+        frozen.palette = {}
+
+    with pytest.raises(AttributeError):
+        del frozen.palette
+
+    with pytest.raises(TypeError):
+        frozen.palette["black"] = "#ff0000"
+
+    # Freezing is a copy, original manifest is still mutable and independent
+    manifest.palette["black"] = "#ff0000"
+    assert frozen.palette["black"] == "#000000"
+
+
+def test_frozen_manifest_thaw_lazy_split(tests_settings):
+    """
+    Split views from a lazy split manifest should be thawed to mutable structures.
+    """
+    manifest = Manifest()
+    manifest.load(
+        (tests_settings.fixtures_path / "manifest_sample.css").read_text(),
+        serializer_options={"lazy_split": True},
+    )
+
+    thawed = manifest.freeze().thaw()
+
+    assert type(thawed.palette) is OrderedDict
+    assert type(thawed.spaces) is list
+    assert thawed.to_dict() == json.loads(manifest.to_json())
+
+    thawed.palette["black"] = "#ff0000"
+    thawed.spaces.append("foo")
+    assert manifest.palette["black"] == "#000000"
+    assert "foo" not in manifest.spaces
+
+
+def test_frozen_manifest_thaw_and_pickle(tests_settings):
+    """
+    Frozen manifest should be thawed to an independent mutable manifest and be
+    pickled to a frozen manifest.
+    """
+    manifest = Manifest()
+    manifest.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+    frozen = manifest.freeze()
+
+    thawed = frozen.thaw()
+    assert isinstance(thawed, Manifest)
+    assert thawed._path == manifest._path
+    assert thawed.to_dict() == manifest.to_dict()
+
+    thawed.palette["black"] = "#ff0000"
+    thawed.metas["references"].append("foo")
+    assert frozen.palette["black"] == "#000000"
+    assert "foo" not in frozen.metas["references"]
+
+    assert copy.deepcopy(frozen) is frozen
+
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert isinstance(restored, FrozenManifest)
+    assert restored._path == frozen._path
+    assert restored.to_dict() == frozen.to_dict()
+    assert restored.diagnostics == ()
@@ -0,0 +1,173 @@
+import pickle
+
+import pytest
+
+from py_css_styleguide.exceptions import (
+    PackedManifestError,
+    StyleguideValidationError,
+)
+from py_css_styleguide.model import FrozenManifest, Manifest
+from py_css_styleguide.packed import (
+    PACKED_MAGIC,
+    PackedManifest,
+    dump_packed,
+    is_packed,
+    is_packed_file,
+    load_packed,
+    pack_manifest,
+    read_index,
+)
+
+
+def get_manifest(tests_settings):
+    manifest = Manifest()
+    manifest.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+    manifest.status = "live"
+
+    return manifest
+
+
+def test_pack_manifest(tests_settings):
+    """
+    Packed manifest should have an index with position of every value.
+    """
+    manifest = get_manifest(tests_settings)
+
+    content = pack_manifest(manifest)
+    assert content.startswith(PACKED_MAGIC)
+    assert is_packed(content) is True
+    # Frozen manifest is packed the same
+    assert pack_manifest(manifest.freeze()) == content
+
+    index, start = read_index(content)
+    assert index["path"] == manifest._path
+    assert [item[0] for item in index["references"]] == [
+        "palette", "text_color", "spaces", "columns"
+    ]
+    assert [item[0] for item in index["attributes"]] == [
+        "diagnostics", "status"
+    ]
+
+    offset, length = index["metas"]
+    assert content[start + offset:start + offset + length].startswith(b"{")
+
+
+def test_packed_manifest_lazy(tests_settings):
+    """
+    Packed manifest should only decode values when they are reached.
+    """
+    manifest = get_manifest(tests_settings)
+    packed = PackedManifest(pack_manifest(manifest))
+
+    assert packed._rule_attrs == ("palette", "text_color", "spaces", "columns")
+    assert "palette" not in packed.__dict__
+
+    assert packed.palette == {"black": "#000000", "white": "#ffffff"}
+    assert "palette" in packed.__dict__
+    assert "spaces" not in packed.__dict__
+    assert packed.palette is packed.palette
+
+    assert packed.status == "live"
+    assert packed.to_json() == manifest.to_json()
+    assert packed.thaw().to_dict() == manifest.to_dict()
+
+    with pytest.raises(AttributeError):
+        packed.nope
+
+    with pytest.raises(AttributeError):
+        packed.palette = {}
+
+    with pytest.raises(TypeError):
+        packed.palette["black"] = "#ff0000"
+
+
+def test_packed_manifest_release_reserved():
+    """
+    A reference can not be named after the packed manifest release method.
+    """
+    with pytest.raises(StyleguideValidationError):
+        Manifest().load(
+            ".styleguide-metas-references { --names: \"release\"; }\n"
+            ".styleguide-reference-release { --structure: \"string\"; "
+            "--value: \"1\"; }\n"
+        )
+
+
+def test_packed_manifest_pickle(tests_settings):
+    """
+    Packed manifest should be pickled to a frozen manifest.
+    """
+    manifest = get_manifest(tests_settings)
+    packed = PackedManifest(bytearray(pack_manifest(manifest)))
+
+    restored = pickle.loads(pickle.dumps(packed))
+    assert type(restored) is FrozenManifest
+    assert restored.to_dict() == manifest.freeze().to_dict()
+    assert restored.status == "live"
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"nope",
+    PACKED_MAGIC,
+    PACKED_MAGIC + b"\x04\x00\x00\x00nope",
+])
+def test_packed_manifest_invalid(content):
+    """
+    Invalid buffer should raise an error.
+    """
+    with pytest.raises(PackedManifestError):
+        PackedManifest(content)
+
+
+def test_packed_manifest_subset(tests_settings):
+    """
+    Packed manifest should only make wanted references available.
+    """
+    manifest = get_manifest(tests_settings)
+    content = pack_manifest(manifest)
+
+    packed = PackedManifest(content, only=["palette", "spaces"], exclude=["spaces"])
+
+    assert packed._rule_attrs == ("palette",)
+    assert packed.metas["references"] == ("palette",)
+    assert packed.metas["compiler_support"] == manifest.metas["compiler_support"]
+    assert packed.palette == manifest.palette
+
+    with pytest.raises(AttributeError):
+        packed.spaces
+
+    # Given attributes override packed ones
+    packed = PackedManifest(content, attributes={"status": "dump", "foo": [1]})
+    assert packed.status == "dump"
+    assert packed.foo == (1,)
+    assert packed._attributes == ("diagnostics", "status", "foo")
+
+
+def test_packed_file(tests_settings, tmp_path):
+    """
+    Indexed dump file should be mapped and only reached references decoded.
+    """
+    manifest = get_manifest(tests_settings)
+    path = tmp_path / "manifest.idx"
+
+    dump_packed(manifest, path)
+    assert is_packed_file(path) is True
+
+    packed = load_packed(path, only=["text_color"])
+    assert packed._rule_attrs == ("text_color",)
+    assert packed.text_color == manifest.text_color
+    assert "columns" not in packed._positions
+    assert packed.thaw().to_dict()["text_color"] == manifest.text_color
+
+    json_path = tmp_path / "manifest.json"
+    json_path.write_text(manifest.to_json())
+    assert is_packed_file(json_path) is False
+
+    with pytest.raises(PackedManifestError):
+        load_packed(json_path)
+
+    empty_path = tmp_path / "empty.idx"
+    empty_path.write_bytes(b"")
+    with pytest.raises(PackedManifestError):
+        load_packed(empty_path)
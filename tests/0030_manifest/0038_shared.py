@@ -0,0 +1,117 @@
+import multiprocessing
+import subprocess
+import sys
+
+from multiprocessing import resource_tracker
+
+import pytest
+
+from py_css_styleguide.model import Manifest
+from py_css_styleguide.shared import SharedManifest
+
+
+@pytest.fixture
+def shared(tests_settings):
+    manifest = Manifest()
+    manifest.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+
+    shared = SharedManifest.create(manifest)
+    yield shared
+    shared.unlink()
+
+
+def test_shared_manifest_attach(shared):
+    """
+    An attached shared manifest should decode the same manifest from the segment.
+    """
+    attached = SharedManifest.attach(shared.name)
+
+    assert attached.owner is False
+    assert attached.manifest.palette == {"black": "#000000", "white": "#ffffff"}
+    assert attached.manifest.to_json() == shared.manifest.to_json()
+
+    attached.close()
+
+    # Owner segment is still there
+    assert shared.manifest.spaces == shared.manifest.spaces
+
+
+def test_shared_manifest_attach_missing():
+    """
+    Attaching a segment which does not exist should raise an error.
+    """
+    with pytest.raises(FileNotFoundError):
+        SharedManifest.attach("py-css-styleguide-nope")
+
+
+def test_shared_manifest_attach_untracked(shared, monkeypatch):
+    """
+    Attaching should not register the segment to the resource tracker.
+    """
+    registered = []
+    monkeypatch.setattr(
+        resource_tracker, "register", lambda name, rtype: registered.append(name)
+    )
+
+    attached = SharedManifest.attach(shared.name)
+    attached.close()
+
+    assert registered == []
+
+
+def test_shared_manifest_attach_process(shared):
+    """
+    A process started apart, with its own resource tracker, should not remove the
+    segment when it stops.
+    """
+    script = (
+        "from py_css_styleguide.shared import SharedManifest\n"
+        "attached = SharedManifest.attach({!r})\n"
+        "print(attached.manifest.palette['black'])\n"
+        "attached.close()\n"
+    ).format(shared.name)
+
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert output.stdout.strip() == "#000000"
+    assert output.stderr == ""
+
+    attached = SharedManifest.attach(shared.name)
+    assert attached.manifest.palette["white"] == "#ffffff"
+    attached.close()
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Fork start method is not available"
+)
+def test_shared_manifest_workers(shared):
+    """
+    Worker processes should read manifest from segment and their exit should not
+    remove it.
+    """
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    def worker(name):
+        attached = SharedManifest.attach(name)
+        queue.put(attached.manifest.text_color)
+        attached.close()
+
+    workers = [
+        context.Process(target=worker, args=(shared.name,)) for i in range(3)
+    ]
+    for process in workers:
+        process.start()
+
+    results = [queue.get(timeout=10) for process in workers]
+
+    for process in workers:
+        process.join()
+        assert process.exitcode == 0
+
+    assert all(item == shared.manifest.text_color for item in results)
+
+    attached = SharedManifest.attach(shared.name)
+    assert attached.manifest.palette == shared.manifest.palette
+    attached.close()
@@ -0,0 +1,151 @@
+from py_css_styleguide.model import Manifest
+from py_css_styleguide.packed import PackedManifest, pack_manifest
+from py_css_styleguide.registry import (
+    ManifestRegistry,
+    estimate_manifest_size,
+    estimate_size,
+)
+
+
+def get_manifest(name, size=1):
+    """
+    Build a frozen manifest with a single reference of given number of items.
+    """
+    manifest = Manifest()
+    manifest.from_dict({
+        "metas": {"references": [name]},
+        name: {"item{}".format(i): "value{}".format(i) for i in range(size)},
+    })
+
+    return manifest.freeze()
+
+
+def test_estimate_size():
+    """
+    Size should grow with content and shared objects should be counted once.
+    """
+    item = "x" * 1000
+
+    assert estimate_size({"a": item}) > 1000
+    assert estimate_size({"a": item, "b": item}) < 2000
+    assert estimate_size({"a": [1, 2, 3]}) < estimate_size({"a": [1, 2, 3, 4]})
+
+
+def test_registry_packed_manifest():
+    """
+    Registering a packed manifest should not decode its references.
+    """
+    manifest = get_manifest("foo", size=100)
+    buffer = pack_manifest(manifest)
+    packed = PackedManifest(buffer)
+
+    registry = ManifestRegistry()
+    assert registry.set("foo", packed) is True
+
+    assert "foo" not in packed.__dict__
+    assert "metas" not in packed.__dict__
+    assert 0 < registry.size < len(buffer)
+    assert estimate_manifest_size(packed) == registry.size
+
+    # Size only counts available references
+    subset = PackedManifest(buffer, exclude=["foo"])
+    assert estimate_manifest_size(subset) < registry.size
+
+
+def test_registry_get_set():
+    """
+    Registry should return registered manifests and drop stale ones.
+    """
+    events = []
+    registry = ManifestRegistry(hooks=[lambda *args: events.append(args[:2])])
+    manifest = get_manifest("foo")
+
+    assert registry.get("foo") is None
+    assert registry.set("foo", manifest, signature=1) is True
+    assert "foo" in registry
+    assert registry.get("foo") is manifest
+    assert registry.get("foo", signature=1) is manifest
+    assert registry.size == estimate_size(manifest.to_dict())
+
+    # Another signature means manifest has changed
+    assert registry.get("foo", signature=2) is None
+    assert len(registry) == 0
+    assert registry.size == 0
+    assert events == [("stale", "foo")]
+
+    assert registry.stats() == {
+        "entries": 0,
+        "size": 0,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+        "stales": 1,
+        "invalidations": 0,
+        "rejections": 0,
+    }
+
+
+def test_registry_max_entries():
+    """
+    Least recently used manifests should be evicted first.
+    """
+    events = []
+    registry = ManifestRegistry(
+        max_entries=2, hooks=[lambda *args: events.append(args[:2])]
+    )
+
+    registry.set("foo", get_manifest("foo"))
+    registry.set("bar", get_manifest("bar"))
+    # Use foo so bar is the least recently used
+    registry.get("foo")
+    registry.set("ping", get_manifest("ping"))
+
+    assert list(registry.entries) == ["foo", "ping"]
+    assert events == [("evict", "bar")]
+    assert registry.stats()["evictions"] == 1
+
+
+def test_registry_max_bytes():
+    """
+    Manifests should be evicted until registry fits in its maximum size and a too
+    big manifest should never be registered.
+    """
+    small = get_manifest("small", size=10)
+    size = estimate_size(small.to_dict())
+
+    registry = ManifestRegistry(max_bytes=size * 2)
+
+    registry.set("foo", small)
+    registry.set("bar", get_manifest("small", size=10))
+    assert len(registry) == 2
+
+    registry.set("ping", get_manifest("small", size=10))
+    assert list(registry.entries) == ["bar", "ping"]
+    assert registry.size <= registry.max_bytes
+
+    assert registry.set("big", get_manifest("big", size=100)) is False
+    assert "big" not in registry
+    assert registry.stats()["rejections"] == 1
+
+
+def test_registry_invalidate():
+    """
+    Manifests should be explicitly invalidated with hooks called.
+    """
+    events = []
+    registry = ManifestRegistry(hooks=[lambda *args: events.append(args[:2])])
+
+    registry.set("foo", get_manifest("foo"))
+    registry.set("bar", get_manifest("bar"))
+    registry.set("bar", get_manifest("bar"))
+
+    assert registry.invalidate("foo") is True
+    assert registry.invalidate("foo") is False
+    assert list(registry.entries) == ["bar"]
+
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.size == 0
+
+    assert events == [("replace", "bar"), ("invalidate", "foo"), ("invalidate", "bar")]
+    assert registry.stats()["invalidations"] == 2
@@ -0,0 +1,169 @@
+import json
+import shutil
+
+import pytest
+
+from freezegun import freeze_time
+
+import py_css_styleguide
+from py_css_styleguide import compiler as compiler_module
+from py_css_styleguide.compiler import ManifestCompiler
+from py_css_styleguide.exceptions import CompilerError
+
+
+@pytest.fixture
+def sass_sources(tests_settings, tmp_path):
+    """
+    Copy Sass sources from fixtures to a temporary directory and return its path.
+    """
+    destination = tmp_path / "scss"
+    shutil.copytree(tests_settings.fixtures_path / "sass" / "scss", destination)
+
+    return destination
+
+
+def test_helpers_paths():
+    """
+    Helper paths should point to existing mixin library files.
+    """
+    assert py_css_styleguide.COMPILER_LIBSASS_HELPER.is_file() is True
+    assert py_css_styleguide.COMPILER_DARTSASS_HELPER.is_file() is True
+
+
+@pytest.mark.parametrize("content, expected", [
+    ('@import "foo";', ["foo"]),
+    ("@import 'foo', 'bar/ping';", ["foo", "bar/ping"]),
+    ('@use "sass:math";\n@use "foo" as f;', ["foo"]),
+    ('@forward "foo" show bar;', ["foo"]),
+    ('@import "foo.css";\n@import "http://foo/bar";', []),
+    ('/* @import "foo"; */\n// @import "bar";\n@import "ping";', ["ping"]),
+])
+def test_get_imports(content, expected):
+    """
+    Imported paths should be found from import rules except for builtin modules,
+    remote and plain CSS imports or comments.
+    """
+    assert ManifestCompiler().get_imports(content) == expected
+
+
+def test_resolve_import(tmp_path):
+    """
+    Imports should be resolved to partials, plain files and directory indexes from
+    importer directory then include paths.
+    """
+    (tmp_path / "base").mkdir()
+    (tmp_path / "base" / "_partial.scss").write_text("")
+    (tmp_path / "base" / "plain.scss").write_text("")
+    (tmp_path / "base" / "dir").mkdir()
+    (tmp_path / "base" / "dir" / "_index.scss").write_text("")
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "_library.scss").write_text("")
+
+    compiler = ManifestCompiler(include_paths=[tmp_path / "lib"])
+    basedir = str(tmp_path / "base")
+
+    assert compiler.resolve_import("partial", basedir) == str(
+        tmp_path / "base" / "_partial.scss"
+    )
+    assert compiler.resolve_import("plain.scss", basedir) == str(
+        tmp_path / "base" / "plain.scss"
+    )
+    assert compiler.resolve_import("dir", basedir) == str(
+        tmp_path / "base" / "dir" / "_index.scss"
+    )
+    assert compiler.resolve_import("library", basedir) == str(
+        tmp_path / "lib" / "_library.scss"
+    )
+    assert compiler.resolve_import("nope", basedir) is None
+
+
+def test_get_dependencies(sass_sources):
+    """
+    Dependency graph should contain source and every imported partials.
+    """
+    compiler = ManifestCompiler()
+
+    assert compiler.get_dependencies(sass_sources / "sample_libsass.scss") == [
+        str(sass_sources / "sample_libsass.scss"),
+        str(sass_sources / "_settings.scss"),
+        str(sass_sources / "_libsass_styleguide_helpers.scss"),
+    ]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_load(tests_settings, sass_sources):
+    """
+    Compiled manifest should be loaded without to write any file.
+    """
+    expected = json.loads(
+        (tests_settings.fixtures_path / "json" / "sample_libsass.json").read_text()
+    )
+
+    manifest = ManifestCompiler().load(sass_sources / "sample_libsass.scss")
+
+    assert json.loads(manifest.to_json()) == expected
+    assert manifest._path == str(sass_sources / "sample_libsass.scss")
+    assert sorted(item.name for item in sass_sources.iterdir()) == sorted(
+        item.name
+        for item in (tests_settings.fixtures_path / "sass" / "scss").iterdir()
+    )
+
+
+def test_compile_cache(monkeypatch, sass_sources):
+    """
+    Source should only be compiled again when a file from its dependency graph has
+    changed.
+    """
+    calls = []
+    original_compile = compiler_module.sass.compile
+
+    def counting_compile(**kwargs):
+        calls.append(kwargs["filename"])
+        return original_compile(**kwargs)
+
+    monkeypatch.setattr(compiler_module.sass, "compile", counting_compile)
+
+    compiler = ManifestCompiler()
+    source = sass_sources / "sample_libsass.scss"
+
+    first = compiler.compile(source)
+    assert compiler.compile(source) == first
+    assert len(calls) == 1
+
+    # Change a partial content
+    settings = sass_sources / "_settings.scss"
+    settings.write_text(settings.read_text().replace("42.0", "142.0"))
+
+    second = compiler.compile(source)
+    assert len(calls) == 2
+    assert second != first
+    assert "142.0" in second
+
+
+def test_compile_errors(monkeypatch, tmp_path):
+    """
+    Compile errors and missing Libsass should raise a specific exception.
+    """
+    source = tmp_path / "invalid.scss"
+    source.write_text(".foo { color: $nope; }")
+
+    with pytest.raises(CompilerError) as excinfo:
+        ManifestCompiler().compile(source)
+    assert "Undefined variable" in str(excinfo.value)
+
+    with pytest.raises(CompilerError) as excinfo:
+        ManifestCompiler().compile(tmp_path / "nope.scss")
+    assert str(excinfo.value).startswith("Unable to read Sass source: ")
+
+    # Partial which is not valid UTF-8
+    (tmp_path / "_broken.scss").write_bytes(b"$foo: \"\xff\xfe\";")
+    main = tmp_path / "main.scss"
+    main.write_text('@import "broken";')
+    with pytest.raises(CompilerError) as excinfo:
+        ManifestCompiler().compile(main)
+    assert str(excinfo.value).startswith("Unable to read Sass source: ")
+
+    monkeypatch.setattr(compiler_module, "sass", None)
+    with pytest.raises(CompilerError) as excinfo:
+        ManifestCompiler().compile(source)
+    assert "'libsass' package" in str(excinfo.value)
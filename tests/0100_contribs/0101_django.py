@@ -234,3 +234,103 @@ def test_mixin_get_manifest(
 
     if save_exists is not None:
         assert kwargs["json_filepath"].exists() is save_exists
+
+
+def test_mixin_get_manifest_subset(tests_settings, tmp_path):
+    """
+    Mixin should only load wanted references either from CSS or JSON manifest.
+    """
+    css_filepath = str(tests_settings.fixtures_path / "manifest_sample.css")
+    json_filepath = tmp_path / "manifest.json"
+
+    mixin = StyleguideMixin()
+
+    manifest = mixin.get_manifest(
+        css_filepath, json_filepath=json_filepath, only=["palette"]
+    )
+    assert manifest.status == "live"
+    assert manifest.metas["references"] == ["palette"]
+    assert manifest._rule_attrs == ["palette"]
+
+    # A subset never writes the dump, neither overwrites an existing one
+    assert json_filepath.exists() is False
+    mixin.get_manifest(css_filepath, json_filepath=json_filepath)
+    full_dump = json_filepath.read_text()
+
+    for options in [{"only": ["palette"]}, {"exclude": ["palette"]}]:
+        mixin.get_manifest(css_filepath, json_filepath=json_filepath, **options)
+        assert json_filepath.read_text() == full_dump
+
+    manifest = mixin.get_manifest(
+        css_filepath, json_filepath=json_filepath, development_mode=False,
+        exclude=["palette"],
+    )
+    assert manifest.status == "dump"
+    assert manifest.metas["references"] == ["text_color", "spaces", "columns"]
+    assert manifest._rule_attrs == ["text_color", "spaces", "columns"]
+
+
+def test_mixin_get_manifest_indexed(tests_settings, tmp_path):
+    """
+    Mixin should detect an indexed dump and return a lazy packed manifest.
+    """
+    from py_css_styleguide.model import Manifest
+    from py_css_styleguide.packed import PackedManifest, dump_packed
+
+    source = Manifest()
+    source.load_file(tests_settings.fixtures_path / "manifest_sample.css")
+
+    json_filepath = tmp_path / "manifest.idx"
+    dump_packed(source, json_filepath)
+
+    mixin = StyleguideMixin()
+    manifest = mixin.get_manifest(
+        "nope.css", json_filepath=json_filepath, only=["spaces"]
+    )
+
+    assert isinstance(manifest, PackedManifest)
+    assert manifest.status == "dump"
+    assert manifest.loading_error == "Unable to find CSS manifest from: nope.css"
+    assert manifest.metas["references"] == ("spaces",)
+    assert list(manifest.spaces) == source.spaces
+
+    # Registering it does not decode its references
+    from py_css_styleguide.registry import ManifestRegistry
+
+    registered = mixin.get_registered_manifest(
+        ManifestRegistry(), "nope.css", json_filepath=json_filepath
+    )
+    assert isinstance(registered, PackedManifest)
+    assert "palette" not in registered.__dict__
+    assert registered.palette == source.palette
+
+    # A truncated dump is reported like an invalid JSON dump
+    json_filepath.write_bytes(json_filepath.read_bytes()[:10])
+    manifest = mixin.get_manifest("nope.css", json_filepath=json_filepath)
+
+    assert manifest.status == "failed"
+    assert manifest.loading_error.startswith("Invalid indexed manifest:")
+
+
+def test_mixin_json_dump_options(tests_settings, tmp_path):
+    """
+    Mixin should write JSON dump with its JSON options and read it again.
+    """
+    class CompactMixin(StyleguideMixin):
+        json_dump_options = {"compact": True, "sort_keys": True}
+
+    css_filepath = str(tests_settings.fixtures_path / "manifest_sample.css")
+    json_filepath = tmp_path / "manifest.json"
+
+    mixin = CompactMixin()
+    manifest = mixin.get_manifest(css_filepath, json_filepath=json_filepath)
+
+    content = json_filepath.read_text()
+    assert content == manifest.to_json(compact=True, sort_keys=True)
+    assert len(content.splitlines()) == 1
+
+    dumped = mixin.get_manifest(
+        css_filepath, json_filepath=json_filepath, development_mode=False
+    )
+    assert dumped.status == "dump"
+    assert dumped.to_dict() == manifest.to_dict()
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+
+import django
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+
+from py_css_styleguide.django.mixin import StyleguideMixin
+from py_css_styleguide.model import FrozenManifest, Manifest
+from py_css_styleguide.registry import ManifestRegistry
+
+
+def test_manifest_aload(tests_settings):
+    """
+    Manifest should be loaded from an executor with the same result than with
+    synchronous loading.
+    """
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+
+    async def load():
+        manifest = Manifest()
+        with source_filepath.open() as fp:
+            await manifest.aload(fp)
+        return manifest
+
+    manifest = asyncio.run(load())
+
+    assert manifest._path == str(source_filepath)
+    assert manifest.metas["references"] == [
+        "palette", "text_color", "spaces", "columns"
+    ]
+
+
+def test_mixin_aget_manifest_single_flight(monkeypatch, tests_settings):
+    """
+    Concurrent loads of the same manifest should share a single load.
+    """
+    css_filepath = str(tests_settings.fixtures_path / "manifest_sample.css")
+    original = StyleguideMixin.get_manifest
+    calls = []
+
+    def slow_get_manifest(self, *args, **kwargs):
+        calls.append(threading.get_ident())
+        # Keep load pending long enough for every caller to wait for it
+        time.sleep(0.1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(StyleguideMixin, "get_manifest", slow_get_manifest)
+
+    async def load_many():
+        mixin = StyleguideMixin()
+        return await asyncio.gather(*[
+            mixin.aget_manifest(css_filepath, save_dump=False) for i in range(20)
+        ])
+
+    manifests = asyncio.run(load_many())
+
+    assert len(calls) == 1
+    assert manifests[0].status == "live"
+
+    # Every caller got its own manifest object with the same loaded references
+    assert len({id(item) for item in manifests}) == 20
+    assert len({id(item.palette) for item in manifests}) == 20
+    for manifest in manifests:
+        assert manifest.status == "live"
+        assert manifest.to_dict() == manifests[0].to_dict()
+
+    # So a caller can not alter the other ones
+    manifests[0].palette["black"] = "#111111"
+    manifests[1]._remove_rule("spaces")
+    for manifest in manifests[2:]:
+        assert manifest.palette["black"] == "#000000"
+        assert "spaces" in manifest._rule_attrs
+
+    # Once done, a new call makes a new load
+    asyncio.run(load_many())
+    assert len(calls) == 2
+
+
+def test_mixin_aget_manifest_distinct(tests_settings):
+    """
+    Loads with different arguments should not be shared.
+    """
+    css_filepath = str(tests_settings.fixtures_path / "manifest_sample.css")
+
+    async def load():
+        mixin = StyleguideMixin()
+        return await asyncio.gather(
+            mixin.aget_manifest(css_filepath, save_dump=False),
+            mixin.aget_manifest("nope.css", save_dump=False),
+        )
+
+    found, missing = asyncio.run(load())
+
+    assert found.status == "live"
+    assert missing.status == "failed"
+    assert missing.loading_error == "Unable to find CSS manifest from: nope.css"
+
+
+def test_mixin_get_manifest_signature(tests_settings, tmp_path):
+    """
+    Signature should come from CSS manifest in development mode and from JSON dump
+    otherwise or when CSS manifest does not exist.
+    """
+    css_filepath = tmp_path / "manifest.css"
+    json_filepath = tmp_path / "manifest.json"
+    mixin = StyleguideMixin()
+
+    assert mixin.get_manifest_signature(str(css_filepath)) == (None, None, None)
+    assert mixin.get_manifest_signature(
+        str(css_filepath), json_filepath=json_filepath
+    ) == (str(json_filepath), None, None)
+
+    css_filepath.write_text("foo")
+    json_filepath.write_text("{}")
+
+    path, mtime, size = mixin.get_manifest_signature(
+        str(css_filepath), json_filepath=json_filepath
+    )
+    assert (path, size) == (str(css_filepath), 3)
+
+    path, mtime, size = mixin.get_manifest_signature(
+        str(css_filepath), json_filepath=json_filepath, development_mode=False
+    )
+    assert (path, size) == (str(json_filepath), 2)
+
+
+@pytest.mark.skipif(
+    django.VERSION < (4, 1), reason="Asynchronous views require Django>=4.1"
+)
+def test_async_view(monkeypatch, rf, tests_settings, tmp_path):
+    """
+    Async view should serve many concurrent requests from a single load then from
+    cache until manifest changes.
+    """
+    from py_css_styleguide.django import views
+
+    monkeypatch.setattr(views, "MANIFEST_REGISTRY", ManifestRegistry())
+
+    css_filepath = tmp_path / "manifest.css"
+    css_filepath.write_text(
+        (tests_settings.fixtures_path / "manifest_sample.css").read_text()
+    )
+
+    original = StyleguideMixin.get_manifest
+    calls = []
+
+    def counting_get_manifest(self, *args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(StyleguideMixin, "get_manifest", counting_get_manifest)
+
+    class SampleView(views.StyleguideAsyncViewMixin):
+        template_name = "skeleton.html"
+        manifest_css_filepath = str(css_filepath)
+        save_dump = False
+
+    view = SampleView.as_view()
+
+    async def request_many(count):
+        return await asyncio.gather(*[view(rf.get("/")) for i in range(count)])
+
+    responses = asyncio.run(request_many(30))
+
+    assert len(calls) == 1
+    assert all(item.status_code == 200 for item in responses)
+    manifest = responses[0].context_data["styleguide"]
+    assert isinstance(manifest, FrozenManifest)
+    assert all(item.context_data["styleguide"] is manifest for item in responses)
+    assert manifest.metas["references"] == (
+        "palette", "text_color", "spaces", "columns"
+    )
+    assert responses[0].template_name == ["skeleton.html"]
+
+    # Served from cache
+    responses = asyncio.run(request_many(5))
+    assert len(calls) == 1
+    assert responses[0].context_data["styleguide"] is manifest
+
+    # Manifest changes
+    css_filepath.write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"1\"; }\n"
+    )
+    responses = asyncio.run(request_many(5))
+    assert len(calls) == 2
+    assert responses[0].context_data["styleguide"].metas["references"] == ("version",)
+
+
+def test_async_view_django_version(monkeypatch):
+    """
+    Async view should refuse to be used with Django versions which do not support
+    asynchronous handlers on class based views.
+    """
+    from py_css_styleguide.django import views
+
+    monkeypatch.setattr(django, "VERSION", (4, 0, 0, "final", 0))
+
+    with pytest.raises(ImproperlyConfigured):
+        views.StyleguideAsyncViewMixin.as_view()
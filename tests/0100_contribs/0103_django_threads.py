@@ -0,0 +1,192 @@
+import threading
+import time
+
+import pytest
+
+from py_css_styleguide.django.mixin import StyleguideMixin
+from py_css_styleguide.exceptions import ParserErrors
+from py_css_styleguide.model import Manifest
+
+
+THREADS = 16
+
+
+def run_threads(target):
+    """
+    Start threads at the same moment with a barrier and return their results.
+    """
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+@pytest.fixture
+def counted_loads(monkeypatch):
+    """
+    Count manifest file loads and make them slow enough for concurrent threads to
+    wait for them.
+    """
+    calls = []
+    original = Manifest.load_file
+
+    def slow_load_file(self, *args, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Manifest, "load_file", slow_load_file)
+
+    return calls
+
+
+def test_threaded_single_flight(counted_loads, monkeypatch, tests_settings, tmp_path):
+    """
+    Concurrent threads loading the same manifest should make a single parse and a
+    single dump write.
+    """
+    css_filepath = str(tests_settings.fixtures_path / "manifest_sample.css")
+    json_filepath = tmp_path / "manifest.json"
+
+    writes = []
+    original_dump = Manifest.dump
+
+    def counting_dump(self, *args, **kwargs):
+        writes.append(threading.get_ident())
+        return original_dump(self, *args, **kwargs)
+
+    monkeypatch.setattr(Manifest, "dump", counting_dump)
+
+    mixin = StyleguideMixin()
+    results = run_threads(
+        lambda: mixin.get_manifest(css_filepath, json_filepath=json_filepath)
+    )
+
+    assert len(counted_loads) == 1
+    assert len(writes) == 1
+    assert json_filepath.exists() is True
+
+    # Every thread got its own manifest object with the same loaded references
+    assert len({id(item) for item in results}) == THREADS
+    for manifest in results:
+        assert manifest.status == "live"
+        assert manifest.loading_error is None
+        assert manifest.metas["references"] == [
+            "palette", "text_color", "spaces", "columns"
+        ]
+        assert manifest.palette == {"black": "#000000", "white": "#ffffff"}
+
+    # Rule attribute registries are not shared
+    results[0]._remove_rule("palette")
+    assert "palette" in results[1]._rule_attrs
+
+    # Neither are loaded values, so a request can not alter the other ones
+    assert len({id(item.palette) for item in results[1:]}) == THREADS - 1
+    assert len({id(item.metas) for item in results}) == THREADS
+    results[1].palette["black"] = "#111111"
+    results[1].metas["references"].append("nope")
+    for manifest in results[2:]:
+        assert manifest.palette["black"] == "#000000"
+        assert "nope" not in manifest.metas["references"]
+
+    # Once done, a new load parses again
+    mixin.get_manifest(css_filepath, json_filepath=json_filepath)
+    assert len(counted_loads) == 2
+
+
+def test_threaded_single_flight_error(counted_loads, tmp_path):
+    """
+    Every waiting thread should raise the error from the single failed parse.
+    """
+    css_filepath = tmp_path / "invalid.css"
+    css_filepath.write_text("nope")
+
+    mixin = StyleguideMixin()
+    results = run_threads(lambda: mixin.get_manifest(str(css_filepath)))
+
+    assert len(counted_loads) == 1
+    assert all(isinstance(item, ParserErrors) for item in results)
+
+
+def test_threaded_distinct_paths(counted_loads, tests_settings, tmp_path):
+    """
+    Loads for different manifests should not wait for each other.
+    """
+    paths = []
+    for i in range(2):
+        path = tmp_path / "manifest{}.css".format(i)
+        path.write_text(
+            (tests_settings.fixtures_path / "manifest_sample.css").read_text()
+        )
+        paths.append(str(path))
+
+    mixin = StyleguideMixin()
+    counter = iter(range(THREADS))
+    lock = threading.Lock()
+
+    def target():
+        with lock:
+            index = next(counter)
+        return mixin.get_manifest(paths[index % 2], save_dump=False)
+
+    results = run_threads(target)
+
+    assert len(counted_loads) == 2
+    assert all(item.status == "live" for item in results)
+
+
+def test_view_registry(counted_loads, rf, tests_settings, tmp_path):
+    """
+    Views for many styleguides should share a registry with its limits.
+    """
+    from py_css_styleguide.django.views import StyleguideViewMixin
+    from py_css_styleguide.model import FrozenManifest
+    from py_css_styleguide.registry import ManifestRegistry
+
+    registry = ManifestRegistry(max_entries=2)
+    sample = (tests_settings.fixtures_path / "manifest_sample.css").read_text()
+
+    views = {}
+    for name in ("brand1", "brand2", "brand3"):
+        path = tmp_path / "{}.css".format(name)
+        path.write_text(sample)
+
+        views[name] = type(name, (StyleguideViewMixin,), {
+            "template_name": "skeleton.html",
+            "manifest_css_filepath": str(path),
+            "save_dump": False,
+            "cache_manifest": True,
+            "manifest_registry": registry,
+            "manifest_key": name,
+        }).as_view()
+
+    def get_styleguide(name):
+        return views[name](rf.get("/")).context_data["styleguide"]
+
+    first = get_styleguide("brand1")
+    assert isinstance(first, FrozenManifest)
+    assert get_styleguide("brand1") is first
+    assert len(counted_loads) == 1
+
+    get_styleguide("brand2")
+    get_styleguide("brand3")
+    assert len(counted_loads) == 3
+    assert list(registry.entries) == ["brand2", "brand3"]
+
+    # Evicted styleguide is loaded again
+    assert get_styleguide("brand1") is not first
+    assert len(counted_loads) == 4
+    assert registry.stats()["evictions"] == 2
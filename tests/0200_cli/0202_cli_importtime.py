@@ -0,0 +1,82 @@
+import subprocess
+import sys
+
+import click
+
+from click.testing import CliRunner
+
+from py_css_styleguide.cli.entrypoint import LAZY_SUBCOMMANDS, cli_frontend
+
+
+# Maximum cumulative import time allowed for the CLI entrypoint module in
+# microseconds. It is a lot over the expected time (around 25ms) to not fail on slow
+# or busy systems but still catch a heavy dependency imported at module level.
+IMPORT_TIME_BUDGET = 250000
+
+# Modules that must not be imported just to start the CLI
+HEAVY_MODULES = [
+    "colorlog",
+    "tinycss2",
+    "py_css_styleguide.model",
+    "py_css_styleguide.parser",
+    "py_css_styleguide.serializer",
+    "py_css_styleguide.benchmark",
+    "py_css_styleguide.cli.bench",
+    "py_css_styleguide.cli.parse",
+    "py_css_styleguide.cli.serve",
+    "py_css_styleguide.cli.version",
+    "py_css_styleguide.daemon",
+]
+
+
+def get_import_times(module):
+    """
+    Import a module in a fresh interpreter with ``-X importtime`` and return
+    cumulative import time for each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_cli_importtime():
+    """
+    CLI entrypoint should not import commands or heavy dependencies and should stay
+    under its import time budget.
+    """
+    times = get_import_times("py_css_styleguide.cli.entrypoint")
+
+    assert [name for name in HEAVY_MODULES if name in times] == []
+
+    assert times["py_css_styleguide.cli.entrypoint"] < IMPORT_TIME_BUDGET
+
+
+def test_cli_lazy_commands():
+    """
+    Lazy commands should be listed and loaded when required.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(cli_frontend, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_SUBCOMMANDS.keys():
+        assert name in result.output
+
+    with click.Context(cli_frontend) as ctx:
+        assert cli_frontend.list_commands(ctx) == ["bench", "parse", "serve", "version"]
+        assert isinstance(cli_frontend.get_command(ctx, "parse"), click.Command)
+        assert cli_frontend.get_command(ctx, "nope") is None
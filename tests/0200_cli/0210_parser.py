@@ -109,3 +109,250 @@ def test_cli_parse_error(caplog, tmp_path, tests_settings, source, expected):
     assert isinstance(result.exception, SystemExit) is True
 
     assert caplog.record_tuples == expected
+
+
+def test_cli_parse_validate(caplog, tmp_path):
+    """
+    Validation mode should report every errors at once then abort.
+    """
+    runner = CliRunner()
+
+    source_filepath = tmp_path / "manifest_invalid.css"
+    source_filepath.write_text(
+        ".styleguide-metas-references {\n"
+        "    --names: \"palette nope\";\n"
+        "}\n"
+        ".styleguide-reference-palette {\n"
+        "    --structure: \"flat\";\n"
+        "    --keys: \"black white\";\n"
+        "    --font-color: \"red\";\n"
+        "    --values: \"#000000\";\n"
+        "}\n"
+    )
+
+    result = runner.invoke(
+        cli_frontend,
+        ["parse", str(source_filepath), "--validate"]
+    )
+
+    assert result.exit_code == 1
+
+    assert caplog.record_tuples == [
+        (
+            __pkgname__,
+            logging.CRITICAL,
+            "Manifest is invalid due to 3 error(s)",
+        ),
+        (
+            __pkgname__,
+            logging.ERROR,
+            (
+                "Line 7 - Column 5 : [StyleguideValidationError] Invalid variable "
+                "name 'font-color': it must only contains letters, numbers and '_' "
+                "character"
+            ),
+        ),
+        (
+            __pkgname__,
+            logging.ERROR,
+            (
+                "Line 8 - Column 5 : [SerializerError] Flat reference 'palette' has "
+                "different lengths for 'keys' (2) and 'values' (1) variables"
+            ),
+        ),
+        (
+            __pkgname__,
+            logging.ERROR,
+            (
+                "Line 1 - Column 1 : [SerializerError] Unable to find enabled "
+                "reference name 'nope'"
+            ),
+        ),
+    ]
+
+
+def test_cli_parse_validate_success(caplog, tests_settings):
+    """
+    Validation mode should succeed with a valid manifest.
+    """
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+
+    result = runner.invoke(
+        cli_frontend,
+        ["parse", str(source_filepath), "--validate"]
+    )
+
+    assert result.exit_code == 0
+
+    assert caplog.record_tuples == [
+        (__pkgname__, logging.INFO, "Manifest is valid"),
+    ]
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_cli_parse_profile(caplog, tmp_path, tests_settings):
+    """
+    Profile option should write profile statistics and log the most time consuming
+    functions from parser and serializer.
+    """
+    import pstats
+
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    json_filepath = tests_settings.fixtures_path / "manifest_sample.json"
+    destination_filepath = tmp_path / "manifest_sample.json"
+    profile_filepath = tmp_path / "parse.pstats"
+
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "parse",
+            str(source_filepath),
+            "--destination",
+            str(destination_filepath),
+            "--profile",
+            str(profile_filepath),
+            "--profile-top",
+            "3",
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert json_filepath.read_text() == destination_filepath.read_text()
+
+    functions = [key[2] for key in pstats.Stats(str(profile_filepath)).stats]
+    assert "consume" in functions
+    assert "serialize" in functions
+
+    assert caplog.record_tuples[0] == (
+        __pkgname__,
+        logging.INFO,
+        "Profile statistics written to: {}".format(profile_filepath),
+    )
+    hot_functions = [message for name, level, message in caplog.record_tuples[1:]]
+    assert len(hot_functions) == 3
+    # Parsing is the most time consuming step for this manifest
+    assert " : parser.parse (line " in hot_functions[0]
+    assert all(
+        " : parser." in message or " : serializer." in message
+        for message in hot_functions
+    )
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_cli_parse_stdin(caplog, tests_settings):
+    """
+    Source '-' should be read from standard input and compact option should output
+    JSON on a single line.
+    """
+    import json
+
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    json_filepath = tests_settings.fixtures_path / "manifest_sample.json"
+
+    result = runner.invoke(
+        cli_frontend,
+        ["--verbose", "5", "parse", "-", "--compact"],
+        input=source_filepath.read_text(),
+    )
+
+    assert result.exit_code == 0
+    assert caplog.record_tuples == [
+        (__pkgname__, logging.DEBUG, "Parsing: <stdin>"),
+    ]
+
+    assert len(result.stdout.splitlines()) == 1
+    assert json.loads(result.stdout) == json.loads(json_filepath.read_text())
+
+
+def test_cli_parse_stdin_error(caplog):
+    """
+    Errors from standard input source should be reported like with a file.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(cli_frontend, ["parse", "-"], input="wrong content")
+
+    assert result.exit_code == 1
+    assert caplog.record_tuples[0] == (
+        __pkgname__,
+        logging.CRITICAL,
+        "Unable to parse CSS due to 1 parsing error(s)",
+    )
+
+
+def test_cli_parse_indexed(caplog, tests_settings, tmp_path):
+    """
+    Option '--indexed' should write an indexed dump to destination.
+    """
+    from py_css_styleguide.packed import load_packed
+
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    destination = tmp_path / "manifest.idx"
+
+    result = runner.invoke(
+        cli_frontend,
+        ["parse", str(source_filepath), "--indexed", "--destination", str(destination)],
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == ""
+
+    manifest = load_packed(destination)
+    assert manifest.palette == {"black": "#000000", "white": "#ffffff"}
+
+    # Destination is required
+    result = runner.invoke(cli_frontend, ["parse", str(source_filepath), "--indexed"])
+
+    assert result.exit_code == 1
+    assert caplog.record_tuples[-1] == (
+        __pkgname__,
+        logging.CRITICAL,
+        "Option '--indexed' requires '--destination'",
+    )
+
+
+def test_cli_parse_json_options(tests_settings, tmp_path):
+    """
+    JSON options should be used both for standard output and destination file.
+    """
+    import json
+
+    from py_css_styleguide.model import Manifest
+
+    runner = CliRunner()
+
+    source_filepath = tmp_path / "manifest.css"
+    source_filepath.write_text(
+        '.styleguide-metas-references{--names: "zeta alpha";}\n'
+        '.styleguide-reference-zeta{--structure: "string"; --value: "é";}\n'
+        '.styleguide-reference-alpha{--structure: "string"; --value: "a";}\n',
+        encoding="utf-8",
+    )
+    destination = tmp_path / "manifest.json"
+
+    options = ["--compact", "--sort-keys", "--no-ascii"]
+    result = runner.invoke(cli_frontend, ["parse", str(source_filepath)] + options)
+    assert result.exit_code == 0
+
+    output = result.stdout.strip()
+    assert output.startswith('{"alpha":"a","metas":{')
+    assert output.endswith(',"zeta":"é"}')
+
+    result = runner.invoke(
+        cli_frontend,
+        ["parse", str(source_filepath), "--destination", str(destination)] + options,
+    )
+    assert result.exit_code == 0
+    assert destination.read_text(encoding="utf-8") == output
+
+    manifest = Manifest()
+    manifest.from_dict(json.loads(output))
+    assert manifest.zeta == "é"
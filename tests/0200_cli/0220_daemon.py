@@ -0,0 +1,309 @@
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+import threading
+
+import pytest
+
+from click.testing import CliRunner
+
+from freezegun import freeze_time
+
+from py_css_styleguide import __pkgname__
+from py_css_styleguide.cli.entrypoint import cli_frontend
+from py_css_styleguide.daemon import (
+    DEFAULT_SOCKET_NAME,
+    ManifestServer,
+    get_default_socket_path,
+    is_daemon_running,
+    request_manifest,
+)
+from py_css_styleguide.exceptions import DaemonUnavailableError
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """
+    Run a daemon server in a thread and return its socket path.
+    """
+    socket_path = str(tmp_path / "daemon.sock")
+    server = ManifestServer(socket_path)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_daemon_request(daemon, tmp_path):
+    """
+    Daemon should parse requested source and cache response until source changes.
+    """
+    source = tmp_path / "manifest.css"
+    source.write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"1\"; }\n"
+    )
+
+    response = request_manifest(str(source), socket_path=daemon.server_address)
+    assert response["status"] == "success"
+    assert response["manifest"]["version"] == "1"
+
+    cached = daemon.cache[str(source)]
+    response = request_manifest(str(source), socket_path=daemon.server_address)
+    assert daemon.cache[str(source)] is cached
+
+    source.write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"42\"; }\n"
+    )
+    response = request_manifest(str(source), socket_path=daemon.server_address)
+    assert response["manifest"]["version"] == "42"
+
+
+def test_daemon_request_errors(daemon, tmp_path):
+    """
+    Daemon should respond with error payload for invalid or missing sources.
+    """
+    source = tmp_path / "manifest.css"
+    source.write_text("nope")
+
+    response = request_manifest(str(source), socket_path=daemon.server_address)
+    assert response == {
+        "status": "error",
+        "message": "Unable to parse CSS due to 1 parsing error(s)",
+        "errors": [
+            (
+                "Line 1 - Column 1 : [invalid] EOF reached before {} block for a "
+                "qualified rule."
+            )
+        ],
+    }
+
+    missing = tmp_path / "nope.css"
+    response = request_manifest(str(missing), socket_path=daemon.server_address)
+    assert response["status"] == "error"
+    assert response["message"] == "Unable to find CSS manifest from: {}".format(
+        missing
+    )
+
+    response = request_manifest(str(tmp_path), socket_path=daemon.server_address)
+    assert response["status"] == "error"
+    assert response["message"].startswith(
+        "Unable to read CSS manifest from: {}: ".format(tmp_path)
+    )
+
+    undecodable = tmp_path / "undecodable.css"
+    undecodable.write_bytes(b"\xff\xfe\xfa")
+    response = request_manifest(
+        str(undecodable), socket_path=daemon.server_address
+    )
+    assert response["status"] == "error"
+    assert response["message"].startswith(
+        "Unable to read CSS manifest from: {}: ".format(undecodable)
+    )
+
+
+def test_daemon_running(daemon, tmp_path):
+    """
+    Running check should only succeed on a listening socket.
+    """
+    assert is_daemon_running(socket_path=daemon.server_address) is True
+    assert is_daemon_running(socket_path=str(tmp_path / "nope.sock")) is False
+
+    # Server is still serving after the check
+    source = tmp_path / "manifest.css"
+    source.write_text(
+        ".styleguide-metas-references { --names: \"version\"; }\n"
+        ".styleguide-reference-version { --structure: \"string\"; --value: \"1\"; }\n"
+    )
+    response = request_manifest(str(source), socket_path=daemon.server_address)
+    assert response["status"] == "success"
+
+
+def test_daemon_socket_permissions(daemon):
+    """
+    Socket should only be accessible to the current user.
+    """
+    mode = os.stat(daemon.server_address).st_mode
+    assert stat.S_ISSOCK(mode) is True
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_default_socket_path_runtime(monkeypatch, tmp_path):
+    """
+    Default socket should be in the user runtime directory when there is one.
+    """
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    assert get_default_socket_path() == str(tmp_path / DEFAULT_SOCKET_NAME)
+
+
+def test_default_socket_path_private(monkeypatch, tmp_path):
+    """
+    Without runtime directory, default socket should be in a directory only
+    accessible to the current user and an unsafe directory should be refused.
+    """
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    directory = tmp_path / "py-css-styleguide-{}".format(os.getuid())
+
+    assert get_default_socket_path() == str(directory / DEFAULT_SOCKET_NAME)
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+    # Directory already exists
+    assert get_default_socket_path() == str(directory / DEFAULT_SOCKET_NAME)
+
+    directory.chmod(0o777)
+    with pytest.raises(DaemonUnavailableError):
+        get_default_socket_path()
+    assert is_daemon_running() is False
+
+    directory.rmdir()
+    directory.write_text("nope")
+    with pytest.raises(DaemonUnavailableError):
+        get_default_socket_path()
+
+
+def test_daemon_unavailable(tmp_path):
+    """
+    Client should raise a specific exception when there is no running daemon.
+    """
+    with pytest.raises(DaemonUnavailableError):
+        request_manifest("foo.css", socket_path=str(tmp_path / "nope.sock"))
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_cli_parse_daemon(caplog, daemon, monkeypatch, tmp_path, tests_settings):
+    """
+    Parse command should use daemon when available and output the same JSON than
+    with local parsing, streamed to destination.
+    """
+    from py_css_styleguide.model import Manifest
+
+    def to_json(self, *args, **kwargs):
+        raise AssertionError("JSON should not be built whole")
+
+    monkeypatch.setattr(Manifest, "to_json", to_json)
+
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    json_filepath = tests_settings.fixtures_path / "manifest_sample.json"
+    destination_filepath = tmp_path / "manifest_sample.json"
+
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "parse",
+            str(source_filepath),
+            "--socket",
+            daemon.server_address,
+            "--destination",
+            str(destination_filepath),
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert json_filepath.read_text() == destination_filepath.read_text()
+    assert str(source_filepath) in daemon.cache
+
+
+@freeze_time("2012-10-15 10:00:00")
+def test_cli_parse_daemon_fallback(caplog, tmp_path, tests_settings):
+    """
+    Parse command should parse locally when daemon is not available.
+    """
+    runner = CliRunner()
+
+    source_filepath = tests_settings.fixtures_path / "manifest_sample.css"
+    json_filepath = tests_settings.fixtures_path / "manifest_sample.json"
+    socket_path = tmp_path / "nope.sock"
+
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "--verbose", "5",
+            "parse",
+            str(source_filepath),
+            "--socket",
+            str(socket_path),
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == json.loads(json_filepath.read_text())
+    assert caplog.record_tuples[1] == (
+        __pkgname__,
+        logging.DEBUG,
+        (
+            "Daemon is not available, parsing locally: Unable to connect to daemon "
+            "from '{}': [Errno 2] No such file or directory"
+        ).format(socket_path),
+    )
+
+
+def test_cli_serve_running(caplog, daemon, tmp_path):
+    """
+    Serve command should abort without to touch the socket of a running daemon.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli_frontend, ["serve", "--socket", daemon.server_address]
+    )
+
+    assert result.exit_code == 1
+    assert caplog.record_tuples == [
+        (
+            __pkgname__,
+            logging.CRITICAL,
+            "A daemon is already running on: {}".format(daemon.server_address),
+        ),
+    ]
+    assert is_daemon_running(socket_path=daemon.server_address) is True
+
+
+def test_cli_serve_stale_socket(caplog, monkeypatch, tmp_path):
+    """
+    Serve command should replace a stale socket file and remove its socket when
+    stopping.
+    """
+    runner = CliRunner()
+
+    # A bound socket which is not listening anymore leaves a stale file
+    socket_path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    assert os.path.exists(socket_path)
+
+    served = []
+
+    def serve_forever(server, *args, **kwargs):
+        served.append(is_daemon_running(socket_path=server.server_address))
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(ManifestServer, "serve_forever", serve_forever)
+
+    sigterm = signal.getsignal(signal.SIGTERM)
+    try:
+        result = runner.invoke(cli_frontend, ["serve", "--socket", socket_path])
+    finally:
+        signal.signal(signal.SIGTERM, sigterm)
+
+    assert result.exit_code == 0
+    assert served == [True]
+    assert os.path.exists(socket_path) is False
+    assert caplog.record_tuples == [
+        (__pkgname__, logging.INFO, "Listening on: {}".format(socket_path)),
+        (__pkgname__, logging.INFO, "Stopping daemon"),
+    ]
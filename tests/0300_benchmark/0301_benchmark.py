@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from click.testing import CliRunner
+
+from py_css_styleguide.benchmark import (
+    PHASES, STRUCTURES, build_manifest, get_phase_runners, percentile,
+    run_benchmark
+)
+from py_css_styleguide.cli.bench import BENCHMARK_STRUCTURES
+from py_css_styleguide.cli.entrypoint import cli_frontend
+from py_css_styleguide.model import Manifest
+
+
+@pytest.mark.parametrize("compiler", ["libsass", "dartsass"])
+def test_build_manifest(compiler):
+    """
+    Synthetic manifest should be valid for every structures and compilers.
+    """
+    manifest = Manifest()
+    manifest.load(build_manifest(references=14, length=3, compiler=compiler))
+
+    assert manifest.metas["compiler_support"] == compiler
+    assert len(manifest._rule_attrs) == 14
+
+    # References cycle over structures
+    assert manifest.ref0 == {
+        "ref0_0": "#000000",
+        "ref0_1": "#000001",
+        "ref0_2": "#000002",
+    }
+    assert manifest.ref1 == ["ref1_0", "ref1_1", "ref1_2"]
+    assert manifest.ref2 == "aaa"
+    assert manifest.ref3 == 999
+    assert manifest.ref4["ref4_1"] == {"color": "#000001", "selector": ".ref4_1"}
+    assert manifest.ref5["ref5_1"] == {"color": "#000001", "selector": ".ref5_1"}
+    assert manifest.ref6 == ["#000000", "#000001", "#000002"]
+    assert list(manifest.ref7.values()) == ["#000000", "#000001", "#000002"]
+
+
+def test_build_manifest_structures():
+    """
+    Only given structures should be used.
+    """
+    manifest = Manifest()
+    manifest.load(build_manifest(references=2, structures=["string"], length=2))
+
+    assert manifest.to_dict()["ref0"] == "aa"
+    assert manifest.to_dict()["ref1"] == "aa"
+
+
+@pytest.mark.parametrize("values, percent, expected", [
+    ([1], 50, 1),
+    ([1, 2, 3, 4], 50, 2),
+    ([1, 2, 3, 4], 90, 4),
+    (list(range(1, 101)), 99, 99),
+    (list(range(1, 101)), 100, 100),
+])
+def test_percentile(values, percent, expected):
+    """
+    Percentile should use the nearest rank method.
+    """
+    assert percentile(values, percent) == expected
+
+
+def test_run_benchmark():
+    """
+    Benchmark should report every phases with their measurements.
+    """
+    report = run_benchmark(references=3, length=2, iterations=2, warmup=0)
+
+    assert report["options"]["references"] == 3
+    assert report["source_size"] > 0
+    assert list(report["phases"].keys()) == list(PHASES)
+
+    for name, phase in report["phases"].items():
+        assert list(phase.keys()) == [
+            "min", "mean", "max", "p50", "p90", "p99", "runs_per_second",
+            "references_per_second", "peak_memory",
+        ]
+        assert phase["min"] <= phase["p50"] <= phase["max"]
+        assert phase["peak_memory"] > 0
+
+
+@pytest.mark.parametrize("compiler", ["libsass", "dartsass"])
+def test_run_benchmark_long_values(compiler):
+    """
+    Benchmark should not truncate values over the default evaluation limit, so
+    both compilers serialize the same values.
+    """
+    source = build_manifest(
+        references=2, structures=["object-list", "object-complex"], length=200,
+        compiler=compiler,
+    )
+
+    for name, (func, setup) in get_phase_runners(source).items():
+        func(*setup())
+
+    func, setup = get_phase_runners(source)["serialize"]
+    manifest = func(*setup())
+
+    assert len(manifest["ref0"]) == 200
+    assert manifest["ref0"]["ref0_199"] == {
+        "color": "#0000c7",
+        "selector": ".ref0_199",
+    }
+    assert len(manifest["ref1"]) == 200
+
+
+def test_cli_bench(tmp_path):
+    """
+    Bench command should output JSON report to standard output or a file.
+    """
+    runner = CliRunner()
+
+    args = ["bench", "--references", "2", "--iterations", "1", "--warmup", "0",
+            "--structure", "list", "--compiler", "dartsass"]
+
+    result = runner.invoke(cli_frontend, args)
+    assert result.exit_code == 0
+
+    report = json.loads(result.stdout)
+    assert report["options"]["structures"] == ["list"]
+    assert report["options"]["compiler"] == "dartsass"
+
+    destination = tmp_path / "bench.json"
+    result = runner.invoke(cli_frontend, args + ["--destination", str(destination)])
+    assert result.exit_code == 0
+    assert result.stdout == ""
+    assert json.loads(destination.read_text())["options"]["references"] == 2
+
+
+def test_cli_bench_structures():
+    """
+    Command structure choices should be the same than benchmark ones.
+    """
+    assert BENCHMARK_STRUCTURES == STRUCTURES